@@ -1,17 +1,15 @@
 
 import pandas as pd
-import json
 
-with open("tidy_product.json_mk1", "r") as f:
-    mk1_data = json.load(f)
+from product_extractor import load_tidy, rating_stat
 
-with open("tidy_product.json_sf6", "r") as f:
-    sf6_data = json.load(f)
+mk1_data = load_tidy("tidy_product.json_mk1")
+sf6_data = load_tidy("tidy_product.json_SF6")
 
 def build_comparison_row(data):
     """Builds a comparison row for the DataFrame based on the tidy JSON data."""
-    r7 = data.get("rating_7_days", {}).get("RatingCount", 0)
-    r30 = data.get("rating_30_days", {}).get("RatingCount", 0)
+    r7 = rating_stat(data, "rating_7_days", "RatingCount", 0)
+    r30 = rating_stat(data, "rating_30_days", "RatingCount", 0)
     
     # Calculations 
     momentum = (r7 / r30 * 100) if r30 > 0 else 0
@@ -24,9 +22,9 @@ def build_comparison_row(data):
         "30-Day Rating Count": r30,
         "Discovery Momentum (%)": round(momentum, 2),
         "Velocity (Ratings/Day)": round(velocity, 2),
-        "All-Time Rating": data.get("rating_all_time", {}).get("AverageRating"),
-        "Recent Rating (7d)": data.get("rating_7_days", {}).get("AverageRating"),
-        "Recent Rating (30d)": data.get("rating_30_days", {}).get("AverageRating"),
+        "All-Time Rating": rating_stat(data, "rating_all_time", "AverageRating"),
+        "Recent Rating (7d)": rating_stat(data, "rating_7_days", "AverageRating"),
+        "Recent Rating (30d)": rating_stat(data, "rating_30_days", "AverageRating"),
     }
 
 # 2. Create the DataFrame
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+
+from group_aggregates import GroupAggregator
+
+# ============================================================================
+# CONDITIONED BASELINES: HOW A GAME COMPARES TO ITS PEERS
+# ============================================================================
+
+BASELINE_METRICS = ['momentum', 'discovery_capture', 'quality_retention']
+
+# Baseline name -> conditioning keys
+DEFAULT_KEY_SETS = {
+    'genre': ['Genre'],
+    'conditioned': ['Genre', 'ESRB'],
+}
+
+# MAD * 1.4826 estimates the standard deviation of normally distributed data
+MAD_SCALE = 1.4826
+
+
+def _named(key_sets):
+    """{name: keys} from a dict, or from a list of key lists named by their joined keys."""
+    if isinstance(key_sets, dict):
+        return {name: [keys] if isinstance(keys, str) else list(keys) for name, keys in key_sets.items()}
+    named = {}
+    for keys in key_sets:
+        keys = [keys] if isinstance(keys, str) else list(keys)
+        named['_'.join(keys)] = keys
+    return named
+
+
+class BaselineEngine:
+    """Per-row peer medians, MADs and standard deviations for several conditioning key sets.
+
+    All keys of all key sets are factorized once into one GroupAggregator,
+    and every key set is a roll-up of its cells. Per metric, values are
+    sorted once for the medians of every key set. Group statistics are
+    broadcast back to rows by their integer group ids, so no
+    groupby().transform() runs.
+    """
+
+    def __init__(self, df, key_sets=DEFAULT_KEY_SETS):
+        self.df = df
+        self.key_sets = _named(key_sets)
+        keys = list(dict.fromkeys(k for keys in self.key_sets.values() for k in keys))
+        self.engine = GroupAggregator(df, keys)
+
+    def stats(self, name, metric):
+        """(median, MAD, std) of `metric` within each row's `name` group, as arrays."""
+        keys = self.key_sets[name]
+        return (
+            self.engine.transform(keys, metric, 'median'),
+            self.engine.transform(keys, metric, 'mad'),
+            self.engine.transform(keys, metric, 'std'),
+        )
+
+    def baselines(self, metrics=BASELINE_METRICS):
+        """Frame (aligned with df) of baseline, lift and z-score columns per key set and metric.
+
+        For key set `name` and metric `m`: `{name}_median_{m}`, `{name}_mad_{m}`,
+        `{name}_std_{m}`, `lift_vs_{name}_{m}` (value minus peer median) and
+        `robust_z_{name}_{m}` (lift over the scaled MAD; NaN when the MAD is 0).
+        """
+        columns = {}
+        for metric in metrics:
+            x = pd.to_numeric(self.df[metric], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            for name in self.key_sets:
+                median, mad, std = self.stats(name, metric)
+                lift = x - median
+                columns[f'{name}_median_{metric}'] = median
+                columns[f'{name}_mad_{metric}'] = mad
+                columns[f'{name}_std_{metric}'] = std
+                columns[f'lift_vs_{name}_{metric}'] = lift
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    columns[f'robust_z_{name}_{metric}'] = np.where(mad > 0, lift / (MAD_SCALE * mad), np.nan)
+        return pd.DataFrame(columns, index=self.df.index)
+
+
+def add_baselines(df, metrics=BASELINE_METRICS, key_sets=DEFAULT_KEY_SETS):
+    """Add BaselineEngine.baselines() columns to `df` in place and return it."""
+    out = BaselineEngine(df, key_sets).baselines(metrics)
+    df[out.columns] = out
+    return df
+
+
+def add_comprehensive_baselines(df, metrics=BASELINE_METRICS, esrb='ESRB'):
+    """The cleaning notebook's baseline columns, from one BaselineEngine.
+
+    Adds `genre_median_{m}`, `conditioned_median_{m}` (Genre + `esrb`),
+    `lift_vs_niche_{m}` and `zscore_{m}` (lift over the conditioned std) as
+    before, plus `robust_z_{m}` (lift over the conditioned scaled MAD).
+    """
+    engine = BaselineEngine(df, {'genre': ['Genre'], 'conditioned': ['Genre', esrb]})
+    for metric in metrics:
+        x = pd.to_numeric(df[metric], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        genre_median = engine.engine.transform(['Genre'], metric, 'median')
+        median, mad, std = engine.stats('conditioned', metric)
+        lift = x - median
+        df[f'genre_median_{metric}'] = genre_median
+        df[f'conditioned_median_{metric}'] = median
+        df[f'lift_vs_niche_{metric}'] = lift
+        with np.errstate(invalid='ignore', divide='ignore'):
+            df[f'zscore_{metric}'] = lift / std
+            df[f'robust_z_{metric}'] = np.where(mad > 0, lift / (MAD_SCALE * mad), np.nan)
+    return df
@@ -0,0 +1,69 @@
+import argparse
+import gc
+import random
+import time
+
+from prepare_data import _frame_from_columns, _frame_from_rows
+
+# ============================================================================
+# BENCHMARK: PER-GAME DICT LOOP VS COLUMNAR EXTRACTION
+# ============================================================================
+
+def make_synthetic_games(n, seed=0):
+    """Generate `n` raw game records shaped like the Xbox API dump."""
+    rng = random.Random(seed)
+    games = []
+
+    for i in range(n):
+        r_all = rng.randint(0, 20_000)
+        r30 = rng.randint(0, min(r_all, 2_000))
+        r7 = rng.randint(0, r30)
+        games.append({
+            "product_id": f"9P{i:010d}",
+            "title": f"Synthetic Game {i}",
+            "publisher": f"Publisher {i % 250}",
+            "developer": f"Studio {i % 900}",
+            "short_description": "",
+            "release_date": "2024-05-01T00:00:00.0000000Z",
+            "rating_7_days": {"AggregateTimeSpan": "7Days", "AverageRating": round(rng.uniform(1, 5), 1), "PlayCount": 0, "RatingCount": r7},
+            "rating_30_days": {"AggregateTimeSpan": "30Days", "AverageRating": round(rng.uniform(1, 5), 1), "PlayCount": 0, "RatingCount": r30},
+            "rating_all_time": {"AggregateTimeSpan": "AllTime", "AverageRating": round(rng.uniform(1, 5), 1), "PlayCount": 0, "RatingCount": r_all},
+            "has_gamepass_remediation": rng.random() < 0.3,
+            "prices": [{"list_price": 0.0}] * rng.randint(0, 2) + [{"list_price": rng.choice([0.0, 9.99, 29.99, 69.99])}],
+        })
+
+    return games
+
+
+def time_it(fn, games, repeat):
+    """Best-of-`repeat` wall time for building a frame from `games`."""
+    best = float('inf')
+    gc.collect()
+    gc.disable()  # same as timeit: keep collector pauses out of the numbers
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn(games)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the row-wise and columnar game flattening paths.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("PREPARE_DATA FLATTENING BENCHMARK")
+    print("=" * 80)
+    print(f"{'games':>10} {'dict loop (s)':>15} {'columnar (s)':>15} {'speedup':>10}")
+
+    for n in args.sizes:
+        games = make_synthetic_games(n)
+        rows_s = time_it(_frame_from_rows, games, args.repeat)
+        cols_s = time_it(_frame_from_columns, games, args.repeat)
+        print(f"{n:>10,} {rows_s:>15.3f} {cols_s:>15.3f} {rows_s / cols_s:>9.1f}x")
+        del games
@@ -0,0 +1,185 @@
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import repeat
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from http_cache import CACHE_PATH, CatalogCache
+from product_extractor import tidy_products
+
+# ============================================================================
+# BATCHED DISPLAYCATALOG CLIENT
+# ============================================================================
+
+CATALOG_URL = "https://displaycatalog.mp.microsoft.com/v7.0/products"
+
+
+def batched(ids, size):
+    """Split `ids` into lists of at most `size`."""
+    ids = list(ids)
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
+
+
+class CatalogClient:
+    """Fetch displaycatalog products many bigIds per request over pooled sessions.
+
+    Each worker thread keeps its own keep-alive `requests.Session`. Its
+    adapter retries 429 and 5xx responses with exponential backoff and honours
+    Retry-After, so a full catalog pull is a handful of concurrent batched
+    requests rather than one fresh connection per game.
+
+    With a `cache` (an http_cache.CatalogCache), fresh entries are served from
+    disk without a request. Stale and unseen ids are fetched together in the
+    same batches as an uncached run, so the cache never adds requests. A
+    batch asked for before is sent with that response's If-None-Match /
+    If-Modified-Since; a 304 resets the TTL of every id in it without a body,
+    and refetched products whose content hash is unchanged only have their
+    TTL reset. If a batch fails, its stale ids are served from the cache.
+    """
+
+    def __init__(self, base_url=CATALOG_URL, market="US", language="en-US", batch_size=20,
+                 workers=4, timeout=20, retries=5, backoff=0.5, cache=None):
+        self.base_url = base_url
+        self.market = market
+        self.language = language
+        self.batch_size = batch_size
+        self.workers = workers
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = cache
+        self._local = threading.local()
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            retry = Retry(
+                total=self.retries,
+                backoff_factor=self.backoff,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=("GET",),
+                respect_retry_after_header=True,
+            )
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retry)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._local.session = session
+        return session
+
+    def _get(self, big_ids, headers=None):
+        params = {"bigIds": ",".join(big_ids), "market": self.market, "languages": self.language}
+        r = self._session().get(self.base_url, params=params, headers=headers, timeout=self.timeout)
+        r.raise_for_status()
+        return r
+
+    def fetch_batch(self, big_ids, cached=None):
+        """Raw `Products` for one comma-joined bigIds request.
+
+        With a cache, the products are stored along with the response's
+        validators. `cached` ({big_id: CacheEntry}, from `lookup`) makes the
+        request conditional when the last response to this batch is still
+        cached in full, and lets unchanged products skip the rewrite.
+        """
+        cached = cached or {}
+        validators = headers = None
+        if self.cache is not None:
+            validators = self.cache.validators(big_ids, self.market, self.language)
+            if validators and all(i in cached for i in validators.product_ids):
+                headers = {k: v for k, v in (("If-None-Match", validators.etag),
+                                             ("If-Modified-Since", validators.last_modified)) if v}
+
+        r = self._get(big_ids, headers)
+        if r.status_code == 304:
+            self.cache.not_modified(validators.product_ids, self.market, self.language)
+            return [cached[i].product for i in validators.product_ids]
+
+        products = r.json().get("Products", [])
+        if self.cache is not None:
+            known = {i: cached[i].content_hash for i in big_ids if i in cached}
+            self.cache.store(products, self.market, self.language, known, batch=big_ids,
+                             etag=r.headers.get("ETag"), last_modified=r.headers.get("Last-Modified"))
+        return products
+
+    def fetch_products(self, big_ids):
+        """Raw products for every id (in input order), fetched in concurrent batches of `batch_size`."""
+        big_ids = list(dict.fromkeys(big_ids))
+        cached = self.cache.lookup(big_ids, self.market, self.language) if self.cache is not None else {}
+        by_id = {i: e.product for i, e in cached.items() if e.fresh}
+        batches = batched([i for i in big_ids if i not in by_id], self.batch_size)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for batch, result in zip(batches, pool.map(self._fetch_or_skip, batches, repeat(cached))):
+                if result is None:
+                    # Failed batch: fall back to whatever the cache had for it
+                    by_id.update((i, cached[i].product) for i in batch if i in cached)
+                else:
+                    by_id.update((p.get("ProductId"), p) for p in result)
+
+        return [by_id[i] for i in big_ids if i in by_id]
+
+    def _fetch_or_skip(self, batch, cached):
+        try:
+            return self.fetch_batch(batch, cached)
+        except requests.RequestException as e:
+            stale = sum(i in cached for i in batch)
+            print(f"Warning: batch of {len(batch)} ids failed ({batch[0]}...), "
+                  f"serving {stale} cached copies: {e}")
+            return None
+
+
+def build_raw_dump(big_ids, output_file, client=None):
+    """Fetch `big_ids` and write the tidy JSON array prepare_games_dataset reads."""
+    client = client or CatalogClient()
+    games = tidy_products(client.fetch_products(big_ids))
+
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(games, f, ensure_ascii=False)
+
+    print(f"✓ Saved {len(games)} products to {output_file}")
+    return output_file
+
+
+def load_product_ids(csv_file="xbox_with_ids.csv"):
+    """ProductIDs from the scraper output, skipping unresolved rows."""
+    df = pd.read_csv(csv_file, dtype=str)
+    ids = df["ProductID"].dropna().str.strip().str.upper()
+    return ids[ids.str.fullmatch(r"[A-Z0-9]{12}")].drop_duplicates().tolist()
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pull displaycatalog products for every resolved ProductID.")
+    parser.add_argument("--ids", default="xbox_with_ids.csv", help="CSV with a ProductID column")
+    parser.add_argument("--output", default=f"xbox_data_{datetime.now():%Y%m%d_%H%M}.json")
+    parser.add_argument("--base-url", default=CATALOG_URL)
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--cache", default=CACHE_PATH, help="On-disk response cache")
+    parser.add_argument("--ttl-hours", type=float, default=6, help="Serve cached products younger than this without asking")
+    parser.add_argument("--no-cache", action="store_true", help="Always download full bodies")
+    args = parser.parse_args()
+
+    big_ids = load_product_ids(args.ids)
+    print(f"→ Fetching {len(big_ids)} products in batches of {args.batch_size}")
+
+    start = time.perf_counter()
+    cache = None if args.no_cache else CatalogCache(args.cache, ttl=args.ttl_hours * 3600)
+    try:
+        client = CatalogClient(args.base_url, batch_size=args.batch_size, workers=args.workers, cache=cache)
+        build_raw_dump(big_ids, args.output, client)
+    finally:
+        if cache is not None:
+            print(f"→ Cache: {cache.stats()}")
+            cache.close()
+    print(f"✓ Done in {time.perf_counter() - start:.1f}s")
@@ -1,10 +1,16 @@
+import argparse
 import pandas as pd
 import json
+import time
 import numpy as np
 from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 import seaborn as sns
-from prepare_data import prepare_games_dataset
+from prepare_data import MERGED_DATASET, prepare_games_dataset, load_dataset
+from group_aggregates import GroupAggregator
+from date_normalize import normalize_dates
+from plot_sampling import MAX_POINTS
+from report_columns import flatten_columns, report_renames
 
 
 
@@ -17,50 +23,49 @@ def load_game_data(file_path):
     with open(file_path, 'r') as f:
         return json.load(f)
 
-def calculate_game_metrics(df):
-    """Add calculated metric columns directly to DataFrame."""
-    # Get rating counts
-    r7 = pd.to_numeric(df["rating_7_days_count"], errors='coerce').fillna(0)
-    r30 = pd.to_numeric(df["rating_30_days_count"], errors='coerce').fillna(0)
-    r_all = pd.to_numeric(df["rating_alltime_count"], errors='coerce').fillna(0)
+# Inputs calculate_game_metrics reads, and the columns it writes
+METRIC_INPUTS = ['rating_7_days_count', 'rating_30_days_count', 'rating_alltime_count',
+                 'rating_7_days_avg', 'rating_30_days_avg', 'rating_alltime_avg', 'Release', 'Added']
+RATING_METRICS = ['momentum', 'discovery_capture', 'quality_retention', 'rating_trend_7d_vs_alltime']
+DAY_METRICS = ['days_since_release', 'days_since_gp_add', 'is_day_one_gp']
+
+def add_rating_metrics(df):
+    """Add the rating-derived metric columns (they only change when ratings do)."""
+    # Get rating counts (as float64 so nullable Int32 counts don't make the metrics nullable too)
+    r7 = pd.to_numeric(df["rating_7_days_count"], errors='coerce').astype('float64').fillna(0)
+    r30 = pd.to_numeric(df["rating_30_days_count"], errors='coerce').astype('float64').fillna(0)
+    r_all = pd.to_numeric(df["rating_alltime_count"], errors='coerce').astype('float64').fillna(0)
     
     # Get ratings
     rating_7d = pd.to_numeric(df["rating_7_days_avg"], errors='coerce').fillna(0)
     rating_30d = pd.to_numeric(df["rating_30_days_avg"], errors='coerce').fillna(0)
     rating_all = pd.to_numeric(df["rating_alltime_avg"], errors='coerce').fillna(0)
 
-    
-    # Parse dates
-    release_date = pd.to_datetime(df["Release"], errors='coerce')
-    gamepass_date = pd.to_datetime(df["Added"], errors='coerce')
-
-    # Normalize timezones: make sure datetimes are tz-naive so subtraction works
-    # If series are timezone-aware, convert to naive by removing tz info.
-    try:
-        if getattr(release_date.dt, 'tz', None) is not None:
-            release_date = release_date.dt.tz_convert(None)
-    except Exception:
-        # fallback: attempt elementwise removal
-        release_date = release_date.apply(lambda x: x.tz_convert(None) if getattr(x, 'tzinfo', None) is not None else x)
-
-    try:
-        if getattr(gamepass_date.dt, 'tz', None) is not None:
-            gamepass_date = gamepass_date.dt.tz_convert(None)
-    except Exception:
-        gamepass_date = gamepass_date.apply(lambda x: x.tz_convert(None) if getattr(x, 'tzinfo', None) is not None else x)
-    
-    # Calculate time deltas using a tz-naive 'now'
-    now = pd.Timestamp.now()
-    df['days_since_release'] = (now - release_date).dt.days
-    df['days_since_gp_add'] = (now - gamepass_date).dt.days
-    
     # Calculate metrics
     df['momentum'] = ((r7 / r30 * 100).fillna(0)).round(2)
     df['discovery_capture'] = ((r7 / r_all * 100).fillna(0)).round(2)
     df['quality_retention'] = (rating_30d - rating_all).round(3)
     df['rating_trend_7d_vs_alltime'] = (rating_7d - rating_all).round(3)
-    df['is_day_one_gp'] = (df['days_since_gp_add'] <= 1) & (gamepass_date.notna())
+    return df
+
+def add_day_metrics(df, now=None):
+    """Add the day counts relative to `now`; cheap to re-apply every run."""
+    # Parse dates once (UTC-naive) and keep them on the frame for later stages
+    normalize_dates(df, ('Release', 'Added'))
+    release_date = df["Release"]
+    gamepass_date = df["Added"]
     
+    # Calculate time deltas using a tz-naive 'now'
+    now = pd.Timestamp.now() if now is None else now
+    df['days_since_release'] = (now - release_date).dt.days
+    df['days_since_gp_add'] = (now - gamepass_date).dt.days
+    df['is_day_one_gp'] = (df['days_since_gp_add'] <= 1) & (gamepass_date.notna())
+    return df
+
+def calculate_game_metrics(df):
+    """Add calculated metric columns directly to DataFrame."""
+    add_day_metrics(df)
+    add_rating_metrics(df)
     return df
 
 
@@ -80,13 +85,80 @@ def build_aggregated_dataframe(tidy_json_files):
     df = pd.DataFrame(all_rows)
     return df
 
+# ============================================================================
+# SHARED AGGREGATION
+# ============================================================================
+
+# Finest grouping every report rolls up from
+REPORT_KEYS = ['Genre', 'publisher', 'has_gamepass_remediation']
+
+def build_report_engine(df):
+    """Factorize the report keys once so all four groupby reports share one scan."""
+    return GroupAggregator(df, REPORT_KEYS)
+
+def _aggregate(df, by, spec, engine=None):
+    """`df.groupby(by).agg(spec)`, answered from `engine` when one is given."""
+    if engine is None:
+        engine = GroupAggregator(df, [by] if isinstance(by, str) else by)
+    return engine.agg(by, spec)
+
+# ============================================================================
+# OUTLIER FILTERING
+# ============================================================================
+
+def iqr_bounds(df, columns, by=None, k=1.5):
+    """Per-row (lower, upper) IQR fences for `columns`, as two (rows x columns) arrays.
+
+    Quartiles come from one quantile call over all columns, on the full
+    frame (or per `by` group), so the fences don't depend on column order.
+    Rows whose `by` key is missing are held to the overall fences.
+    """
+    columns = list(columns)
+    values = df[columns].astype('float64')
+    q = values.quantile([0.25, 0.75]).to_numpy()
+    q1 = np.broadcast_to(q[0], (len(df), len(columns))).copy()
+    q3 = np.broadcast_to(q[1], (len(df), len(columns))).copy()
+
+    if by is not None:
+        grouped = values.groupby([df[key] for key in ([by] if isinstance(by, str) else by)], observed=True, sort=True)
+        # ngroup() is NaN for rows with a missing key
+        codes = grouped.ngroup().fillna(-1).to_numpy(dtype=np.int64)
+        per_group = grouped.quantile([0.25, 0.75])
+        g1 = per_group.xs(0.25, level=-1).to_numpy()
+        g3 = per_group.xs(0.75, level=-1).to_numpy()
+        has = codes >= 0
+        q1[has], q3[has] = g1[codes[has]], g3[codes[has]]
+
+    iqr = q3 - q1
+    return q1 - k * iqr, q3 + k * iqr
+
+
+def outlier_mask(df, columns, by=None, k=1.5, keep_missing=False):
+    """True for rows inside the IQR fences of every column in `columns`.
+
+    Missing values count as outliers (as in the notebook filter) unless
+    `keep_missing`.
+    """
+    lower, upper = iqr_bounds(df, columns, by, k)
+    x = df[list(columns)].astype('float64').to_numpy()
+    with np.errstate(invalid='ignore'):
+        inside = (x >= lower) & (x <= upper)
+    if keep_missing:
+        inside |= np.isnan(x)
+    return inside.all(axis=1)
+
+
+def remove_outliers(df, columns, by=None, k=1.5, keep_missing=False):
+    """Rows of `df` inside the IQR fences of all `columns`, filtered in a single pass."""
+    return df[outlier_mask(df, columns, by, k, keep_missing)]
+
 # ============================================================================
 # Genre-LEVEL ANALYSIS
 # ============================================================================
 
-def Genre_performance_analysis(df):
+def Genre_performance_analysis(df, engine=None):
     """Analyze performance metrics by Genre."""
-    Genre_stats = df.groupby('Genre').agg({
+    Genre_stats = _aggregate(df, 'Genre', {
         'momentum': ['median', 'mean', 'std'],
         'discovery_capture': ['median', 'mean'],
         'quality_retention': ['median', 'mean'],
@@ -98,17 +170,16 @@ def Genre_performance_analysis(df):
         'rating_7_days_avg': ['mean', 'std', 'median'],
         'rating_trend_7d_vs_alltime': ['mean', 'std', 'median'],
         'title': 'count'  # Number of games per Genre
-    }).round(2)
+    }, engine).round(2)
     
-    Genre_stats.columns = ['_'.join(col).strip() for col in Genre_stats.columns.values]
-    Genre_stats = Genre_stats.rename(columns={'title_count': 'game_count'})
+    Genre_stats = flatten_columns(Genre_stats, report_renames('Genre_performance'))
     Genre_stats = Genre_stats.sort_values('momentum_median', ascending=False)
     
     return Genre_stats
 
-def Genre_gamepass_comparison(df):
+def Genre_gamepass_comparison(df, engine=None):
     """Compare Game Pass vs Non-Game Pass games by Genre."""
-    comparison = df.groupby(['Genre', 'has_gamepass_remediation']).agg({ #using the agg fucntion to peform a series of operations on the grouped data to get summary statistics for each Genre and Game Pass status
+    comparison = _aggregate(df, ['Genre', 'has_gamepass_remediation'], { #using the agg fucntion to peform a series of operations on the grouped data to get summary statistics for each Genre and Game Pass status
         'momentum': ['mean', 'std', 'median'],
         'discovery_capture': ['mean', 'std', 'median'],
         'quality_retention': ['mean', 'std', 'median'],
@@ -120,19 +191,18 @@ def Genre_gamepass_comparison(df):
         'rating_alltime_count': ['mean', 'std', 'median'],
         'has_gamepass_remediation': 'sum',  # Number of games on GP
         'title': 'count'  # Total games
-    }).round(2)
+    }, engine).round(2)
     
-    comparison = comparison.rename(columns={'title': 'game_count'})
-    return comparison
+    return flatten_columns(comparison, report_renames('Genre_gamepass_comparison'))
 
 # ============================================================================
 # PUBLISHER ANALYSIS
 # ============================================================================
 
-def publisher_performance_analysis(df):
+def publisher_performance_analysis(df, engine=None):
     """Identify which publishers are winning on Game Pass."""
     # Overall publisher stats
-    pub_stats = df.groupby('publisher').agg({
+    pub_stats = _aggregate(df, 'publisher', {
         'momentum': ['mean', 'std', 'median'],
         'discovery_capture': ['mean', 'std', 'median'],
         'quality_retention': ['mean', 'std', 'median'],
@@ -144,21 +214,17 @@ def publisher_performance_analysis(df):
         'rating_alltime_count': ['mean', 'std', 'median'],
         'has_gamepass_remediation': 'sum',  # Number of games on GP
         'title': 'count'  # Total games
-    }).round(2)
+    }, engine).round(2)
 
-    pub_stats = pub_stats.rename(columns={'title': 'total_games', 'has_gamepass_remediation': 'gamepass_count',
-                                          'title_count': 'total_games',
-                                          'momentum_mean': 'momentum_avg',
-                                          'discovery_capture_mean': 'discovery_capture_avg',
-                                          'quality_retention_mean': 'quality_retention_avg'})
+    pub_stats = flatten_columns(pub_stats, report_renames('publisher_performance'))
     gp_percentage = (pub_stats['gamepass_count'] / pub_stats['total_games'] * 100).round(1)
     
 
     return pub_stats, gp_percentage
 
-def publisher_gamepass_efficiency(df):
+def publisher_gamepass_efficiency(df, engine=None):
     """Show which publishers see the biggest sentiment jump with Game Pass."""
-    gp_vs_paid = df.groupby(['publisher', 'has_gamepass_remediation']).agg({
+    gp_vs_paid = _aggregate(df, ['publisher', 'has_gamepass_remediation'], {
         'momentum': 'mean',
         'discovery_capture': 'mean',
         'quality_retention': 'mean',
@@ -170,9 +236,105 @@ def publisher_gamepass_efficiency(df):
         'rating_alltime_count': ['mean', 'std', 'median'],
         'has_gamepass_remediation': 'sum',  # Number of games on GP
         'title': 'count'  # Total games
-    }).round(3)
+    }, engine).round(3)
     
-    return gp_vs_paid
+    return flatten_columns(gp_vs_paid, report_renames('publisher_gamepass_efficiency'))
+
+# ============================================================================
+# GAME PASS LIFT TABLES (xbox_final_data.csv / publisher_final.csv)
+# ============================================================================
+
+GENRE_FINAL_FILE = "xbox_final_data.csv"
+PUBLISHER_FINAL_FILE = "publisher_final.csv"
+
+GP = 'has_gamepass_remediation'
+
+# Per (group, GP status) statistics of the final tables
+FINAL_SPEC = {
+    'momentum': ['mean', 'std', 'median'],
+    'discovery_capture': ['mean', 'std', 'median'],
+    'quality_retention': ['mean', 'std', 'median'],
+    'rating_7_days_avg': ['mean', 'std', 'median'],
+    'rating_30_days_avg': ['mean', 'std', 'median'],
+    'rating_alltime_avg': ['mean', 'std', 'median'],
+    'rating_7_days_count': ['mean', 'std', 'median'],
+    'rating_30_days_count': ['mean', 'std', 'median'],
+    'rating_alltime_count': ['mean', 'std', 'median'],
+    GP: 'sum',
+    'title': 'count',
+}
+
+# Whole-group baselines: each metric's statistic over all of a group's games
+BASELINE_SPEC = {'momentum': 'mean', 'discovery_capture': 'median', 'quality_retention': 'median'}
+
+# Lift column -> statistic whose GP-minus-paid difference it is
+LIFT_SOURCES = {
+    'momentum_lift': 'momentum_mean',
+    'discovery_lift': 'discovery_capture_median',
+    'quality_lift': 'quality_retention_median',
+}
+
+
+def _pct_of(diff, baseline):
+    return diff / baseline.replace(0, np.nan) * 100
+
+def _lift_frames(df, key, engine=None):
+    """Flat per-(key, GP) stats, plus each row's whole-group baselines aligned to them."""
+    stats = flatten_columns(_aggregate(df, [key, GP], FINAL_SPEC, engine).round(2)).reset_index()
+    baseline = _aggregate(df, key, BASELINE_SPEC, engine).round(2)
+    # Broadcast by group code instead of merging the tables
+    codes = baseline.index.get_indexer(stats[key])
+    baseline = baseline.iloc[codes].set_axis(stats.index)
+    return stats, baseline
+
+def _gp_minus_paid(stats, key):
+    """GP row minus paid row of each LIFT_SOURCES statistic, repeated on both rows of a group.
+
+    A group without GP (or paid) games counts that side as 0, like the
+    notebook's pivot with fill_value=0.
+    """
+    codes, groups = pd.factorize(stats[key])
+    gp = stats[GP].to_numpy(dtype=bool)
+    lifts = {}
+    for lift, col in LIFT_SOURCES.items():
+        v = stats[col].fillna(0).to_numpy(dtype=np.float64)
+        on_gp = np.bincount(codes, weights=np.where(gp, v, 0), minlength=len(groups))
+        paid = np.bincount(codes, weights=np.where(gp, 0, v), minlength=len(groups))
+        lifts[lift] = (on_gp - paid)[codes]
+    return pd.DataFrame(lifts, index=stats.index)
+
+def compute_lift(df, engine=None):
+    """The per-Genre and per-publisher Game Pass lift tables, from one set of aggregates.
+
+    Each row is a (group, GP status) with its statistics, the group's
+    baselines (momentum mean, discovery / quality medians over all its
+    games), the row's difference and % difference from them, and the
+    group's GP-minus-paid lifts. Returns (genre table, publisher table).
+    """
+    stats, baseline = _lift_frames(df, 'Genre', engine)
+    genre = stats.drop(columns=f'{GP}_sum').rename(columns={'title_count': 'game_count'})
+    genre['momentum_genre_baseline'] = baseline['momentum']
+    genre['discovery_capture_baseline'] = baseline['discovery_capture']
+    genre['quality_retention_baseline'] = baseline['quality_retention']
+    genre['momentum_diff_vs_baseline'] = genre['momentum_mean'] - genre['momentum_genre_baseline']
+    genre['momentum_pct_vs_baseline'] = _pct_of(genre['momentum_diff_vs_baseline'], genre['momentum_genre_baseline'])
+    genre['discovery_capture_diff_vs_baseline'] = genre['discovery_capture_median'] - genre['discovery_capture_baseline']
+    genre['quality_retention_vs_baseline'] = genre['quality_retention_median'] - genre['quality_retention_baseline']
+    genre['quality_pct_vs_baseline'] = _pct_of(genre['quality_retention_vs_baseline'], genre['quality_retention_baseline'])
+    genre = pd.concat([genre, _gp_minus_paid(genre, 'Genre')], axis=1)
+
+    stats, baseline = _lift_frames(df, 'publisher', engine)
+    publisher = stats
+    for metric, func in BASELINE_SPEC.items():
+        col = f'{metric}_{func}'
+        publisher[f'{col}_baseline'] = baseline[metric]
+    for metric, func in BASELINE_SPEC.items():
+        col = f'{metric}_{func}'
+        publisher[f'{col}_diff_baseline'] = publisher[col] - publisher[f'{col}_baseline']
+        publisher[f'{col}_diff_baseline_pct'] = _pct_of(publisher[f'{col}_diff_baseline'], publisher[f'{col}_baseline'])
+    publisher = pd.concat([publisher, _gp_minus_paid(publisher, 'publisher')], axis=1)
+
+    return genre, publisher
 
 # ============================================================================
 # TREND & CORRELATION ANALYSIS
@@ -194,9 +356,8 @@ def momentum_rating_correlation(df):
 def day_one_vs_existing_gp(df):
     """Compare day-one Game Pass additions vs games added later."""
     gp_games = df[df['has_gamepass_remediation'] == True].copy()
-    # ensure datetimes
-    gp_games['Release'] = pd.to_datetime(gp_games['Release'], errors='coerce')
-    gp_games['Added'] = pd.to_datetime(gp_games['Added'], errors='coerce')
+    # ensure datetimes (no-op when calculate_game_metrics already parsed them)
+    normalize_dates(gp_games, ('Release', 'Added'))
     # elementwise day-one mask: same calendar date (or within 1 day tolerance)
     gp_games['is_day_one_gp'] = (
         gp_games['Added'].notna()
@@ -251,12 +412,22 @@ def create_visualizations(df, output_prefix="analysis"):
     axes[0, 1].axhline(y=0, color='black', linestyle='--', alpha=0.5)
     
     # 3. Momentum vs Rating 7d Scatter
-    scatter = axes[1, 0].scatter(df['momentum'], df['rating_7_days_count'], 
-                                 c=df['has_gamepass_remediation'].astype(int), cmap='viridis', alpha=0.6, s=50)
+    if len(df) > MAX_POINTS:
+        # Too many games to draw one by one: bin them, colouring each hexagon by its Game Pass share
+        x = df['momentum'].astype('float64')
+        y = df['rating_7_days_count'].astype('float64')
+        finite = np.isfinite(x) & np.isfinite(y)
+        scatter = axes[1, 0].hexbin(x[finite], y[finite], C=df.loc[finite, 'has_gamepass_remediation'].astype(float),
+                                    reduce_C_function=np.mean, gridsize=60, mincnt=1, cmap='viridis')
+        scatter_label = 'Game Pass share'
+    else:
+        scatter = axes[1, 0].scatter(df['momentum'], df['rating_7_days_count'], 
+                                     c=df['has_gamepass_remediation'].astype(int), cmap='viridis', alpha=0.6, s=50)
+        scatter_label = 'Game Pass'
     axes[1, 0].set_xlabel('Momentum (%)')
     axes[1, 0].set_ylabel('7-Day Rating')
     axes[1, 0].set_title('Momentum vs Current Rating')
-    plt.colorbar(scatter, ax=axes[1, 0], label='Game Pass')
+    plt.colorbar(scatter, ax=axes[1, 0], label=scatter_label)
     
     # 4. Discovery Capture Distribution
     axes[1, 1].hist([df[df['has_gamepass_remediation'] == False]['discovery_capture'],
@@ -272,121 +443,209 @@ def create_visualizations(df, output_prefix="analysis"):
     print(f"✓ Visualizations saved to {output_prefix}_visualizations.png")
 
 # ============================================================================
-# MAIN EXECUTION
+# PIPELINE
 # ============================================================================
 
-if __name__ == "__main__":
-    print("=" * 80)
-    print("COMPREHENSIVE GAME PASS IMPACT ANALYSIS")
-    print("=" * 80)
-    # Load and process dataframe
-    df_all = pd.read_csv('xbox_final_merged_data.csv')
-    df_all = calculate_game_metrics(df_all)
-    print(f"\n📊 Loaded and processed {len(df_all)} games")
-    
-
- # ────────────────────────────────────────────────────────────────────────
-    # 1. Genre PERFORMANCE
-    # ────────────────────────────────────────────────────────────────────────
+def _banner(title):
     print("\n" + "="*80)
-    print("Genre PERFORMANCE ANALYSIS")
+    print(title)
     print("="*80)
-    
-    Genre_perf = Genre_performance_analysis(df_all)
+
+def stage_genre(ctx):
+    _banner("Genre PERFORMANCE ANALYSIS")
+    Genre_perf = Genre_performance_analysis(ctx['df'], ctx['engine'])
     print("\nGenre Momentum & Ratings:")
     print(Genre_perf)
     Genre_perf.to_csv("Genre_performance.csv")
     print("✓ Saved to Genre_performance.csv")
-    
-    df_all = pd.read_csv('xbox_final_merged_data.csv')
-    df_all = calculate_game_metrics(df_all)
-    Genre_gp = Genre_gamepass_comparison(df_all)
+    ctx['Genre_perf'] = Genre_perf
+
+def stage_genre_gamepass(ctx):
+    Genre_gp = Genre_gamepass_comparison(ctx['df'], ctx['engine'])
     print("\nGame Pass vs Paid Games by Genre:")
     print(Genre_gp)
     Genre_gp.to_csv("Genre_gamepass_comparison.csv")
     print("✓ Saved to Genre_gamepass_comparison.csv")
-    
-    # ────────────────────────────────────────────────────────────────────────
-    # 2. PUBLISHER PERFORMANCE
-    # ────────────────────────────────────────────────────────────────────────
-    print("\n" + "="*80)
-    print("PUBLISHER PERFORMANCE ANALYSIS")
-    print("="*80)
 
-    pub_perf, gp_percentage = publisher_performance_analysis(df_all)
+def stage_publisher(ctx):
+    _banner("PUBLISHER PERFORMANCE ANALYSIS")
+    pub_perf, gp_percentage = publisher_performance_analysis(ctx['df'], ctx['engine'])
     print("\nPublisher Momentum Rankings:")
     print(pub_perf.head(10))
     pub_perf.to_csv("publisher_performance.csv")
     print("✓ Saved to publisher_performance.csv")
-    
-    pub_efficiency = publisher_gamepass_efficiency(df_all)
+    ctx['pub_perf'] = pub_perf
+
+def stage_publisher_gamepass(ctx):
+    pub_efficiency = publisher_gamepass_efficiency(ctx['df'], ctx['engine'])
     print("\nPublisher Sentiment Jump (GP vs Paid):")
     print(pub_efficiency)
     pub_efficiency.to_csv("publisher_gamepass_efficiency.csv")
     print("✓ Saved to publisher_gamepass_efficiency.csv")
-    
-    # ────────────────────────────────────────────────────────────────────────
-    # 3. CORRELATION & TRENDS
-    # ────────────────────────────────────────────────────────────────────────
-    print("\n" + "="*80)
-    print("CORRELATION & TREND ANALYSIS")
-    print("="*80)
-    
-    corr_matrix = momentum_rating_correlation(df_all)
+
+def stage_correlation(ctx):
+    _banner("CORRELATION & TREND ANALYSIS")
+    corr_matrix = momentum_rating_correlation(ctx['df'])
     if corr_matrix is not None:
         print("\nMetric Correlations:")
         print(corr_matrix)
         corr_matrix.to_csv("metric_correlations.csv")
         print("✓ Saved to metric_correlations.csv")
 
-    
-    day_one_comparison = day_one_vs_existing_gp(df_all)
+def stage_day_one(ctx):
+    day_one_comparison = day_one_vs_existing_gp(ctx['df'])
     print("\nDay-One GP vs Later Additions:")
     print(day_one_comparison.to_string(index=False))
     day_one_comparison.to_csv("day_one_vs_later_gamepass.csv", index=False)
     print("✓ Saved to day_one_vs_later_gamepass.csv")
-    
-    # ────────────────────────────────────────────────────────────────────────
-    # 4. VISUALIZATIONS
-    # ────────────────────────────────────────────────────────────────────────
-    print("\n" + "="*80)
-    print("GENERATING VISUALIZATIONS")
-    print("="*80)
-    
-    create_visualizations(df_all, "gamepass_analysis")
-    
-    # ────────────────────────────────────────────────────────────────────────
-    # 5. KEY INSIGHTS
-    # ────────────────────────────────────────────────────────────────────────
-    print("\n" + "="*80)
-    print("KEY INSIGHTS")
-    print("="*80)
-    
-    gp_games = df_all[df_all['has_gamepass_remediation'] == True]
-    paid_games = df_all[df_all['has_gamepass_remediation'] == False]
-    
+
+def stage_significance(ctx):
+    _banner("LIFT SIGNIFICANCE (BOOTSTRAP & PERMUTATION)")
+    from lift_significance import SIGNIFICANCE_FILE, cached_significance
+
+    report, reused = cached_significance(ctx['df'])
+    print(report[report['level'] == 'catalog'].to_string(index=False))
+    if reused:
+        print(f"♻️  Inputs unchanged, reused {SIGNIFICANCE_FILE}")
+    else:
+        print(f"✓ Saved to {SIGNIFICANCE_FILE}")
+
+def stage_lift(ctx):
+    _banner("GAME PASS LIFT TABLES")
+    genre, publisher = compute_lift(ctx['df'], ctx['engine'])
+    print(genre[['Genre', GP, 'momentum_lift', 'discovery_lift', 'quality_lift']].head(10))
+    genre.to_csv(GENRE_FINAL_FILE, index=False)
+    publisher.to_csv(PUBLISHER_FINAL_FILE, index=False)
+    print(f"✓ Saved to {GENRE_FINAL_FILE} and {PUBLISHER_FINAL_FILE}")
+
+def stage_visualizations(ctx):
+    _banner("GENERATING VISUALIZATIONS")
+    create_visualizations(ctx['df'], "gamepass_analysis")
+
+def stage_insights(ctx):
+    _banner("KEY INSIGHTS")
+    # One grouped pass instead of slicing df into GP / paid copies
+    by_gp = ctx['df'].groupby('has_gamepass_remediation')[['momentum', 'quality_retention', 'discovery_capture']].mean()
+    gp = by_gp.loc[True] if True in by_gp.index else pd.Series(np.nan, index=by_gp.columns)
+    paid = by_gp.loc[False] if False in by_gp.index else pd.Series(np.nan, index=by_gp.columns)
+
     print(f"\n📈 MOMENTUM:")
-    print(f"   Game Pass (avg):  {gp_games['momentum'].mean():.2f}%")
-    print(f"   Paid Only (avg):  {paid_games['momentum'].mean():.2f}%")
-    
+    print(f"   Game Pass (avg):  {gp['momentum']:.2f}%")
+    print(f"   Paid Only (avg):  {paid['momentum']:.2f}%")
+
     print(f"\n⭐ QUALITY RETENTION:")
-    print(f"   Game Pass (avg):  {gp_games['quality_retention'].mean():.3f} (rating diff from all-time)")
-    print(f"   Paid Only (avg):  {paid_games['quality_retention'].mean():.3f}")
-    if gp_games['quality_retention'].mean() > 0:
-        print(f"   → Game Pass players rate {abs(gp_games['quality_retention'].mean()):.2f} points HIGHER")
-    
+    print(f"   Game Pass (avg):  {gp['quality_retention']:.3f} (rating diff from all-time)")
+    print(f"   Paid Only (avg):  {paid['quality_retention']:.3f}")
+    if gp['quality_retention'] > 0:
+        print(f"   → Game Pass players rate {abs(gp['quality_retention']):.2f} points HIGHER")
+
     print(f"\n🎯 DISCOVERY CAPTURE:")
-    print(f"   Game Pass (avg):  {gp_games['discovery_capture'].mean():.2f}% of all-time engagement")
-    print(f"   Paid Only (avg):  {paid_games['discovery_capture'].mean():.2f}%")
-    
-    print(f"\n🏆 TOP Genre BY MOMENTUM: {Genre_perf.index[0]}")
-    print(f"   Median Momentum: {Genre_perf['momentum_median'].iloc[0]:.2f}%")
-    
-    print(f"\n👑 TOP PUBLISHER BY MOMENTUM: {pub_perf.index[0]}")
-    print(f"   Game Pass Titles: {int(pub_perf['gamepass_count'].iloc[0])}/{int(pub_perf['total_games'].iloc[0])}")
-    
+    print(f"   Game Pass (avg):  {gp['discovery_capture']:.2f}% of all-time engagement")
+    print(f"   Paid Only (avg):  {paid['discovery_capture']:.2f}%")
+
+    if 'Genre_perf' in ctx:
+        Genre_perf = ctx['Genre_perf']
+        print(f"\n🏆 TOP Genre BY MOMENTUM: {Genre_perf.index[0]}")
+        print(f"   Median Momentum: {Genre_perf['momentum_median'].iloc[0]:.2f}%")
+
+    if 'pub_perf' in ctx:
+        pub_perf = ctx['pub_perf']
+        print(f"\n👑 TOP PUBLISHER BY MOMENTUM: {pub_perf.index[0]}")
+        print(f"   Game Pass Titles: {int(pub_perf['gamepass_count'].iloc[0])}/"
+              f"{int(pub_perf['total_games'].iloc[0])}")
+
+# Stage name -> runner, in execution order
+STAGES = {
+    'genre': stage_genre,
+    'genre_gamepass': stage_genre_gamepass,
+    'publisher': stage_publisher,
+    'publisher_gamepass': stage_publisher_gamepass,
+    'correlation': stage_correlation,
+    'day_one': stage_day_one,
+    'lift': stage_lift,
+    'significance': stage_significance,
+    'visualizations': stage_visualizations,
+    'insights': stage_insights,
+}
+
+def run_pipeline(data_file, stages=None, state_dir=None, outliers=None, outlier_groups=None):
+    """Load and enrich the dataset once, then run the selected report stages on it.
+
+    Every stage reads the same metric-enriched frame and shared aggregation
+    engine; nothing is reloaded or recomputed between reports. With
+    `state_dir`, metrics are carried over from the previous snapshot and only
+    changed games are recomputed (see incremental_metrics), and the reports'
+    count / mean / std columns are read off its incrementally maintained
+    cells; medians and the other statistics that don't roll up still come
+    from the engine. With `outliers` (metric columns), games outside those
+    columns' IQR fences, overall or per `outlier_groups` key, are dropped
+    before any report runs; the cells still hold every game then, so the
+    engine answers everything. Returns the per-stage wall-clock timings.
+    """
+    stages = [name for name in STAGES if stages is None or name in stages]
+    timings = {}
+
+    start = time.perf_counter()
+    metrics = None
+    if state_dir is None:
+        df_all = calculate_game_metrics(load_dataset(data_file, report=True))
+    else:
+        from incremental_metrics import CellAggregator, IncrementalMetrics
+
+        metrics = IncrementalMetrics(state_dir)
+        df_all = metrics.update(load_dataset(data_file, report=True))
+        print(f"\n♻️  Incremental metrics: {metrics.last_diff}")
+    if outliers:
+        kept = outlier_mask(df_all, outliers, by=outlier_groups, keep_missing=True)
+        print(f"\n🧹 Dropped {int((~kept).sum())} IQR outliers on {', '.join(outliers)}"
+              + (f" (fences per {outlier_groups})" if outlier_groups else ""))
+        df_all = df_all[kept]
+        metrics = None
+    engine = build_report_engine(df_all)
+    if metrics is not None:
+        engine = CellAggregator(metrics, engine)
+    ctx = {'df': df_all, 'engine': engine}
+    timings['load + metrics'] = time.perf_counter() - start
+    print(f"\n📊 Loaded and processed {len(df_all)} games")
+
+    for name in stages:
+        start = time.perf_counter()
+        STAGES[name](ctx)
+        timings[name] = time.perf_counter() - start
+
+    return timings
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Game Pass impact & Genre analysis reports.")
+    parser.add_argument("--input", default=MERGED_DATASET,
+                        help="Merged game table (typed .feather artifact, falling back to the CSV)")
+    parser.add_argument("--reports", nargs="+", choices=list(STAGES), default=None,
+                        help="Stages to run (default: all)")
+    parser.add_argument("--state", default=None,
+                        help="Directory of the previous run's metrics; only changed games are recomputed")
+    parser.add_argument("--outliers", nargs="+", default=None,
+                        help="Drop games outside the IQR fences of these metric columns before reporting")
+    parser.add_argument("--outlier-groups", default=None, choices=['Genre', 'publisher'],
+                        help="Compute the --outliers fences per Genre or publisher instead of overall")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("COMPREHENSIVE GAME PASS IMPACT ANALYSIS")
+    print("=" * 80)
+
+    timings = run_pipeline(args.input, args.reports, args.state, args.outliers, args.outlier_groups)
+
     print("\n" + "="*80)
-    print("Analysis complete! Check the CSV files for detailed data.")
+    print("STAGE TIMINGS")
     print("="*80)
+    for name, seconds in timings.items():
+        print(f"   {name:<20} {seconds:7.3f}s")
+    print(f"   {'total':<20} {sum(timings.values()):7.3f}s")
 
-
+    print("\n" + "="*80)
+    print("Analysis complete! Check the CSV files for detailed data.")
+    print("="*80)
@@ -0,0 +1,265 @@
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# ============================================================================
+# CACHED, PRECOMPUTED TABLES FOR THE STREAMLIT DASHBOARD
+# ============================================================================
+#
+# Streamlit re-runs ui.py top to bottom on every widget interaction. Every
+# table and derived frame here is cached under its source file's mtime, so a
+# rerun (e.g. a publisher multiselect change) only stats the files; a new
+# analysis run that rewrites a CSV invalidates just the frames built from it.
+
+IMPACT_REPORT = "gamepass_impact_report.csv"
+GENRE_PERFORMANCE = "Genre_performance.csv"
+GENRE_COMPARISON = "Genre_gamepass_comparison.csv"
+GENRE_LIFT = "xbox_final_data.csv"
+PUBLISHER_LIFT = "publisher_final.csv"
+LIFT_SIGNIFICANCE = "lift_significance.csv"
+
+LIFT_METRICS = ['momentum_lift', 'discovery_lift', 'quality_lift']
+
+
+def file_version(path):
+    """Cache key for `path`'s current contents."""
+    return os.stat(path).st_mtime_ns
+
+
+# ----------------------------------------------------------------------------
+# Raw tables (one read per file version)
+# ----------------------------------------------------------------------------
+
+# Report tables are read as written; game_schema's casts are for the merged
+# game table only, and would misread report columns that share its names
+@st.cache_data(show_spinner=False)
+def _read_csv(path, version):
+    return pd.read_csv(path)
+
+
+def impact_report():
+    """MK1 vs SF6 comparison rows from Case_Study.py."""
+    return _read_csv(IMPACT_REPORT, file_version(IMPACT_REPORT))
+
+
+def genre_performance():
+    return _read_csv(GENRE_PERFORMANCE, file_version(GENRE_PERFORMANCE))
+
+
+def genre_comparison():
+    return _read_csv(GENRE_COMPARISON, file_version(GENRE_COMPARISON))
+
+
+def lift_significance():
+    """Bootstrap CIs and permutation p-values from lift_significance.py; None before its first run."""
+    if not os.path.exists(LIFT_SIGNIFICANCE):
+        return None
+    return _read_csv(LIFT_SIGNIFICANCE, file_version(LIFT_SIGNIFICANCE))
+
+
+def genre_lift():
+    return _read_csv(GENRE_LIFT, file_version(GENRE_LIFT))
+
+
+def publisher_lift():
+    return _read_csv(PUBLISHER_LIFT, file_version(PUBLISHER_LIFT))
+
+
+# ----------------------------------------------------------------------------
+# Genre page frames
+# ----------------------------------------------------------------------------
+
+@st.cache_data(show_spinner=False)
+def _top_genres(version, n):
+    return genre_performance().sort_values(by='game_count', ascending=False).head(n)
+
+
+def top_genres(n=10):
+    """The `n` genres with the most games."""
+    return _top_genres(file_version(GENRE_PERFORMANCE), n)
+
+
+@st.cache_data(show_spinner=False)
+def _gamepass_genres(version):
+    merged = genre_lift()
+    return merged[merged['has_gamepass_remediation'] == True]
+
+
+def gamepass_genres():
+    """Game Pass rows of the per-genre lift table."""
+    return _gamepass_genres(file_version(GENRE_LIFT))
+
+
+@st.cache_data(show_spinner=False)
+def _genre_win_rates(version):
+    gp_genres = gamepass_genres()
+    total = len(gp_genres)
+    return {metric: float((gp_genres[metric] >= 0).sum() / total) for metric in LIFT_METRICS}
+
+
+def genre_win_rates():
+    """Share of Game Pass genres with a non-negative lift, per lift metric."""
+    return _genre_win_rates(file_version(GENRE_LIFT))
+
+
+@st.cache_data(show_spinner=False)
+def _genre_lift_long(version):
+    return gamepass_genres()[['Genre', 'momentum_lift', 'quality_lift', 'discovery_lift']].melt(id_vars='Genre')
+
+
+def genre_lift_long():
+    """Game Pass genre lifts in long form for the grouped bar chart."""
+    return _genre_lift_long(file_version(GENRE_LIFT))
+
+
+@st.cache_data(show_spinner=False)
+def _ideal_genres(version):
+    gp_genres = gamepass_genres()
+    return gp_genres[
+        (gp_genres['discovery_lift'] > 0) &
+        (gp_genres['quality_lift'] > 0) &
+        (gp_genres['momentum_lift'] > 0)
+    ].sort_values(by='momentum_lift', ascending=False)
+
+
+def ideal_genres():
+    """Game Pass genres with a positive lift on every metric, best momentum first."""
+    return _ideal_genres(file_version(GENRE_LIFT))
+
+
+@st.cache_data(show_spinner=False)
+def _genre_lift_csv(version):
+    return genre_lift().to_csv()
+
+
+def genre_lift_csv():
+    """The per-genre lift table as CSV text for the download button."""
+    return _genre_lift_csv(file_version(GENRE_LIFT))
+
+
+# ----------------------------------------------------------------------------
+# Publisher page frames
+# ----------------------------------------------------------------------------
+
+# Additive per-(publisher, GP status) partials: non-null count and sum of
+# each lift and title_count, plus the raw cross-moments of the
+# title_count / momentum_lift correlation over rows where both are present
+CUBE_SUMS = LIFT_METRICS + ['title_count']
+CORR_X, CORR_Y = 'title_count', 'momentum_lift'
+
+
+class PublisherCube:
+    """Publisher lift table pre-aggregated for the scorecard page.
+
+    Built once per file version. A multiselect subset is answered by
+    gathering its publishers' Game Pass cells and summing a handful of
+    partial statistics, and its chart frames by gathering precomputed row
+    positions, so no filter, melt or groupby runs on a sidebar change. The
+    per-publisher rows for the scorecard are a dict lookup.
+    """
+
+    def __init__(self, df):
+        gp = df['has_gamepass_remediation'] == True
+        keys = list(zip(df['publisher'], gp))
+
+        parts = {}
+        for col in CUBE_SUMS:
+            x = pd.to_numeric(df[col], errors='coerce').astype('float64')
+            parts[f'{col}_n'] = x.notna().astype('float64')
+            parts[f'{col}_sum'] = x.fillna(0)
+        x = pd.to_numeric(df[CORR_X], errors='coerce').astype('float64')
+        y = pd.to_numeric(df[CORR_Y], errors='coerce').astype('float64')
+        both = (x.notna() & y.notna()).astype('float64')
+        x, y = x.fillna(0) * both, y.fillna(0) * both
+        parts.update(corr_n=both, corr_x=x, corr_y=y, corr_xx=x * x, corr_yy=y * y, corr_xy=x * y)
+        cells = pd.DataFrame(parts).groupby(pd.MultiIndex.from_tuples(keys), sort=False).sum()
+
+        self.columns = list(cells.columns)
+        self.partials = cells.to_numpy()
+        self.cell = {key: i for i, key in enumerate(cells.index)}
+
+        # Game Pass rows in file order, their long (melted) form, and the
+        # positions of each publisher's rows in them
+        self.gp_rows = df[gp.to_numpy()]
+        self.gp_long = self.gp_rows.melt(
+            id_vars='publisher',
+            value_vars=LIFT_METRICS,
+            var_name='Metric Type',
+            value_name='Lift Value'
+        )
+        self.complete = self.gp_rows[['discovery_lift', 'quality_lift', 'title_count']].notna().all(axis=1).to_numpy()
+        self.gp_positions = self.gp_rows.groupby('publisher', sort=False, observed=True).indices
+
+        self.by_publisher = dict(tuple(df.groupby('publisher', sort=False, observed=True)))
+        self.publishers = list(df['publisher'].dropna().unique())
+        self._empty = df.iloc[:0]
+
+    def totals(self, publishers, gamepass=True):
+        """Summed partials of the (publisher, `gamepass`) cells of `publishers`."""
+        rows = [self.cell[p, gamepass] for p in publishers if (p, gamepass) in self.cell]
+        return dict(zip(self.columns, self.partials[rows].sum(axis=0)))
+
+    def positions(self, publishers):
+        """Positions of `publishers`' Game Pass rows, in file order."""
+        found = [self.gp_positions[p] for p in publishers if p in self.gp_positions]
+        return np.sort(np.concatenate(found)) if found else np.empty(0, dtype=np.int64)
+
+    def view(self, publishers):
+        t = self.totals(publishers)
+        pos = self.positions(publishers)
+        n = len(self.gp_rows)
+        long_pos = np.concatenate([pos + k * n for k in range(len(LIFT_METRICS))])
+
+        def mean(col):
+            return t[f'{col}_sum'] / t[f'{col}_n'] if t[f'{col}_n'] else np.nan
+
+        return {
+            'gp_only': self.gp_rows.iloc[pos],
+            'lift_melted': self.gp_long.iloc[long_pos].reset_index(drop=True),
+            'scatter': self.gp_rows.iloc[pos[self.complete[pos]]],
+            'avg_momentum_lift': mean('momentum_lift'),
+            'avg_quality_lift': mean('quality_lift'),
+            'avg_discovery_lift': mean('discovery_lift'),
+            'total_titles': t['title_count_sum'],
+            'volume_corr': _pearson(t),
+        }
+
+    def scorecard(self, publisher):
+        return self.by_publisher.get(publisher, self._empty)
+
+
+def _pearson(t):
+    n = t['corr_n']
+    if n < 2:
+        return np.nan
+    sxx = t['corr_xx'] - t['corr_x'] ** 2 / n
+    syy = t['corr_yy'] - t['corr_y'] ** 2 / n
+    sxy = t['corr_xy'] - t['corr_x'] * t['corr_y'] / n
+    if sxx <= 0 or syy <= 0:
+        return np.nan
+    return sxy / np.sqrt(sxx * syy)
+
+
+@st.cache_resource(show_spinner=False)
+def _publisher_cube(version):
+    return PublisherCube(publisher_lift())
+
+
+def publisher_cube():
+    return _publisher_cube(file_version(PUBLISHER_LIFT))
+
+
+def publisher_options():
+    return publisher_cube().publishers
+
+
+def publisher_view(publishers):
+    """Game Pass rows, KPIs and chart frames for the selected publishers."""
+    return publisher_cube().view(publishers)
+
+
+def publisher_scorecard(publisher):
+    """All rows of one publisher for the detailed audit."""
+    return publisher_cube().scorecard(publisher)
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# ONE-TIME DATE PARSING FOR THE SHEET / CATALOG DATE COLUMNS
+# ============================================================================
+
+# Layouts seen in the sheet ("Oct 2021") and catalog exports
+# ("2021-06-05 09:00:00+00:00", "2023-09-19T04:00:00.0000000Z")
+DATE_FORMATS = ('%b %Y', '%B %Y', 'ISO8601', '%m/%d/%Y', '%Y/%m/%d')
+
+# Column name -> format that parsed most of it last time, tried first next time
+_FORMAT_CACHE = {}
+
+
+def _is_parsed(values):
+    return pd.api.types.is_datetime64_any_dtype(values.dtype)
+
+
+def _utc_naive(index):
+    return index.tz_convert(None).as_unit('ns').to_numpy()
+
+
+def parse_dates(values, name=None):
+    """Parse date strings to UTC-naive datetime64, one `to_datetime` per format.
+
+    Only unique strings are parsed. Each known format is tried as a single
+    vectorized call on whatever is still unparsed. The format that worked for
+    `name` last time goes first, and `format='mixed'` only sees the leftovers.
+    Offsets are converted to UTC and then dropped, so mixed-offset inputs
+    compare correctly. Unparseable values become NaT.
+    """
+    values = pd.Series(values)
+    if _is_parsed(values):
+        return values.dt.tz_convert(None) if values.dt.tz is not None else values
+
+    codes, uniques = pd.factorize(values)
+    text = pd.Index(uniques).astype(str)
+    parsed = np.full(len(text), np.datetime64('NaT'), dtype='datetime64[ns]')
+    todo = np.ones(len(text), dtype=bool)
+
+    cached = _FORMAT_CACHE.get(name)
+    formats = ([cached] if cached else []) + [f for f in DATE_FORMATS if f != cached]
+    best, best_hits = None, 0
+    for fmt in formats:
+        if not todo.any():
+            break
+        got = _utc_naive(pd.to_datetime(text[todo], format=fmt, errors='coerce', utc=True))
+        hit = ~np.isnat(got)
+        if hit.any():
+            idx = np.flatnonzero(todo)[hit]
+            parsed[idx] = got[hit]
+            todo[idx] = False
+            if hit.sum() > best_hits:
+                best, best_hits = fmt, hit.sum()
+
+    if todo.any():
+        parsed[todo] = _utc_naive(pd.to_datetime(text[todo], format='mixed', errors='coerce', utc=True))
+
+    if name is not None and best is not None:
+        _FORMAT_CACHE[name] = best
+
+    out = np.full(len(values), np.datetime64('NaT'), dtype=parsed.dtype)
+    found = codes >= 0
+    out[found] = parsed[codes[found]]
+    return pd.Series(out, index=values.index, name=values.name)
+
+
+def normalize_dates(df, columns=('Release', 'Added')):
+    """Parse `columns` in place (once); already-parsed columns are left alone."""
+    for col in columns:
+        if col in df.columns and not (_is_parsed(df[col]) and df[col].dt.tz is None):
+            df[col] = parse_dates(df[col], name=col)
+    return df
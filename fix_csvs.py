@@ -1,67 +1,85 @@
+import argparse
+import csv
+import os
 
 import pandas as pd
 
-def combine_multirow_header(csv_path, header_rows=2, sep='_', out_path=None):
-    """
-    Read a CSV with multi-row headers and collapse them into single-level
-    column names, ignoring 'Unnamed' placeholders.
+from report_columns import flatten_columns, report_renames
+
+# ============================================================================
+# ONE-SHOT MIGRATION OF LEGACY MULTI-ROW-HEADER REPORT CSVS
+# ============================================================================
+#
+# The report functions used to write their groupby().agg() MultiIndex
+# columns straight to CSV (a metric row, a statistic row and an index-name
+# row), and every file was read back and rewritten here as a *_fixed.csv.
+# They now write flat names themselves; this converts the old files once,
+# in place, with the same per-report renames the writers apply (see
+# report_columns), so a converted file has the header a fresh run writes.
+
+LEGACY_DIR = "Analysis_Files"
+
+
+def legacy_index_columns(path):
+    """Number of index columns of a two-row-header report CSV; 0 if the file is already flat."""
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = [row for _, row in zip(range(2), csv.reader(f))]
+    if len(rows) < 2 or not rows[0] or rows[0][0].strip() or rows[1][0].strip():
+        return 0
+    # The statistic row is blank over the index columns
+    n = 0
+    while n < len(rows[1]) and not rows[1][n].strip():
+        n += 1
+    return n
+
+
+def report_name(path):
+    """Report a CSV holds, from its file name (e.g. Analysis_Files/publisher_performance.csv)."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def migrate_csv(path, out_path=None):
+    """Rewrite one legacy report CSV (in place by default) with the report's flat column names.
+
+    Files that are already flat but still carry old names (e.g. from an
+    earlier run of this migration) are renamed too. Returns None when the
+    file needs no change.
     """
-   
-    df = pd.read_csv(csv_path, header=list(range(header_rows)))
-    
-    new_cols = []
-    for col in df.columns:
-        parts = []
-        for p in col:
-            p_str = str(p).strip()
-            if pd.notna(p) and p_str != '' and 'Unnamed' not in p_str:
-                parts.append(p_str)
-        
-        if not parts:
-            combined = ''
-        else:
-            combined = sep.join(parts)
-            
-        # 4. Normalize common characters for cleaner programming use
-        combined = (combined.replace(' ', '_')
-                            .replace('%', 'pct')
-                            .replace('/', '_')
-                            .replace('(', '')
-                            .replace(')', '')
-                            .lower()) # Optional: lowercase for consistency
-        new_cols.append(combined)
-    
-    # 5. Ensure uniqueness (handles cases where different columns end up with the same name)
-    counts = {}
-    final_names = []
-    for i, name in enumerate(new_cols):
-        if name == '':
-            name = f'unnamed_{i}'
-        
-        if name in counts:
-            counts[name] += 1
-            final_names.append(f"{name}_{counts[name]}")
-        else:
-            counts[name] = 0
-            final_names.append(name)
-            
-    df.columns = final_names
-    
-    if out_path:
-        df.to_csv(out_path, index=False)
-        
+    renames = report_renames(report_name(path), legacy=True)
+    n_index = legacy_index_columns(path)
+    if n_index:
+        df = pd.read_csv(path, header=[0, 1], index_col=list(range(n_index)))
+        df = flatten_columns(df, renames).reset_index()
+    else:
+        df = pd.read_csv(path)
+        if not renames.keys() & set(df.columns):
+            return None
+        df = df.rename(columns=renames)
+    df.to_csv(out_path or path, index=False)
     return df
 
-# Usage
-df_fixed = combine_multirow_header(
-    "publisher_performance.csv", 
-    header_rows=2, 
-    sep='_', 
-    out_path="publisher_performance_fixed.csv"
-)
 
-print(df_fixed.columns.tolist())
+def migrate_directory(directory=LEGACY_DIR):
+    """Convert every legacy report CSV in `directory`; returns the converted paths."""
+    converted = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if name.endswith('.csv') and migrate_csv(path) is not None:
+            converted.append(path)
+    return converted
+
 
-# Example usage:
+# ============================================================================
+# MAIN
+# ============================================================================
 
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Flatten the multi-row headers of legacy report CSVs in place.")
+    parser.add_argument("directories", nargs="*", default=[LEGACY_DIR])
+    args = parser.parse_args()
 
+    for directory in args.directories:
+        converted = migrate_directory(directory)
+        for path in converted:
+            print(f"✓ Flattened {path}")
+        print(f"📁 {directory}: {len(converted)} legacy CSV(s) converted")
@@ -0,0 +1,200 @@
+import hashlib
+import html
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# ============================================================================
+# LOCAL FIXTURE SERVERS FOR THE SCRAPER / CATALOG CLIENTS
+# ============================================================================
+
+class _FixtureServer:
+    """Run a handler class on a free localhost port in a background thread."""
+
+    def __init__(self, handler):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.fixture = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.requests = []
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class _SearchHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        fixture = self.server.fixture
+        query = parse_qs(urlsplit(self.path).query).get("q", [""])[0]
+        with fixture.lock:
+            fixture.requests.append(query)
+            fixture.arrivals.append(time.monotonic())
+            fixture.in_flight += 1
+            fixture.max_in_flight = max(fixture.max_in_flight, fixture.in_flight)
+        try:
+            time.sleep(fixture.response_delay)
+        finally:
+            with fixture.lock:
+                fixture.in_flight -= 1
+
+        links = fixture.results.get(query, [])
+        if links is None:
+            # A page whose results never render, so the client's wait times out
+            script = ""
+        else:
+            cards = "".join(
+                f'<article data-testid="result"><a href="{html.escape(link)}">{html.escape(link)}</a></article>'
+                for link in links
+            ) or '<div data-testid="no-results-message">No results.</div>'
+            # Results are injected after a delay, like a JS-rendered results page,
+            # so a fixed sleep and an event-driven wait behave differently.
+            script = f"""<script>setTimeout(function () {{
+  document.getElementById("links").innerHTML = {json.dumps(cards)};
+}}, {int(fixture.render_delay * 1000)});</script>"""
+        body = f'<!doctype html><html><body><div id="links"></div>{script}</body></html>'
+
+        payload = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class SearchFixtureServer(_FixtureServer):
+    """Serve canned search-result pages keyed by the cleaned query string.
+
+    `results` maps the query (as xbox_scraper builds it, without the
+    "+xbox+store+links" suffix) to the result links to render; None renders
+    a page that never shows results. Each response is held for
+    `response_delay` seconds, and the server records request arrival times
+    and the peak number of requests in flight.
+    """
+
+    def __init__(self, results, render_delay=0.3, response_delay=0.0):
+        super().__init__(_SearchHandler)
+        self.results = {f"{q} xbox store links": links for q, links in results.items()}
+        self.render_delay = render_delay
+        self.response_delay = response_delay
+        self.arrivals = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def search_url(self):
+        return self.url + "/?q={query}+xbox+store+links"
+
+
+def make_catalog_product(product_id, title, r7=10, r30=40, r_all=1000, game_pass=True, list_price=29.99):
+    """Minimal displaycatalog product with the fields tidy_product reads."""
+    def usage(span, count):
+        return {"AggregateTimeSpan": span, "AverageRating": 4.0, "PlayCount": 0, "RatingCount": count}
+
+    remediations = [{"Description": "Play it with Xbox Game Pass"}] if game_pass else []
+    return {
+        "ProductId": product_id,
+        "LocalizedProperties": [{
+            "ProductTitle": title,
+            "PublisherName": "Fixture Publisher",
+            "DeveloperName": "Fixture Studio",
+            "ShortDescription": f"{title} description",
+            "Images": [], "Videos": [], "CMSVideos": [],
+            "EligibilityProperties": {"Remediations": remediations},
+        }],
+        "MarketProperties": [{
+            "OriginalReleaseDate": "2024-05-01T00:00:00.0000000Z",
+            "UsageData": [usage("7Days", r7), usage("30Days", r30), usage("AllTime", r_all)],
+        }],
+        "Properties": {},
+        "DisplaySkuAvailabilities": [{"Availabilities": [{
+            "OrderManagementData": {"Price": {"ListPrice": list_price, "MSRP": list_price}},
+            "Conditions": {"StartDate": "2025-01-01T00:00:00Z", "EndDate": "9998-12-30T23:59:59Z"},
+        }]}],
+    }
+
+
+class _CatalogHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real endpoint
+
+    def do_GET(self):
+        fixture = self.server.fixture
+        query = parse_qs(urlsplit(self.path).query)
+        big_ids = [i for i in query.get("bigIds", [""])[0].split(",") if i]
+
+        with fixture.lock:
+            fixture.requests.append(big_ids)
+            throttled = fixture.throttle_first > 0
+            if throttled:
+                fixture.throttle_first -= 1
+
+        if throttled:
+            status = fixture.throttle_status
+            self._send(status, b"{}", {"Retry-After": "0"} if status == 429 else None)
+            return
+
+        products = [fixture.products[i] for i in big_ids if i in fixture.products]
+        payload = json.dumps({"Products": products}).encode("utf-8")
+        etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+
+        if self.headers.get("If-None-Match") == etag:
+            with fixture.lock:
+                fixture.not_modified += 1
+                fixture.responses.append((304, 0))
+            self._send(304, b"", {"ETag": etag})
+            return
+
+        with fixture.lock:
+            fixture.responses.append((200, len(payload)))
+        self._send(200, payload, {"ETag": etag})
+
+    def _send(self, status, payload, headers=None):
+        self.send_response(status)
+        if status != 304:
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class CatalogStubServer(_FixtureServer):
+    """Stub of displaycatalog v7.0/products that answers comma-separated bigIds.
+
+    `products` maps ProductId to a raw product. The first `throttle_first`
+    requests get `throttle_status` (a 429 with Retry-After, or a bare 5xx)
+    so clients' backoff path is exercised. Responses carry a content-hash
+    ETag, and a matching If-None-Match gets a bodiless 304; `responses`
+    records (status, body bytes) and `not_modified` counts the 304s.
+    """
+
+    def __init__(self, products, throttle_first=0, throttle_status=429):
+        super().__init__(_CatalogHandler)
+        self.products = products
+        self.throttle_first = throttle_first
+        self.throttle_status = throttle_status
+        self.responses = []
+        self.not_modified = 0
+        self.lock = threading.Lock()
+
+    @property
+    def products_url(self):
+        return self.url + "/v7.0/products"
@@ -0,0 +1,94 @@
+import pandas as pd
+
+# ============================================================================
+# DECLARED COLUMN TYPES FOR THE MERGED GAME TABLE
+# ============================================================================
+
+# Text with a few hundred distinct values at most, repeated across rows
+CATEGORY = "category"
+
+MERGED_SCHEMA = {
+    # Catalog side
+    "product_id": "str",
+    "title": "str",
+    "publisher": CATEGORY,
+    "developer": CATEGORY,
+    "category": CATEGORY,
+    "original_release_date": "str",
+    "gamepass_added_date": "str",
+    "rating_7_days_count": "Int32",
+    "rating_30_days_count": "Int32",
+    "rating_alltime_count": "Int32",
+    # Averages feed the report means/stds, which must match to the last digit
+    "rating_7_days_avg": "float64",
+    "rating_30_days_avg": "float64",
+    "rating_alltime_avg": "float64",
+    "Rating_play_count_7_days": "Int32",
+    "Rating_play_count_30_days": "Int32",
+    "Rating_play_count_alltime": "Int32",
+    "has_gamepass_remediation": "bool",
+    "current_price": "float64",
+    # Game Pass sheet side
+    "Game": "str",
+    "ProductID": "str",
+    "System": CATEGORY,
+    "xCloud": CATEGORY,
+    "Status": CATEGORY,
+    "Added": CATEGORY,
+    "Removed": CATEGORY,
+    "Release": CATEGORY,
+    # Two-decimal sheet figures, well inside float32 precision
+    "Months": "float32",
+    "Age": "float32",
+    "Delay": "float32",
+    "Metacritic": "Int16",
+    "Completion": "Int16",
+    "Genre": CATEGORY,
+    "Series X|S": CATEGORY,
+    "ESRB": CATEGORY,
+    "Status.1": CATEGORY,
+    "Added.1": CATEGORY,
+}
+
+# Long free text nothing in the analysis reads; only loaded when asked for
+LAZY_TEXT_COLUMNS = (
+    "short_description",
+    "MS_Store_Link",
+    "ESRB Content Descriptors",
+    "Owner Notes",
+    "Community Notes",
+)
+
+
+def memory_mb(df):
+    """Deep memory footprint of `df` in MB (string payloads included)."""
+    return df.memory_usage(deep=True).sum() / 1e6
+
+
+def apply_schema(df, schema=MERGED_SCHEMA):
+    """Cast the columns of `df` that `schema` declares; other columns are left alone.
+
+    Numbers are coerced first, so stray text in a numeric sheet column
+    (e.g. a price typed into Metacritic) becomes a missing value. "str"
+    columns become pandas' nullable string dtype, so `isna()` still finds
+    missing titles and ProductIDs.
+    """
+    for col, dtype in schema.items():
+        if col not in df.columns or df[col].dtype == ("string" if dtype == "str" else dtype):
+            continue
+        values = df[col]
+        if dtype == "bool":
+            df[col] = values.fillna(False).astype(bool)
+        elif dtype == CATEGORY:
+            df[col] = values.astype(CATEGORY)
+        elif dtype == "str":
+            # The nullable string dtype keeps missing values missing (astype("str") would write 'nan')
+            df[col] = values.astype("string")
+        else:
+            df[col] = pd.to_numeric(values, errors="coerce").astype(dtype)
+    return df
+
+
+def eager_columns(columns):
+    """`columns` minus the long text ones, in their original order."""
+    return [c for c in columns if c not in LAZY_TEXT_COLUMNS]
@@ -0,0 +1,243 @@
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# SHARED MULTI-GROUPING AGGREGATES FOR THE ANALYSIS REPORTS
+# ============================================================================
+
+SUPPORTED_FUNCS = ('count', 'sum', 'mean', 'std', 'median')
+
+
+class GroupAggregator:
+    """Answer several `df.groupby(by).agg(spec)` calls from one factorization.
+
+    Every key in `keys` is factorized once and rows are bucketed into the
+    finest (all-keys) cells. Per column, the cell count, sum and centred sum
+    of squares are computed in a single pass and cached. Any grouping over a
+    subset of `keys` is then a roll-up of those cells rather than a new scan.
+    Medians don't roll up, so each column is value-sorted once and every
+    grouping reads its medians off that order with a stable counting sort by
+    group.
+
+    Results follow pandas: groups come back sorted by key, rows with a missing
+    key are dropped from groupings that use that key, NaN values are skipped,
+    and std uses ddof=1.
+    """
+
+    def __init__(self, df, keys):
+        self.df = df
+        self.keys = list(keys)
+        self._uniques = {}
+
+        codes = []
+        for key in self.keys:
+            c, uniques = pd.factorize(df[key], sort=True)
+            # Missing keys get a trailing code of their own so they still count
+            # towards groupings that don't involve this key
+            codes.append(np.where(c < 0, len(uniques), c))
+            self._uniques[key] = uniques
+        self._sizes = tuple(len(self._uniques[k]) + 1 for k in self.keys)
+
+        flat = np.ravel_multi_index(codes, self._sizes) if len(df) else np.empty(0, dtype=np.int64)
+        cells, self._row_cell = np.unique(flat, return_inverse=True)
+        self._row_cell = self._row_cell.ravel()
+        self._cell_codes = dict(zip(self.keys, np.unravel_index(cells, self._sizes)))
+        self._n_cells = len(cells)
+
+        self._float_values = {}
+        self._moments = {}
+        self._rollups = {}
+        self._value_order = {}
+        self._groupings = {}
+
+    # ------------------------------------------------------------------
+    # Cached building blocks
+    # ------------------------------------------------------------------
+
+    def _values(self, column):
+        if column not in self._float_values:
+            values = self.df[column]
+            if values.dtype == bool:
+                values = values.to_numpy(dtype=np.float64)
+            else:
+                values = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            self._float_values[column] = values
+        return self._float_values[column]
+
+    def _cell_moments(self, column):
+        """(count, sum, mean, centred sum of squares) of `column` per finest cell."""
+        if column not in self._moments:
+            x = self._values(column)
+            valid = ~np.isnan(x)
+            cell = self._row_cell[valid]
+            x = x[valid]
+
+            n = np.bincount(cell, minlength=self._n_cells).astype(np.float64)
+            s = np.bincount(cell, weights=x, minlength=self._n_cells)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = s / n
+            m2 = np.bincount(cell, weights=(x - mean[cell]) ** 2, minlength=self._n_cells)
+            self._moments[column] = (n, s, mean, m2)
+        return self._moments[column]
+
+    def _grouping(self, by):
+        """Cell -> group ids for `by` (-1 for cells with a missing key), plus the group index."""
+        by = tuple(by)
+        if by not in self._groupings:
+            codes = [self._cell_codes[k] for k in by]
+            sizes = [self._sizes[self.keys.index(k)] for k in by]
+            missing = np.zeros(self._n_cells, dtype=bool)
+            for k, c in zip(by, codes):
+                missing |= c == len(self._uniques[k])
+
+            flat = np.ravel_multi_index(codes, sizes) if self._n_cells else np.empty(0, dtype=np.int64)
+            groups, inverse = np.unique(flat[~missing], return_inverse=True)
+            cell_group = np.full(self._n_cells, -1, dtype=np.int64)
+            cell_group[~missing] = inverse.ravel()
+
+            group_codes = np.unravel_index(groups, sizes)
+            labels = [self._uniques[k].take(c) for k, c in zip(by, group_codes)]
+            if len(by) == 1:
+                index = pd.Index(labels[0], name=by[0])
+            else:
+                index = pd.MultiIndex.from_arrays(labels, names=list(by))
+            self._groupings[by] = (cell_group, index)
+        return self._groupings[by]
+
+    # ------------------------------------------------------------------
+    # Reducers
+    # ------------------------------------------------------------------
+
+    def _rollup(self, column, by, cell_group, n_groups):
+        if (column, by) not in self._rollups:
+            self._rollups[column, by] = self._merge_cells(column, cell_group, n_groups)
+        return self._rollups[column, by]
+
+    def _merge_cells(self, column, cell_group, n_groups):
+        n_c, s_c, cell_mean, m2_c = self._cell_moments(column)
+        keep = cell_group >= 0
+        g = cell_group[keep]
+        n_c, s_c, cell_mean, m2_c = n_c[keep], s_c[keep], cell_mean[keep], m2_c[keep]
+
+        n = np.bincount(g, weights=n_c, minlength=n_groups)
+        s = np.bincount(g, weights=s_c, minlength=n_groups)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = s / n
+        # Parallel-variance merge of the per-cell centred sums of squares
+        spread = np.where(n_c > 0, n_c * (cell_mean - mean[g]) ** 2, 0.0)
+        m2 = np.bincount(g, weights=m2_c + spread, minlength=n_groups)
+        return n, s, mean, m2
+
+    def _count(self, column, cell_group, n_groups):
+        # Non-null count, which also works for non-numeric columns like 'title'
+        key = ('count', column)
+        if key not in self._moments:
+            notna = self.df[column].notna().to_numpy()
+            self._moments[key] = np.bincount(self._row_cell[notna], minlength=self._n_cells)
+        per_cell = self._moments[key]
+        keep = cell_group >= 0
+        return np.bincount(cell_group[keep], weights=per_cell[keep], minlength=n_groups).astype(np.int64)
+
+    def _median(self, column, cell_group, n_groups):
+        if column not in self._value_order:
+            x = self._values(column)
+            valid = np.flatnonzero(~np.isnan(x))
+            order = valid[np.argsort(x[valid])]
+            self._value_order[column] = (x[order], self._row_cell[order])
+        sorted_values, sorted_cells = self._value_order[column]
+
+        # Rows in value order, labelled with their group; dropped rows go to a
+        # trailing bucket so no filtering pass is needed
+        bucket = np.where(cell_group >= 0, cell_group, n_groups)
+        if n_groups < np.iinfo(np.uint16).max:
+            # numpy radix-sorts 16-bit keys, so this is linear for report-sized groupings
+            bucket = bucket.astype(np.uint16)
+        g = bucket[sorted_cells]
+        # Stable sort by group keeps each group's values in ascending order
+        by_group = np.argsort(g, kind='stable')
+
+        n = np.bincount(g, minlength=n_groups + 1)[:n_groups]
+        start = np.concatenate(([0], np.cumsum(n)[:-1])).astype(np.int64)
+        out = np.full(n_groups, np.nan)
+        has = n > 0
+        lo = by_group[start[has] + (n[has] - 1) // 2]
+        hi = by_group[start[has] + n[has] // 2]
+        out[has] = (sorted_values[lo] + sorted_values[hi]) / 2
+        return out
+
+    def _mad(self, column, cell_group, n_groups):
+        """Median absolute deviation from the group median (unscaled)."""
+        median = self._median(column, cell_group, n_groups)
+        x = self._values(column)
+        g = cell_group[self._row_cell]
+        valid = np.flatnonzero(~np.isnan(x) & (g >= 0))
+        g = g[valid]
+        dev = np.abs(x[valid] - median[g])
+        order = np.lexsort((dev, g))
+        dev, g = dev[order], g[order]
+
+        n = np.bincount(g, minlength=n_groups)
+        start = np.concatenate(([0], np.cumsum(n)[:-1])).astype(np.int64)
+        out = np.full(n_groups, np.nan)
+        has = n > 0
+        out[has] = (dev[start[has] + (n[has] - 1) // 2] + dev[start[has] + n[has] // 2]) / 2
+        return out
+
+    def row_groups(self, by):
+        """Group id of every row under `by` (-1 where one of its keys is missing), and the group index."""
+        by = [by] if isinstance(by, str) else list(by)
+        cell_group, index = self._grouping(by)
+        return cell_group[self._row_cell], index
+
+    def transform(self, by, column, func):
+        """Same result as `self.df.groupby(by)[column].transform(func)`, as an array.
+
+        Besides count/sum/mean/std/median, `func` may be 'mad' (median absolute
+        deviation from the group median). Group values are computed once per
+        group and broadcast back by each row's group id.
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        if func == 'mad':
+            cell_group, index = self._grouping(by)
+            per_group = self._mad(column, cell_group, len(index))
+        else:
+            per_group = self.agg(by, {column: func})[column].to_numpy(dtype=np.float64)
+        groups, _ = self.row_groups(by)
+        if len(per_group) == 0:
+            return np.full(len(groups), np.nan)
+        return np.where(groups >= 0, per_group[groups], np.nan)
+
+    def agg(self, by, spec):
+        """Same result as `self.df.groupby(by).agg(spec)` for count/sum/mean/std/median."""
+        by = [by] if isinstance(by, str) else list(by)
+        cell_group, index = self._grouping(by)
+        n_groups = len(index)
+
+        flat_columns = all(isinstance(funcs, str) for funcs in spec.values())
+        columns = {}
+        for column, funcs in spec.items():
+            for func in ([funcs] if isinstance(funcs, str) else funcs):
+                if func not in SUPPORTED_FUNCS:
+                    raise ValueError(f"Unsupported aggregation {func!r} for {column}")
+
+                if func == 'median':
+                    result = self._median(column, cell_group, n_groups)
+                elif func == 'count':
+                    result = self._count(column, cell_group, n_groups)
+                else:
+                    n, s, mean, m2 = self._rollup(column, tuple(by), cell_group, n_groups)
+                    if func == 'sum':
+                        integral = self.df[column].dtype == bool or pd.api.types.is_integer_dtype(self.df[column])
+                        result = s.astype(np.int64) if integral else s
+                    elif func == 'mean':
+                        result = mean
+                    else:
+                        with np.errstate(invalid='ignore', divide='ignore'):
+                            result = np.where(n > 1, np.sqrt(m2 / (n - 1)), np.nan)
+
+                columns[column if flat_columns else (column, func)] = result
+
+        out = pd.DataFrame(columns, index=index)
+        if not flat_columns:
+            out.columns = pd.MultiIndex.from_tuples(out.columns)
+        return out
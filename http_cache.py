@@ -0,0 +1,210 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import namedtuple
+
+# ============================================================================
+# ON-DISK CONDITIONAL-REQUEST CACHE FOR DISPLAYCATALOG PRODUCTS
+# ============================================================================
+
+CACHE_PATH = os.path.join(".cache", "catalog_http.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    big_id         TEXT NOT NULL,
+    market         TEXT NOT NULL,
+    language       TEXT NOT NULL,
+    content_hash   TEXT,
+    body           BLOB NOT NULL,
+    size           INTEGER NOT NULL,
+    fetched_at     REAL NOT NULL,
+    accessed_at    REAL NOT NULL,
+    PRIMARY KEY (big_id, market, language)
+);
+CREATE INDEX IF NOT EXISTS responses_lru ON responses (accessed_at);
+CREATE TABLE IF NOT EXISTS batches (
+    batch_key      TEXT NOT NULL,
+    market         TEXT NOT NULL,
+    language       TEXT NOT NULL,
+    etag           TEXT,
+    last_modified  TEXT,
+    product_ids    TEXT NOT NULL,
+    PRIMARY KEY (batch_key, market, language)
+);
+"""
+
+CacheEntry = namedtuple("CacheEntry", "big_id product content_hash fresh")
+
+# Validators of one batched response and the ProductIds it carried
+BatchValidators = namedtuple("BatchValidators", "etag last_modified product_ids")
+
+
+def content_hash(product):
+    """Stable digest of a product body, used to tell a refetched product from the cached one."""
+    return hashlib.sha1(json.dumps(product, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def batch_key(big_ids):
+    """Key of a batched request: its bigIds sorted and comma-joined, so the order they were asked in doesn't matter."""
+    return ",".join(sorted(big_ids))
+
+
+class CatalogCache:
+    """SQLite store of raw displaycatalog products keyed by (bigId, market, language).
+
+    Bodies are kept zlib-compressed along with a content hash. Entries
+    younger than `ttl` seconds are served as-is. Older ones are handed back
+    as stale so the client can refetch them in its normal batches; `store()`
+    only rewrites products whose hash changed and just resets the clock of
+    the rest. Each batch response's ETag/Last-Modified is kept under the
+    batch's sorted bigIds, so the same batch can be revalidated with one
+    conditional GET and a 304 resets every id in it. Once the compressed bodies pass `max_bytes`, the least
+    recently used entries are evicted.
+    """
+
+    def __init__(self, path=CACHE_PATH, ttl=6 * 3600, max_bytes=256 * 1024 * 1024):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Shared by the client's worker threads, serialized by self._lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        if "content_hash" not in columns:
+            # Caches written before content hashes; their entries are rewritten on the next refetch
+            self._conn.execute("ALTER TABLE responses ADD COLUMN content_hash TEXT")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.evict()
+        self._conn.close()
+
+    def lookup(self, big_ids, market, language):
+        """Cached entries for `big_ids` as {big_id: CacheEntry}; ids not in the cache are absent."""
+        big_ids = list(dict.fromkeys(big_ids))
+        now = time.time()
+        found = {}
+
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(big_ids), 500):
+                chunk = big_ids[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT big_id, content_hash, body, fetched_at FROM responses "
+                    f"WHERE market = ? AND language = ? AND big_id IN ({','.join('?' * len(chunk))})",
+                    (market, language, *chunk),
+                )
+                for big_id, digest, body, fetched_at in rows:
+                    product = json.loads(zlib.decompress(body))
+                    found[big_id] = CacheEntry(big_id, product, digest, now - fetched_at < self.ttl)
+
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE responses SET accessed_at = ? WHERE big_id = ? AND market = ? AND language = ?",
+                    ((now, big_id, market, language) for big_id in found),
+                )
+        return found
+
+    def validators(self, big_ids, market, language):
+        """BatchValidators from the last response to this set of `big_ids`, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, product_ids FROM batches "
+                "WHERE batch_key = ? AND market = ? AND language = ?",
+                (batch_key(big_ids), market, language),
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, product_ids = row
+        return BatchValidators(etag, last_modified, [i for i in product_ids.split(",") if i])
+
+    def store(self, products, market, language, known=None, batch=None, etag=None, last_modified=None):
+        """Save freshly fetched `products`, returning how many were unchanged.
+
+        `known` maps big_id to the hash each product had in the cache (e.g.
+        from `lookup`). Products with the same hash only get their clock
+        reset; new or changed ones are (re)written. With `batch` (the bigIds
+        that were requested), the response's `etag`/`last_modified` are
+        saved for that batch. One transaction per call.
+        """
+        known = known or {}
+        now = time.time()
+        rows, unchanged = [], []
+        for product in products:
+            big_id, digest = product["ProductId"], content_hash(product)
+            if known.get(big_id) == digest:
+                unchanged.append((now, now, big_id, market, language))
+            else:
+                body = zlib.compress(json.dumps(product, ensure_ascii=False).encode("utf-8"))
+                rows.append((big_id, market, language, digest, body, len(body), now, now))
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO responses "
+                "(big_id, market, language, content_hash, body, size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.executemany(
+                "UPDATE responses SET fetched_at = ?, accessed_at = ? "
+                "WHERE big_id = ? AND market = ? AND language = ?",
+                unchanged,
+            )
+            if batch is not None:
+                key = batch_key(batch)
+                if etag or last_modified:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO batches "
+                        "(batch_key, market, language, etag, last_modified, product_ids) VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, market, language, etag, last_modified, ",".join(p["ProductId"] for p in products)),
+                    )
+                else:
+                    self._conn.execute(
+                        "DELETE FROM batches WHERE batch_key = ? AND market = ? AND language = ?",
+                        (key, market, language),
+                    )
+        return len(unchanged)
+
+    def not_modified(self, big_ids, market, language):
+        """Reset the TTL of every cached id in a batch the server answered with 304."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE responses SET fetched_at = ?, accessed_at = ? "
+                "WHERE big_id = ? AND market = ? AND language = ?",
+                ((now, now, big_id, market, language) for big_id in big_ids),
+            )
+
+    def evict(self):
+        """Drop least-recently-used entries until the stored bodies fit in `max_bytes`."""
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "DELETE FROM responses WHERE rowid IN ("
+                "  SELECT rowid FROM ("
+                "    SELECT rowid, SUM(size) OVER (ORDER BY accessed_at DESC, rowid DESC) AS running"
+                "    FROM responses"
+                "  ) WHERE running > ?"
+                ")",
+                (self.max_bytes,),
+            )
+        return cur.rowcount
+
+    def stats(self):
+        """Entry count and total compressed size."""
+        with self._lock:
+            count, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {"entries": count, "bytes": size}
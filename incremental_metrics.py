@@ -0,0 +1,209 @@
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from comprehensive_game_analysis import (
+    METRIC_INPUTS, RATING_METRICS, REPORT_KEYS, add_day_metrics, add_rating_metrics,
+)
+from prepare_data import MERGED_DATASET, load_dataset
+
+# ============================================================================
+# INCREMENTAL METRICS BETWEEN DAILY SNAPSHOTS
+# ============================================================================
+
+STATE_DIR = os.path.join(".cache", "metrics_state")
+
+# Columns whose Genre / publisher additive statistics are kept up to date
+SUMMARY_COLUMNS = RATING_METRICS + METRIC_INPUTS[:6]
+
+
+def row_keys(df):
+    """Stable per-row key: product_id plus its occurrence number (sheet rows can share a product)."""
+    occurrence = df.groupby('product_id', sort=False).cumcount().astype(str)
+    return df['product_id'].astype(str) + '#' + occurrence
+
+
+def _input_hash(df):
+    """Hash of everything a row's metrics and grouping depend on."""
+    cols = [c for c in METRIC_INPUTS + REPORT_KEYS if c in df.columns]
+    return pd.util.hash_pandas_object(df[cols].astype(str), index=False).to_numpy()
+
+
+# Stand-in for a missing Genre / publisher so those rows still line up across runs
+MISSING_KEY = '<missing>'
+
+
+def _contributions(frame):
+    """Per-cell count / sum / sum of squares of SUMMARY_COLUMNS for `frame`."""
+    parts = {}
+    for col in SUMMARY_COLUMNS:
+        # float64: squares of Int32 rating counts would overflow
+        x = pd.to_numeric(frame[col], errors='coerce').astype('float64')
+        parts[f'{col}_n'] = x.notna().astype(np.int64)
+        parts[f'{col}_sum'] = x.fillna(0)
+        parts[f'{col}_sumsq'] = x.fillna(0) ** 2
+    values = pd.DataFrame(parts, index=frame.index)
+    # Fill before casting: astype(str) would turn a missing key into 'nan'
+    keys = [frame[k] if frame[k].dtype == bool else
+            frame[k].astype(object).where(frame[k].notna(), MISSING_KEY).astype(str) for k in REPORT_KEYS]
+    return values.groupby(keys).sum()
+
+
+class IncrementalMetrics:
+    """Carry metrics and Genre / publisher statistics from one snapshot to the next.
+
+    The previous run's rating metrics, a hash of each row's inputs, and the
+    per-(Genre, publisher, Game Pass) count / sum / sum of squares of the
+    metric columns are kept in `state_dir`. `update()` diffs the new snapshot
+    against them by product_id. Only new or changed rows go through
+    add_rating_metrics; the day counts are re-applied to every row in one
+    vectorized pass; and the group statistics are patched by subtracting the
+    old rows' contributions and adding the new ones instead of re-aggregating.
+    """
+
+    def __init__(self, state_dir=STATE_DIR):
+        self.state_dir = state_dir
+        self.last_diff = {}
+        self._frame = None
+        self._cells = None
+
+        frame_file = os.path.join(state_dir, 'rows.feather')
+        cells_file = os.path.join(state_dir, 'cells.feather')
+        if os.path.exists(frame_file) and os.path.exists(cells_file):
+            self._frame = pd.read_feather(frame_file).set_index('row_key')
+            self._cells = pd.read_feather(cells_file).set_index(REPORT_KEYS)
+
+    def update(self, df, now=None):
+        """Add metric columns to snapshot `df` (in place), reusing unchanged rows from the last run."""
+        keys = row_keys(df)
+        digest = _input_hash(df)
+
+        if self._frame is None:
+            changed = np.ones(len(df), dtype=bool)
+            removed = pd.Index([])
+        else:
+            prev_digest = self._frame['input_hash'].reindex(keys).to_numpy()
+            changed = pd.isna(prev_digest) | (prev_digest != digest)
+            removed = self._frame.index.difference(keys[~changed])
+
+        for col in RATING_METRICS:
+            df[col] = np.nan
+        if (~changed).any():
+            df.loc[~changed, RATING_METRICS] = self._frame.loc[keys[~changed], RATING_METRICS].to_numpy()
+        if changed.any():
+            fresh = add_rating_metrics(df.loc[changed, METRIC_INPUTS[:6]].copy())
+            df.loc[changed, RATING_METRICS] = fresh[RATING_METRICS].to_numpy()
+        add_day_metrics(df, now)
+
+        # Patch the group statistics: out with replaced/dropped rows, in with new values
+        cells = self._cells
+        if len(removed):
+            cells = cells.sub(_contributions(self._frame.loc[removed]), fill_value=0)
+        if changed.any():
+            added = _contributions(df.loc[changed])
+            cells = added if cells is None else cells.add(added, fill_value=0)
+        if cells is not None:
+            # Drop cells with no rows left; a row can lack momentum but still have other values
+            counts = cells[[f'{col}_n' for col in SUMMARY_COLUMNS]]
+            cells = cells[(counts > 0).any(axis=1)]
+
+        self.last_diff = {
+            'rows': len(df),
+            'recomputed': int(changed.sum()),
+            'reused': int((~changed).sum()),
+            'dropped': len(self._frame.index.difference(keys)) if self._frame is not None else 0,
+        }
+
+        state = df[REPORT_KEYS + SUMMARY_COLUMNS].copy()
+        state['input_hash'] = digest
+        state.index = keys.rename('row_key')
+        self._frame = state
+        self._cells = cells
+        self._save()
+        return df
+
+    def _save(self):
+        os.makedirs(self.state_dir, exist_ok=True)
+        if self._cells is None:
+            return
+        self._frame.reset_index().to_feather(os.path.join(self.state_dir, 'rows.feather'))
+        self._cells.reset_index().to_feather(os.path.join(self.state_dir, 'cells.feather'))
+
+    def group_stats(self, by):
+        """Count / mean / std of SUMMARY_COLUMNS per `by` group, rolled up from the stored cells."""
+        by = [by] if isinstance(by, str) else list(by)
+        # Like groupby's dropna: rows missing a grouping key don't form a group
+        present = np.ones(len(self._cells), dtype=bool)
+        for k in by:
+            present &= self._cells.index.get_level_values(k) != MISSING_KEY
+        sums = self._cells[present].groupby(level=by).sum()
+        out = {}
+        for col in SUMMARY_COLUMNS:
+            n, s, sq = sums[f'{col}_n'], sums[f'{col}_sum'], sums[f'{col}_sumsq']
+            var = ((sq - s * s / n) / (n - 1)).clip(lower=0).where(n > 1)
+            out[(col, 'count')] = n
+            out[(col, 'mean')] = s / n
+            out[(col, 'std')] = np.sqrt(var)
+        return pd.DataFrame(out)
+
+
+# Statistics that roll up from a cell's count / sum / sum of squares
+CELL_FUNCS = ('count', 'mean', 'std')
+
+
+class CellAggregator:
+    """Report engine that serves count / mean / std of SUMMARY_COLUMNS from IncrementalMetrics cells.
+
+    Everything else in a spec (medians, title counts, Game Pass sums) still
+    goes to `engine`, a GroupAggregator over the same frame, which also fixes
+    the group index, so the reports come out in the same shape either way.
+    """
+
+    def __init__(self, metrics, engine):
+        self.metrics = metrics
+        self.engine = engine
+
+    def agg(self, by, spec):
+        """Same result as `engine.agg(by, spec)`, with the additive statistics read off the cells."""
+        by = [by] if isinstance(by, str) else list(by)
+        flat_columns = all(isinstance(funcs, str) for funcs in spec.values())
+        pairs = [(column, func) for column, funcs in spec.items()
+                 for func in ([funcs] if isinstance(funcs, str) else funcs)]
+
+        rest = {}
+        for column, func in pairs:
+            if column not in SUMMARY_COLUMNS or func not in CELL_FUNCS:
+                rest.setdefault(column, []).append(func)
+
+        _, index = self.engine.row_groups(by)
+        cells = self.metrics.group_stats(by).reindex(index)
+        other = self.engine.agg(by, rest) if rest else None
+
+        columns = {}
+        for column, func in pairs:
+            source = other if column in rest and func in rest[column] else cells
+            columns[column if flat_columns else (column, func)] = source[(column, func)].to_numpy()
+
+        out = pd.DataFrame(columns, index=index)
+        if not flat_columns:
+            out.columns = pd.MultiIndex.from_tuples(out.columns)
+        return out
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Update metrics and group statistics from a new snapshot.")
+    parser.add_argument("--input", default=MERGED_DATASET,
+                        help="Merged game table (typed .feather artifact, falling back to the CSV)")
+    parser.add_argument("--state", default=STATE_DIR)
+    args = parser.parse_args()
+
+    metrics = IncrementalMetrics(args.state)
+    df = metrics.update(load_dataset(args.input))
+    print(f"📊 {metrics.last_diff}")
+    print(metrics.group_stats('Genre')[[('momentum', 'count'), ('momentum', 'mean'), ('momentum', 'std')]].head(10))
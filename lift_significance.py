@@ -0,0 +1,187 @@
+import argparse
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+from comprehensive_game_analysis import calculate_game_metrics
+from prepare_data import MERGED_DATASET, load_dataset
+
+# ============================================================================
+# BOOTSTRAP CONFIDENCE INTERVALS AND PERMUTATION TESTS FOR GAME PASS LIFT
+# ============================================================================
+#
+# Lift is the Game Pass mean minus the paid mean of a metric within a group,
+# i.e. the GP-vs-paid gap in the Genre_gamepass_comparison means. For every
+# group of a level at once, rows are sorted into contiguous (group, GP
+# status) blocks; a batch of resamples is then one random index matrix
+# gathered from the values and summed per block with np.add.reduceat.
+
+SIGNIFICANCE_FILE = "lift_significance.csv"
+
+LIFT_METRICS = ['momentum', 'discovery_capture', 'quality_retention']
+
+# Level name -> grouping column (None: the whole catalog as one group)
+LEVELS = {'catalog': None, 'Genre': 'Genre', 'publisher': 'publisher'}
+
+# Resampled values held in memory at once (resamples x rows)
+_BATCH_CELLS = 4_000_000
+
+
+def input_digest(df, metrics=LIFT_METRICS):
+    """Hash of the grouping keys, GP flags and metric values the tests read."""
+    cols = [c for c in ['Genre', 'publisher', 'has_gamepass_remediation'] + list(metrics) if c in df.columns]
+    hashed = pd.util.hash_pandas_object(df[cols].astype(str), index=False).to_numpy()
+    return hashlib.sha1(hashed.tobytes()).hexdigest()
+
+
+class _Blocks:
+    """Valid rows of one metric sorted into contiguous (group, GP status) blocks."""
+
+    def __init__(self, codes, gp, x):
+        valid = (codes >= 0) & ~np.isnan(x)
+        # Paid rows first within each group, so GP rows are each block's tail
+        order = np.lexsort((gp[valid], codes[valid]))
+        self.codes = codes[valid][order]
+        self.gp = gp[valid][order]
+        self.x = x[valid][order]
+
+        self.groups, self.starts, self.sizes = np.unique(self.codes, return_index=True, return_counts=True)
+        self.n_gp = np.add.reduceat(self.gp.astype(np.int64), self.starts) if len(self.x) else np.zeros(0, np.int64)
+        self.n_paid = self.sizes - self.n_gp
+
+        # Start and size of the (group, GP status) cell each row belongs to,
+        # for resampling every row from its own cell
+        cell = self.codes * 2 + self.gp
+        _, cell_start, cell_inverse, cell_size = np.unique(
+            cell, return_index=True, return_inverse=True, return_counts=True)
+        self.cell_start = cell_start[cell_inverse.ravel()]
+        self.cell_size = cell_size[cell_inverse.ravel()]
+
+    def lift(self, values):
+        """GP mean minus paid mean per group, for each row of `values` (resamples x rows)."""
+        total = np.add.reduceat(values, self.starts, axis=-1)
+        gp_sum = np.add.reduceat(values * self.gp, self.starts, axis=-1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return gp_sum / self.n_gp - (total - gp_sum) / self.n_paid
+
+    def bootstrap(self, rng, size):
+        """(size x rows) values, each row drawn with replacement from its own cell."""
+        draw = (rng.random((size, len(self.x))) * self.cell_size).astype(np.int64)
+        return self.x[self.cell_start + draw]
+
+    def permute(self, rng, size):
+        """(size x rows) values with GP labels shuffled within each group."""
+        # Integer group codes keep every shuffle inside its own block
+        order = np.argsort(self.codes + rng.random((size, len(self.x))), axis=1)
+        return self.x[order]
+
+    def cohens_d(self):
+        """Lift over the pooled standard deviation (ddof=1 on each side)."""
+        def side_var(mask, n):
+            s = np.add.reduceat(self.x * mask, self.starts)
+            sq = np.add.reduceat(self.x ** 2 * mask, self.starts)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return (sq - s * s / n) / (n - 1)
+
+        var_gp = side_var(self.gp, self.n_gp)
+        var_paid = side_var(~self.gp, self.n_paid)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            pooled = ((self.n_gp - 1) * var_gp + (self.n_paid - 1) * var_paid) / (self.sizes - 2)
+            return self.lift(self.x) / np.sqrt(np.clip(pooled, 0, None))
+
+
+def _batches(resamples, rows):
+    size = max(_BATCH_CELLS // max(rows, 1), 1)
+    for done in range(0, resamples, size):
+        yield min(size, resamples - done)
+
+
+def lift_significance(df, by=None, metrics=LIFT_METRICS, resamples=2000, confidence=0.95, seed=0):
+    """Lift, bootstrap CI and one-sided permutation p-value (GP > paid) per `by` group and metric.
+
+    `by` is a grouping column, or None for the whole catalog. Groups without
+    both GP and paid games get NaN intervals and p-values.
+    """
+    rng = np.random.default_rng(seed)
+    if by is None:
+        codes, labels = np.zeros(len(df), dtype=np.int64), pd.Index(['All games'])
+    else:
+        codes, labels = pd.factorize(df[by], sort=True)
+    gp = df['has_gamepass_remediation'].fillna(False).to_numpy(dtype=bool)
+
+    tail = (1 - confidence) / 2 * 100
+    frames = []
+    for metric in metrics:
+        x = pd.to_numeric(df[metric], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        blocks = _Blocks(codes, gp, x)
+        observed = blocks.lift(blocks.x)
+
+        boot = np.concatenate([blocks.lift(blocks.bootstrap(rng, b)) for b in _batches(resamples, len(blocks.x))])
+        exceed = np.zeros(len(blocks.groups))
+        for b in _batches(resamples, len(blocks.x)):
+            exceed += (blocks.lift(blocks.permute(rng, b)) >= observed - 1e-12).sum(axis=0)
+
+        testable = np.isfinite(observed)
+        low, high = np.full(len(observed), np.nan), np.full(len(observed), np.nan)
+        if testable.any():
+            low[testable], high[testable] = np.percentile(boot[:, testable], [tail, 100 - tail], axis=0)
+        gp_mean = np.add.reduceat(blocks.x * blocks.gp, blocks.starts) / np.where(blocks.n_gp, blocks.n_gp, np.nan)
+
+        frames.append(pd.DataFrame({
+            'group': labels.take(blocks.groups),
+            'metric': metric,
+            'n_gp': blocks.n_gp,
+            'n_paid': blocks.n_paid,
+            'gp_mean': gp_mean,
+            'paid_mean': gp_mean - observed,
+            'lift': observed,
+            'ci_low': low,
+            'ci_high': high,
+            'p_value': np.where(testable, (1 + exceed) / (1 + resamples), np.nan),
+            'cohens_d': blocks.cohens_d(),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def significance_report(df, levels=LEVELS, **kwargs):
+    """lift_significance() for every level, stacked with a `level` column."""
+    frames = [lift_significance(df, by, **kwargs).assign(level=level) for level, by in levels.items()]
+    out = pd.concat(frames, ignore_index=True)
+    return out[['level'] + [c for c in out.columns if c != 'level']]
+
+
+def cached_significance(df, path=SIGNIFICANCE_FILE, resamples=2000, seed=0):
+    """The significance report for `df`, reusing `path` if it was computed from the same inputs.
+
+    Returns (report, reused).
+    """
+    digest = f"{input_digest(df)}-{resamples}-{seed}"
+    if os.path.exists(path):
+        cached = pd.read_csv(path)
+        if len(cached) and 'input_digest' in cached and (cached['input_digest'] == digest).all():
+            return cached.drop(columns='input_digest'), True
+
+    report = significance_report(df, resamples=resamples, seed=seed)
+    report.assign(input_digest=digest).to_csv(path, index=False)
+    return report, False
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bootstrap CIs and permutation p-values for Game Pass lift.")
+    parser.add_argument("--input", default=MERGED_DATASET,
+                        help="Merged game table (typed .feather artifact, falling back to the CSV)")
+    parser.add_argument("--output", default=SIGNIFICANCE_FILE)
+    parser.add_argument("--resamples", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    df = calculate_game_metrics(load_dataset(args.input))
+    report, reused = cached_significance(df, args.output, args.resamples, args.seed)
+    print(report[report['level'] == 'catalog'].to_string(index=False))
+    print(f"{'♻️  Reused' if reused else '✓ Saved'} {args.output}")
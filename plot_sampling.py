@@ -0,0 +1,197 @@
+import numpy as np
+
+# ============================================================================
+# SERVER-SIDE POINT REDUCTION FOR LARGE SCATTER PLOTS
+# ============================================================================
+#
+# A Plotly figure ships every point to the browser as JSON. Above MAX_POINTS,
+# scatters are thinned here before they are sent: the view window is cut into
+# a grid and each occupied cell keeps one point, so sparse regions and
+# outliers keep every point while dense regions collapse. A binned density
+# layer underneath shows how many points each region really holds. Zooming
+# in (a narrower x / y window) re-thins only the points inside it, so detail
+# comes back as the window shrinks.
+#
+# Plotly is only imported by the figure helpers, so the headless analysis
+# CLI can share MAX_POINTS and the index functions without it.
+
+MAX_POINTS = 5000
+
+# Cells per axis of the density layer drawn under a thinned scatter
+DENSITY_BINS = 60
+
+# Trace attributes holding one value per point
+_POINT_ATTRS = ('x', 'y', 'text', 'hovertext', 'customdata', 'ids')
+_MARKER_ATTRS = ('size', 'color', 'symbol', 'opacity')
+
+
+def _window(values, limits):
+    """(lo, hi) of `limits`, or of the finite `values` when no limits are given."""
+    if limits is not None:
+        return float(limits[0]), float(limits[1])
+    if len(values) == 0:
+        return 0.0, 1.0
+    return float(values.min()), float(values.max())
+
+
+def _cells(values, grid, limits):
+    lo, hi = limits
+    span = (hi - lo) or 1.0
+    return np.clip(((values - lo) / span * grid).astype(np.int64), 0, grid - 1)
+
+
+def in_window(x, y, x_range=None, y_range=None):
+    """Mask of points with finite coordinates inside the x / y ranges."""
+    mask = np.isfinite(x) & np.isfinite(y)
+    if x_range is not None:
+        mask &= (x >= x_range[0]) & (x <= x_range[1])
+    if y_range is not None:
+        mask &= (y >= y_range[0]) & (y <= y_range[1])
+    return mask
+
+
+def thin_indices(x, y, max_points=MAX_POINTS, x_range=None, y_range=None):
+    """Positions of the points to draw, in their original order.
+
+    All points in the window are kept while there are at most `max_points`
+    of them; otherwise one per cell of a grid with at most `max_points` cells.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if x_range is None and y_range is None and len(x) <= max_points:
+        return np.arange(len(x))
+
+    idx = np.flatnonzero(in_window(x, y, x_range, y_range))
+    if len(idx) <= max_points:
+        return idx
+
+    xs, ys = x[idx], y[idx]
+    x_limits, y_limits = _window(xs, x_range), _window(ys, y_range)
+
+    def one_per_cell(grid):
+        cell = _cells(xs, grid, x_limits) * grid + _cells(ys, grid, y_limits)
+        return np.unique(cell, return_index=True)[1]
+
+    # A grid of max_points cells can't overflow the budget, but when the
+    # points are clumped most of its cells are empty; refine while the finer
+    # grid still fits
+    grid = max(int(np.sqrt(max_points)), 1)
+    first = one_per_cell(grid)
+    while 2 * len(first) < max_points and grid < 2 ** 15:
+        finer = one_per_cell(grid * 2)
+        if len(finer) > max_points:
+            break
+        grid, first = grid * 2, finer
+    return idx[np.sort(first)]
+
+
+def lttb_indices(x, y, max_points=MAX_POINTS):
+    """Largest-Triangle-Three-Buckets picks for a line sorted by `x`.
+
+    Keeps the first and last points and, from each of `max_points - 2` equal
+    buckets in between, the point forming the largest triangle with the
+    previous pick and the next bucket's mean, so peaks and dips survive.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n <= max_points or max_points < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    keep = np.empty(max_points, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    prev = 0
+    for b in range(max_points - 2):
+        lo, hi = edges[b], edges[b + 1]
+        nxt_lo, nxt_hi = hi, edges[b + 2] if b + 2 < len(edges) else n
+        nx, ny = x[nxt_lo:nxt_hi].mean(), y[nxt_lo:nxt_hi].mean()
+        area = np.abs((x[prev] - nx) * (y[lo:hi] - y[prev]) - (x[prev] - x[lo:hi]) * (ny - y[prev]))
+        prev = lo + int(np.argmax(area))
+        keep[b + 1] = prev
+    return keep
+
+
+def _xy_traces(fig, markers):
+    """Scatter traces with point data: marker traces if `markers`, else line-only ones."""
+    return [
+        t for t in fig.data
+        if t.type in ('scatter', 'scattergl') and t.x is not None
+        and ('markers' in (t.mode or 'markers')) == markers
+    ]
+
+
+def _take(trace, keep, n):
+    """Restrict every per-point array of `trace` to positions `keep`."""
+    for attr in _POINT_ATTRS:
+        values = trace[attr]
+        if values is not None and not isinstance(values, str) and np.ndim(values) > 0 and len(values) == n:
+            trace[attr] = np.asarray(values)[keep]
+    for attr in _MARKER_ATTRS:
+        values = trace.marker[attr]
+        if values is not None and not isinstance(values, str) and np.ndim(values) > 0 and len(values) == n:
+            trace.marker[attr] = np.asarray(values)[keep]
+
+
+def density_trace(x, y, x_range, y_range, bins=DENSITY_BINS):
+    """Heatmap of point counts over the window; empty cells are left transparent."""
+    import plotly.graph_objects as go
+
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins, range=[x_range, y_range])
+    z = np.where(counts > 0, counts, np.nan).T
+    return go.Heatmap(
+        z=z,
+        x=(x_edges[:-1] + x_edges[1:]) / 2,
+        y=(y_edges[:-1] + y_edges[1:]) / 2,
+        colorscale='Greys',
+        opacity=0.45,
+        showscale=False,
+        hovertemplate='%{z:.0f} points<extra></extra>',
+        name='density',
+    )
+
+
+def thin_figure(fig, max_points=MAX_POINTS, x_range=None, y_range=None):
+    """Copy of `fig` with its marker traces thinned to about `max_points` in total.
+
+    Marker traces share the budget in proportion to their size. Line traces
+    (e.g. trendlines, fit on the full data) are cut to `max_points` each with
+    LTTB. When markers are dropped, a density layer over all of them goes
+    underneath. Returns (figure, markers drawn, markers in the window).
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure(fig)
+    for line in _xy_traces(fig, markers=False):
+        n = len(line.x)
+        if n > max_points:
+            _take(line, lttb_indices(line.x, line.y, max_points), n)
+
+    traces = _xy_traces(fig, markers=True)
+    coords = [
+        (np.asarray(t.x, dtype=np.float64), np.asarray(t.y, dtype=np.float64))
+        for t in traces
+    ]
+    masks = [in_window(x, y, x_range, y_range) for x, y in coords]
+    total = int(sum(m.sum() for m in masks))
+
+    if x_range is not None:
+        fig.update_xaxes(range=list(x_range))
+    if y_range is not None:
+        fig.update_yaxes(range=list(y_range))
+    if total <= max_points and x_range is None and y_range is None:
+        return fig, total, total
+
+    drawn = 0
+    for trace, (x, y), mask in zip(traces, coords, masks):
+        budget = max(int(max_points * mask.sum() / total), 1) if total else 1
+        keep = thin_indices(x, y, budget, x_range, y_range)
+        _take(trace, keep, len(x))
+        drawn += len(keep)
+
+    if drawn < total:
+        all_x = np.concatenate([x[m] for (x, _), m in zip(coords, masks)])
+        all_y = np.concatenate([y[m] for (_, y), m in zip(coords, masks)])
+        fig.add_trace(density_trace(all_x, all_y, _window(all_x, x_range), _window(all_y, y_range)))
+        fig.data = (fig.data[-1],) + fig.data[:-1]
+    return fig, drawn, total
@@ -1,82 +1,410 @@
+import argparse
 import json
+import numpy as np
 import pandas as pd
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 from datetime import datetime
 import os
+from itertools import chain, compress, repeat
+from operator import itemgetter
+
+from game_schema import LAZY_TEXT_COLUMNS, apply_schema, eager_columns, memory_mb
+from product_extractor import is_raw_product, tidy_product, tidy_products
+from title_index import TitleIndex
 
 # ============================================================================
 # CONVERT RAW XBOX JSON TO TIDY FORMAT FOR ANALYSIS
 # ============================================================================
 
-def prepare_games_dataset(json_file):
-    """Convert raw Xbox API JSON to analysis-ready format."""
-    
-    with open(json_file, 'r') as f:
-        games = json.load(f)
-    
-    prepared_games = []
-    
+class _JsonStream:
+    """Incremental reader over a JSON text file with a bounded buffer."""
+
+    def __init__(self, f, buffer_size):
+        self._f = f
+        self._buffer_size = buffer_size
+        self._decoder = json.JSONDecoder()
+        self.name = getattr(f, 'name', 'input')
+        self.buf = f.read(buffer_size)
+        self.eof = not self.buf
+        self.pos = 0
+
+    def _more(self):
+        """Append the next block, dropping consumed text so the buffer doesn't grow with the file."""
+        more = self._f.read(self._buffer_size)
+        self.eof = not more
+        self.buf, self.pos = self.buf[self.pos:] + more, 0
+
+    def peek(self, separators=''):
+        """Next significant character (skipping whitespace and `separators`), or '' at end of file."""
+        while True:
+            while self.pos < len(self.buf) and (self.buf[self.pos].isspace() or self.buf[self.pos] in separators):
+                self.pos += 1
+            if self.pos < len(self.buf) or self.eof:
+                return self.buf[self.pos] if self.pos < len(self.buf) else ''
+            self._more()
+
+    def expect(self, char, separators=''):
+        found = self.peek(separators)
+        if found != char:
+            raise ValueError(f"{self.name}: expected {char!r}, found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        if not self.peek():
+            raise ValueError(f"Unexpected end of file in {self.name}")
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+                # A value ending exactly at the buffer edge may be truncated
+                if end == len(self.buf) and not self.eof:
+                    raise json.JSONDecodeError("Truncated value", self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self._more()
+                continue
+            self.pos = end
+            if self.pos > self._buffer_size:
+                self.buf, self.pos = self.buf[self.pos:], 0
+            return value
+
+    def items(self):
+        """Yield the elements of the array whose '[' was just consumed."""
+        while True:
+            char = self.peek(',')
+            if char == ']':
+                self.pos += 1
+                return
+            if not char:
+                raise ValueError(f"Unexpected end of file in {self.name}")
+            yield self.value()
+
+
+def iter_raw_games(json_file, buffer_size=1 << 16):
+    """Yield games one at a time from a raw Xbox API JSON file.
+
+    The file can be a JSON array of games/products or a displaycatalog
+    `{"Products": [...]}` response, whose `Products` member is streamed. Only
+    `buffer_size` characters (plus the game currently being decoded) are held
+    in memory, so large catalog snapshots never need a full `json.load`.
+    """
+    with open(json_file, 'r', encoding='utf-8') as f:
+        stream = _JsonStream(f, buffer_size)
+        first = stream.peek()
+
+        if first == '[':
+            stream.pos += 1
+            yield from stream.items()
+            return
+
+        if first != '{':
+            raise ValueError(f"{json_file} is not a JSON array or a Products response")
+        stream.pos += 1
+
+        while stream.peek(',') not in ('}', ''):
+            key = stream.value()
+            stream.expect(':')
+            if key == 'Products':
+                stream.expect('[')
+                yield from stream.items()
+                return
+            stream.value()  # Skip other members (paging info etc.)
+
+
+def _tidy_raw(games):
+    """Pass tidy records through; raw displaycatalog products are tidied on the way.
+
+    Malformed products are skipped with a warning, like tidy_products, so one
+    bad record doesn't abort a whole stream.
+    """
+    for game in games:
+        if not is_raw_product(game):
+            yield game
+            continue
+        try:
+            tidy = tidy_product(game)
+        except (KeyError, IndexError) as e:
+            print(f"Warning: Skipped {game.get('ProductId', 'Unknown')}: {e}")
+            continue
+        yield tidy
+
+
+def _prepare_game(game):
+    """Flatten one raw game record into the analysis row format."""
+    # Extract ratings safely
+    r7 = game.get('rating_7_days', {})
+    r30 = game.get('rating_30_days', {})
+    r_all = game.get('rating_all_time', {})
+
+    return {
+        "product_id": game.get('product_id'),
+        "title": game.get('title'),
+        "publisher": game.get('publisher', 'Unknown'),
+        "developer": game.get('developer', 'Unknown'),
+        "short_description": game.get('short_description', ''),
+
+        # Category/Genre (will be "Unknown" - can enrich later)
+        "category": game.get('category', 'unkown'),
+
+        # Release & GP dates
+        "original_release_date": game.get('release_date'),
+        "gamepass_added_date": None,  # Not in this dataset
+
+        # Rating counts (7-day, 30-day, all-time)
+        "rating_7_days_count": r7.get('RatingCount', 0),
+        "rating_30_days_count": r30.get('RatingCount', 0),
+        "rating_alltime_count": r_all.get('RatingCount', 0),
+
+        # Average ratings
+        "rating_7_days_avg": r7.get('AverageRating', 0),
+        "rating_30_days_avg": r30.get('AverageRating', 0),
+        "rating_alltime_avg": r_all.get('AverageRating', 0),
+
+        # Rating play counts
+        "Rating_play_count_7_days": r7.get('PlayCount', 0),
+        "Rating_play_count_30_days": r30.get('PlayCount', 0),
+        "Rating_play_count_alltime": r_all.get('PlayCount', 0),
+
+        # GamePass status
+        "has_gamepass_remediation": game.get('has_gamepass_remediation', False),
+
+        # Pricing (extract first non-zero price)
+        "current_price": next(
+            (p.get('list_price', 0) for p in game.get('prices', []) if p.get('list_price', 0) > 0),
+            0
+        ),
+    }
+
+
+# Rating windows in the raw dump and the suffix each one gets in the prepared frame
+RATING_WINDOWS = {
+    'rating_7_days': '7_days',
+    'rating_30_days': '30_days',
+    'rating_all_time': 'alltime',
+}
+
+PREPARED_COLUMNS = list(_prepare_game({}))
+
+
+# Top-level fields copied as-is, with the default the row-wise path uses
+TEXT_FIELDS = (
+    ('product_id', None),
+    ('title', None),
+    ('publisher', 'Unknown'),
+    ('developer', 'Unknown'),
+    ('short_description', ''),
+    ('category', 'unkown'),
+    ('release_date', None),
+    ('has_gamepass_remediation', False),
+)
+RATING_FIELDS = ('RatingCount', 'AverageRating', 'PlayCount')
+
+
+def _field_lists(records, fields):
+    """One list per (key, default) in `fields`, pulled out of every dict in `records`.
+
+    All keys come out in one C-level itemgetter pass; if any record lacks
+    one, each key gets its own dict.get pass with its default instead.
+    """
+    if not records:
+        return [[] for _ in fields]
+    try:
+        rows = list(map(itemgetter(*(key for key, _ in fields)), records))
+    except KeyError:
+        return [list(map(dict.get, records, repeat(key), repeat(default))) for key, default in fields]
+    return [list(column) for column in zip(*rows)] if len(fields) > 1 else [rows]
+
+
+def _float_matrix(records, fields):
+    """`fields` (default 0) of every dict in `records` as an (n, len(fields)) float64 array; nulls become NaN."""
+    columns = _field_lists(records, [(field, 0) for field in fields])
+    return np.array(columns, dtype=np.float64).T.reshape(len(records), len(fields))
+
+
+def extract_game_columns(games):
+    """Flatten raw game records into typed column arrays.
+
+    The text fields and each rating window's counts/averages are pulled out
+    in a single itemgetter pass apiece. Prices go into a flat (owner,
+    list_price) table, so the first non-zero price per game is one
+    vectorized reduction instead of a generator per game. Games the row-wise
+    path would reject (non-dict ratings, null prices reached before a
+    positive one) are dropped the same way.
+
+    Returns a dict of columns plus the titles of skipped games.
+    """
+    n = len(games)
+    skipped = np.zeros(n, dtype=bool)
+    empty = {}
+
+    # Count, average and play count arrays for each rating window
+    blocks = []
+    for key in RATING_WINDOWS:
+        windows = list(map(dict.get, games, repeat(key), repeat(empty)))
+        if set(map(type, windows)) - {dict}:
+            bad = [i for i, r in enumerate(windows) if type(r) is not dict]
+            skipped[bad] = True
+            for i in bad:
+                windows[i] = empty
+        blocks.append(_float_matrix(windows, RATING_FIELDS))
+    rating_matrix = np.hstack(blocks) if n else np.empty((0, 3 * len(RATING_WINDOWS)))
+
+    # Flatten every price entry into a (owner, list_price) table
+    game_prices = list(map(dict.get, games, repeat('prices'), repeat([])))
+    if None in game_prices:
+        skipped[[i for i, ps in enumerate(game_prices) if ps is None]] = True
+        game_prices = [ps or [] for ps in game_prices]
+    lengths = np.fromiter(map(len, game_prices), dtype=np.int64, count=n)
+    owner = np.repeat(np.arange(n, dtype=np.int64), lengths)
+    entries = list(chain.from_iterable(game_prices))
+    try:
+        price = np.array(list(map(dict.get, entries, repeat('list_price'), repeat(0))), dtype=np.float64)
+    except TypeError:
+        # Non-dict entries (or nulls inside them) make the game unusable, like the row-wise path
+        price = np.array([p.get('list_price', 0) if type(p) is dict else None for p in entries], dtype=np.float64)
+
+    # First non-zero price per game: prices are grouped by owner in input
+    # order, so the first "hit" (positive or unusable) per owner decides it.
+    bad = np.isnan(price)
+    hit = np.flatnonzero((price > 0) | bad)
+    first_owner, first_at = np.unique(owner[hit], return_index=True)
+    first = hit[first_at]
+    current_price = np.zeros(n, dtype=np.float64)
+    current_price[first_owner] = price[first]
+    skipped[first_owner[bad[first]]] = True
+
+    keep = ~skipped
+    product_id, title, publisher, developer, description, category, release, gamepass = _field_lists(games, TEXT_FIELDS)
+
+    def kept(values):
+        return list(compress(values, keep)) if skipped.any() else values
+
+    def counts(values):
+        values = values[keep]
+        return values.astype(np.int64) if not np.isnan(values).any() else values
+
+    columns = {
+        "product_id": kept(product_id),
+        "title": kept(title),
+        "publisher": kept(publisher),
+        "developer": kept(developer),
+        "short_description": kept(description),
+        "category": kept(category),
+        "original_release_date": kept(release),
+        "gamepass_added_date": [None] * int(keep.sum()),
+    }
+    for w, suffix in enumerate(RATING_WINDOWS.values()):
+        columns[f"rating_{suffix}_count"] = counts(rating_matrix[:, 3 * w])
+    for w, suffix in enumerate(RATING_WINDOWS.values()):
+        columns[f"rating_{suffix}_avg"] = rating_matrix[keep, 3 * w + 1]
+    for w, suffix in enumerate(RATING_WINDOWS.values()):
+        columns[f"Rating_play_count_{suffix}"] = counts(rating_matrix[:, 3 * w + 2])
+    columns["has_gamepass_remediation"] = kept(gamepass)
+    columns["current_price"] = current_price[keep]
+
+    return columns, list(compress(title, skipped))
+
+
+def _frame_from_rows(games, start=0):
+    """Build a prepared frame with the original per-game dict loop."""
+    rows = []
     for game in games:
         try:
-            # Extract ratings safely
-            r7 = game.get('rating_7_days', {})
-            r30 = game.get('rating_30_days', {})
-            r_all = game.get('rating_all_time', {})
-            
-            prepared_game = {
-                "product_id": game.get('product_id'),
-                "title": game.get('title'),
-                "publisher": game.get('publisher', 'Unknown'),
-                "developer": game.get('developer', 'Unknown'),
-                "short_description": game.get('short_description', ''),
-                
-                # Category/Genre (will be "Unknown" - can enrich later)
-                "category": game.get('category', 'unkown'),
-                
-                # Release & GP dates
-                "original_release_date": game.get('release_date'),
-                "gamepass_added_date": None,  # Not in this dataset
-                
-                # Rating counts (7-day, 30-day, all-time)
-                "rating_7_days_count": r7.get('RatingCount', 0),
-                "rating_30_days_count": r30.get('RatingCount', 0),
-                "rating_alltime_count": r_all.get('RatingCount', 0),
-                
-                # Average ratings
-                "rating_7_days_avg": r7.get('AverageRating', 0),
-                "rating_30_days_avg": r30.get('AverageRating', 0),
-                "rating_alltime_avg": r_all.get('AverageRating', 0),
-                
-                # Rating play counts
-                "Rating_play_count_7_days": r7.get('PlayCount', 0),
-                "Rating_play_count_30_days": r30.get('PlayCount', 0),
-                "Rating_play_count_alltime": r_all.get('PlayCount', 0),
-
-                # GamePass status
-                "has_gamepass_remediation": game.get('has_gamepass_remediation', False),
-                
-                # Pricing (extract first non-zero price)
-                "current_price": next(
-                    (p.get('list_price', 0) for p in game.get('prices', []) if p.get('list_price', 0) > 0),
-                    0
-                ),
-            }
-            prepared_games.append(prepared_game)
-            
+            rows.append(_prepare_game(game))
         except Exception as e:
             print(f"Warning: Skipped {game.get('title', 'Unknown')}: {e}")
+
+    if not rows:
+        return pd.DataFrame(columns=PREPARED_COLUMNS)
+    return pd.DataFrame(rows, index=pd.RangeIndex(start, start + len(rows)))
+
+
+def _frame_from_columns(games, start=0):
+    """Build a prepared frame through the columnar extraction path."""
+    columns, skipped = extract_game_columns(games)
+    for title in skipped:
+        print(f"Warning: Skipped {title if title is not None else 'Unknown'}: malformed rating or price data")
+
+    n = len(columns["product_id"])
+    return pd.DataFrame(columns, index=pd.RangeIndex(start, start + n))
+
+
+def _filter_active(df):
+    """Drop games with zero ratings (not yet released/no engagement)."""
+    return df[
+        (df['rating_alltime_count'] > 0) |
+        (df['rating_7_days_count'] > 0) |
+        (df['rating_30_days_count'] > 0)
+    ].copy()
+
+
+def _prepare_games_chunked(games, chunk_size, columnar=True):
+    """Build the active-games frame from an iterable of games in fixed-size chunks.
+
+    Each chunk is turned into a DataFrame and filtered before the next one is
+    read, so peak memory is bounded by `chunk_size` rather than the snapshot.
+    Returns the filtered frame and the total number of prepared games.
+    """
+    build = _frame_from_columns if columnar else _frame_from_rows
+    chunks = []
+    batch = []
+    total = 0
+
+    def flush():
+        nonlocal total
+        chunk = build(batch, start=total)
+        total += len(chunk)
+        chunks.append(_filter_active(chunk))
+        batch.clear()
+
+    for game in games:
+        batch.append(game)
+        if len(batch) >= chunk_size:
+            flush()
+
+    if batch:
+        flush()
+    if not chunks:
+        return pd.DataFrame(columns=PREPARED_COLUMNS), total
+
+    return pd.concat(chunks), total
+
+
+def prepare_games_dataset(json_file, stream=False, chunk_size=50_000, columnar=True):
+    """Convert raw Xbox API JSON to analysis-ready format.
+
+    With `stream=True` the file is parsed incrementally and the frame is built
+    `chunk_size` games at a time, keeping memory flat for large snapshots.
+    `columnar=False` falls back to the original per-game dict loop. Raw
+    displaycatalog products (or a whole `{"Products": [...]}` response) are
+    tidied with product_extractor first.
+    """
+    if stream:
+        df_active, total = _prepare_games_chunked(_tidy_raw(iter_raw_games(json_file)), chunk_size, columnar)
+        df_active['original_release_date'] = pd.to_datetime(df_active['original_release_date'], errors='coerce')
+
+        print(f"📊 Prepared {len(df_active)} games with engagement data")
+        print(f"   (Excluded {total - len(df_active)} games with zero ratings)")
+
+        return df_active
+
+    with open(json_file, 'r') as f:
+        games = json.load(f)
+    if isinstance(games, dict):
+        games = tidy_products(games)
+    elif any(is_raw_product(g) for g in games):
+        games = list(_tidy_raw(games))
     
     # Create DataFrame
-    df = pd.DataFrame(prepared_games)
+    df = _frame_from_columns(games) if columnar else _frame_from_rows(games)
     
     # Convert dates
     df['original_release_date'] = pd.to_datetime(df['original_release_date'], errors='coerce')
     
     # Filter out games with zero ratings (not yet released/no engagement)
-    df_active = df[
-        (df['rating_alltime_count'] > 0) | 
-        (df['rating_7_days_count'] > 0) | 
-        (df['rating_30_days_count'] > 0)
-    ].copy()
+    df_active = _filter_active(df)
     
     print(f"📊 Prepared {len(df_active)} games with engagement data")
     print(f"   (Excluded {len(df) - len(df_active)} games with zero ratings)")
@@ -94,34 +422,171 @@ def create_tidy_json(df, output_file):
     return output_file
 
 
-def merge_genre_from_csv(df, csv_file, left_key='title', right_key_candidates=('Game', 'title', 'Title')):
+# Column types for the binary prepared artifact; anything not listed keeps
+# whatever pandas inferred.
+PREPARED_DTYPES = {
+    "rating_7_days_count": "float64",
+    "rating_30_days_count": "float64",
+    "rating_alltime_count": "float64",
+    "rating_7_days_avg": "float64",
+    "rating_30_days_avg": "float64",
+    "rating_alltime_avg": "float64",
+    "Rating_play_count_7_days": "float64",
+    "Rating_play_count_30_days": "float64",
+    "Rating_play_count_alltime": "float64",
+    "current_price": "float64",
+    "has_gamepass_remediation": "bool",
+}
+PREPARED_DATE_COLUMNS = ("original_release_date", "gamepass_added_date")
+
+
+def _typed_frame(df):
+    """Coerce the prepared frame to real datetime/bool/float columns."""
+    df = df.copy()
+    for col in PREPARED_DATE_COLUMNS:
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col], errors='coerce', utc=True)
+    for col, dtype in PREPARED_DTYPES.items():
+        if col not in df.columns:
+            continue
+        if dtype == "bool":
+            df[col] = df[col].fillna(False).astype(bool)
+        else:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype(dtype)
+    return df
+
+
+def save_prepared_dataset(df, output_file):
+    """Save the prepared frame as a typed columnar file (.feather or .parquet).
+
+    Feather is written uncompressed so `load_dataset` can memory-map it.
+    """
+    df = _typed_frame(df).reset_index(drop=True)
+
+    if output_file.endswith('.parquet'):
+        df.to_parquet(output_file, index=False)
+    else:
+        feather.write_feather(df, output_file, compression='uncompressed')
+
+    print(f"✓ Saved {len(df)} games to {output_file}")
+    return output_file
+
+
+# The merged game table the analysis reads; the CSV is its text fallback
+MERGED_DATASET = "xbox_final_merged_data.feather"
+ARTIFACT_SUFFIXES = ('.feather', '.parquet')
+
+
+def dataset_path(path):
+    """The file `load_dataset` actually reads for `path`.
+
+    A CSV resolves to its typed .feather/.parquet sibling when one exists
+    and is at least as new as the CSV (see `convert_dataset`). An artifact
+    path that hasn't been written yet falls back to its .csv sibling.
+    """
+    stem, ext = os.path.splitext(path)
+    if ext == '.csv':
+        for suffix in ARTIFACT_SUFFIXES:
+            artifact = stem + suffix
+            if os.path.exists(artifact) and (not os.path.exists(path) or
+                                             os.path.getmtime(artifact) >= os.path.getmtime(path)):
+                return artifact
+    elif ext in ARTIFACT_SUFFIXES and not os.path.exists(path) and os.path.exists(stem + '.csv'):
+        return stem + '.csv'
+    return path
+
+
+def _dataset_columns(path):
+    if path.endswith('.feather'):
+        return feather.read_table(path, memory_map=True).column_names
+    if path.endswith('.parquet'):
+        return pq.read_schema(path).names
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def load_dataset(path, columns=None, text=False, report=False, resolve=True):
+    """Load a prepared/merged dataset from Feather, Parquet or CSV.
+
+    Feather files are memory-mapped and come back with their stored types, so
+    no string-to-number or date coercion happens on reload. With `resolve`,
+    `path` goes through `dataset_path`, so a CSV with an up-to-date typed
+    artifact is read from the artifact and a missing artifact falls back to
+    the CSV. Columns are cast to the declared game_schema types; long free
+    text (short_description, notes, ...) is only read when listed in
+    `columns` or with `text=True` (see `load_text`). With `report`, the
+    memory before and after the cast is printed.
+    """
+    if resolve:
+        path = dataset_path(path)
+    if columns is None and not text:
+        columns = eager_columns(_dataset_columns(path))
+
+    if path.endswith('.feather'):
+        table = feather.read_table(path, columns=columns, memory_map=True)
+        df = table.to_pandas(split_blocks=True)
+    elif path.endswith('.parquet'):
+        df = pd.read_parquet(path, columns=columns, memory_map=True)
+    else:
+        df = pd.read_csv(path, usecols=columns)
+
+    before = memory_mb(df) if report else None
+    apply_schema(df)
+    if report:
+        deferred = len(_dataset_columns(path)) - len(df.columns)
+        print(f"💾 {os.path.basename(path)}: {before:.2f} MB as read -> {memory_mb(df):.2f} MB typed "
+              f"({len(df.columns)} columns, {deferred} deferred)")
+    return df
+
+
+def convert_dataset(csv_file, output_file=None):
+    """Write the typed Feather (or Parquet) artifact `load_dataset` prefers over `csv_file`.
+
+    Every column is kept, already cast to the game_schema types, so the
+    reload is a memory map with no parsing.
+    """
+    output_file = output_file or os.path.splitext(csv_file)[0] + '.feather'
+    df = load_dataset(csv_file, text=True, resolve=False).reset_index(drop=True)
+
+    if output_file.endswith('.parquet'):
+        df.to_parquet(output_file, index=False)
+    else:
+        feather.write_feather(df, output_file, compression='uncompressed')
+
+    print(f"✓ Converted {len(df)} rows of {csv_file} to {output_file}")
+    return output_file
+
+
+def load_text(path, columns=LAZY_TEXT_COLUMNS):
+    """The long text columns `load_dataset` skipped, on the same row index (join them back on)."""
+    path = dataset_path(path)
+    available = _dataset_columns(path)
+    return load_dataset(path, columns=[c for c in columns if c in available], resolve=False)
+
+
+# Sheet fields the analysis actually uses from the Game Pass master list
+SHEET_COLUMNS = ('Genre', 'Added', 'Release', 'ESRB')
+
+
+def merge_genre_from_csv(df, csv_file, left_key='title', right_key_candidates=('Game', 'title', 'Title'),
+                         columns=None, **read_csv_kwargs):
     """Left-join additional metadata (genre/publisher etc.) from a CSV onto the prepared df.
 
     - `left_key` is the column in `df` (defaults to 'title').
     - `right_key_candidates` are column names to try in the CSV for the game/title column.
+    - `columns` limits which CSV columns are brought across (e.g. SHEET_COLUMNS); None keeps all.
+
+    Matching goes through a cached TitleIndex, so the CSV is parsed and its
+    titles normalized once per file version rather than on every call.
     """
     if not os.path.exists(csv_file):
         print(f"→ Merge source not found: {csv_file}")
         return df
 
-    other = pd.read_csv(csv_file)
-
-    # Try to find the matching key in the CSV
-    right_key = None
-    for k in right_key_candidates:
-        if k in other.columns:
-            right_key = k
-            break
-
-    if right_key is None:
-        print(f"→ No suitable title column found in {csv_file}. Columns: {list(other.columns)[:10]}")
+    index = TitleIndex.from_csv(csv_file, right_key_candidates, **read_csv_kwargs)
+    if index is None:
         return df
 
-    # Normalize keys for more robust exact matching
-    df['_merge_key'] = df[left_key].astype(str).str.strip().str.lower()
-    other['_merge_key'] = other[right_key].astype(str).str.strip().str.lower()
-
-    merged = df.merge(other, on='_merge_key', how='left', suffixes=(None, '_src'))
+    merged = index.enrich(df, left_key=left_key, columns=columns)
 
     # If the CSV contains a genre or category column, prefer it
     if 'category' in merged.columns:
@@ -131,9 +596,7 @@ def merge_genre_from_csv(df, csv_file, left_key='title', right_key_candidates=('
     elif 'genre' in merged.columns:
         merged['category'] = merged['genre']
 
-    # Clean up helper column
-    merged = merged.drop(columns=['_merge_key'])
-    print(f"✓ Merged metadata from {csv_file} (matched on '{right_key}')")
+    print(f"✓ Merged metadata from {csv_file} (matched on '{index.right_key}')")
     return merged
 
 # ============================================================================
@@ -141,12 +604,26 @@ def merge_genre_from_csv(df, csv_file, left_key='title', right_key_candidates=('
 # ============================================================================
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prepare the raw Xbox API dump for analysis.")
+    parser.add_argument("--input", default="xbox_data_20251224_1937.json", help="Raw Xbox API JSON dump")
+    parser.add_argument("--output", default="xbox_prepared.feather", help="Typed columnar output (.feather or .parquet)")
+    parser.add_argument("--stream", action="store_true", help="Parse the dump incrementally with bounded memory")
+    parser.add_argument("--json", action="store_true", help="Also export xbox_tidy.json")
+    parser.add_argument("--csv", action="store_true", help="Also export xbox_prepared.csv")
+    parser.add_argument("--convert", metavar="CSV", default=None,
+                        help="Only write the typed .feather artifact for an existing CSV (e.g. the merged table)")
+    args = parser.parse_args()
+
+    if args.convert:
+        convert_dataset(args.convert)
+        parser.exit()
+
     # Step 1: Prepare the data
     print("=" * 80)
     print("PREPARING XBOX DATA FOR ANALYSIS")
     print("=" * 80)
     
-    df = prepare_games_dataset("xbox_data_20251224_1937.json")
+    df = prepare_games_dataset(args.input, stream=args.stream)
     
     print("\n📈 Dataset Summary:")
     print(f"   Total Games: {len(df)}")
@@ -157,20 +634,20 @@ if __name__ == "__main__":
     print(f"      Games with 30-day ratings: {(df['rating_30_days_count'] > 0).sum()}")
     print(f"      Games with all-time ratings: {(df['rating_alltime_count'] > 0).sum()}")
     
-    # Step 2: Save as tidy JSON
-    create_tidy_json(df, "xbox_tidy.json")
-    
-    # Step 3: Also save as CSV for quick review
-    df.to_csv("xbox_prepared.csv", index=False)
-    print("✓ Saved to xbox_prepared.csv")
+    # Step 2: Save the typed columnar artifact
+    save_prepared_dataset(df, args.output)
+
+    # Step 3: Optional text exports for quick review
+    if args.json:
+        create_tidy_json(df, "xbox_tidy.json")
+    if args.csv:
+        df.to_csv("xbox_prepared.csv", index=False)
+        print("✓ Saved to xbox_prepared.csv")
     
     print("\n" + "=" * 80)
     print("✅ Data ready! Next steps:")
     print("=" * 80)
-    print("\n1. Update comprehensive_game_analysis.py to use:")
-    print("   tidy_files = ['xbox_tidy.json']")
+    print(f"\n1. Load it with prepare_data.load_dataset('{args.output}')")
     print("\n2. Run: python comprehensive_game_analysis.py")
     print("\n3. Check the output CSV files and PNG visualization!")
     print("=" * 80)
-
-
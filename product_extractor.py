@@ -0,0 +1,121 @@
+import json
+
+# ============================================================================
+# RAW DISPLAYCATALOG PRODUCT -> TIDY RECORD
+# ============================================================================
+
+# UsageData AggregateTimeSpan -> tidy field; the API usually lists them as
+# 7Days, 30Days, AllTime but that order isn't guaranteed
+USAGE_SLOTS = {
+    "7Days": "rating_7_days",
+    "30Days": "rating_30_days",
+    "AllTime": "rating_all_time",
+}
+
+GAME_PASS_MARKER = "Game Pass"
+
+
+def split_usage(usage_data):
+    """Map each UsageData entry to its tidy field in one pass.
+
+    Windows the product has no entry for come back as None.
+    """
+    slots = dict.fromkeys(USAGE_SLOTS.values())
+    for entry in usage_data or ():
+        field = USAGE_SLOTS.get(entry.get("AggregateTimeSpan"))
+        if field is not None:
+            slots[field] = entry
+    return slots
+
+
+def has_gamepass_remediation(localized_properties):
+    """True if any localization offers a Game Pass remediation (stops at the first hit)."""
+    for lp in localized_properties:
+        for r in lp.get("EligibilityProperties", {}).get("Remediations", ()):
+            if GAME_PASS_MARKER in r.get("Description", ""):
+                return True
+    return False
+
+
+def _prices(display_skus):
+    prices = []
+    for sku in display_skus:
+        for a in sku.get("Availabilities", ()):
+            price = a.get("OrderManagementData", {}).get("Price")
+            if price:
+                conditions = a.get("Conditions", {})
+                prices.append({
+                    "list_price": price.get("ListPrice"),
+                    "msrp": price.get("MSRP"),
+                    "start": conditions.get("StartDate"),
+                    "end": conditions.get("EndDate"),
+                })
+    return prices
+
+
+def tidy_product(p):
+    """Flatten one displaycatalog product into the tidy record prepare_data consumes."""
+    localized = p["LocalizedProperties"]
+    lp = localized[0]
+    mp = p["MarketProperties"][0]
+    props = p.get("Properties") or {}
+    usage = split_usage(mp.get("UsageData"))
+
+    return {
+        "product_id": p.get("ProductId"),
+        "title": lp.get("ProductTitle"),
+        "publisher": lp.get("PublisherName"),
+        "developer": lp.get("DeveloperName"),
+        "release_date": mp.get("OriginalReleaseDate"),
+        "short_description": lp.get("ShortDescription"),
+        "rating_all_time": usage["rating_all_time"],
+        "rating_7_days": usage["rating_7_days"],
+        "rating_30_days": usage["rating_30_days"],
+        "bundle_count": len(props.get("BundledSkus", [])),
+        "is_xpa": props.get("XboxXPA", False),
+        "platforms": props.get("SupportedPlatforms", []),
+        "asset_count": len(lp.get("Images", [])) + len(lp.get("Videos", [])) + len(lp.get("CMSVideos", [])),
+        "has_gamepass_remediation": has_gamepass_remediation(localized),
+        "prices": _prices(p.get("DisplaySkuAvailabilities", [])),
+    }
+
+
+def is_raw_product(record):
+    """True for an untouched displaycatalog product rather than a tidy record."""
+    return isinstance(record, dict) and "LocalizedProperties" in record
+
+
+def tidy_products(response):
+    """Tidy every product in a displaycatalog response.
+
+    `response` can be the `{"Products": [...]}` body of a (multi-bigId)
+    request or a plain list of products. Malformed products are skipped with
+    a warning, as the old per-game script did.
+    """
+    products = response.get("Products", []) if isinstance(response, dict) else response
+    games = []
+    for p in products:
+        try:
+            games.append(tidy_product(p))
+        except (KeyError, IndexError) as e:
+            print(f"Warning: Skipped {p.get('ProductId', 'Unknown')}: {e}")
+    return games
+
+
+def rating_stat(game, window, stat, default=None):
+    """One UsageData value (e.g. RatingCount) from a tidy record, or `default` if the window is missing."""
+    entry = game.get(window)
+    return entry.get(stat, default) if isinstance(entry, dict) else default
+
+
+def load_tidy(json_file):
+    """Read a tidy record file, tidying it first if it holds a raw response or product."""
+    with open(json_file, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict) and "Products" in data:
+        return tidy_products(data)
+    if is_raw_product(data):
+        return tidy_product(data)
+    if isinstance(data, list) and any(is_raw_product(g) for g in data):
+        return [tidy_product(g) if is_raw_product(g) else g for g in data]
+    return data
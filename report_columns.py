@@ -0,0 +1,63 @@
+import pandas as pd
+
+# ============================================================================
+# FLAT COLUMN NAMES OF THE REPORT CSVS
+# ============================================================================
+#
+# The report writers (comprehensive_game_analysis) and the legacy-CSV
+# migration (fix_csvs) both name columns through here, so a migrated file
+# ends up with exactly the header a fresh pipeline run writes.
+
+# Flat aggregate name -> report column name, per report (keyed by CSV stem)
+REPORT_RENAMES = {
+    'Genre_performance': {'title_count': 'game_count'},
+    'Genre_gamepass_comparison': {'title_count': 'game_count'},
+    'publisher_performance': {
+        'has_gamepass_remediation_sum': 'gamepass_count',
+        'title_count': 'total_games',
+        'momentum_mean': 'momentum_avg',
+        'discovery_capture_mean': 'discovery_capture_avg',
+        'quality_retention_mean': 'quality_retention_avg',
+    },
+    'publisher_gamepass_efficiency': {},
+}
+
+# Older report versions aggregated under named keys (e.g. game_count: count),
+# which flatten to these names; they map onto the same report columns
+LEGACY_RENAMES = {
+    'Genre_performance': {'game_count_count': 'game_count'},
+    'Genre_gamepass_comparison': {'game_count_count': 'game_count'},
+    'publisher_performance': {'gamepass_count_sum': 'gamepass_count', 'total_games_count': 'total_games'},
+}
+
+
+def normalize_column(name):
+    """Report column name safe for attribute access and CSV headers: no spaces, %, / or parentheses."""
+    return (str(name).strip()
+            .replace(' ', '_')
+            .replace('%', 'pct')
+            .replace('/', '_')
+            .replace('(', '')
+            .replace(')', ''))
+
+
+def flatten_columns(df, rename=None):
+    """Join MultiIndex column levels into flat names, ('momentum', 'mean') -> 'momentum_mean'.
+
+    Empty levels are skipped. `rename` maps flat names to their report
+    names afterwards (e.g. 'title_count' -> 'game_count').
+    """
+    if isinstance(df.columns, pd.MultiIndex):
+        names = ['_'.join(normalize_column(p) for p in col if str(p).strip() != '') for col in df.columns]
+    else:
+        names = [normalize_column(c) for c in df.columns]
+    df.columns = names
+    return df.rename(columns=rename) if rename else df
+
+
+def report_renames(report, legacy=False):
+    """Rename map for `report`; with `legacy`, also the names older versions of it wrote."""
+    renames = dict(REPORT_RENAMES.get(report, {}))
+    if legacy:
+        renames.update(LEGACY_RENAMES.get(report, {}))
+    return renames
@@ -0,0 +1,131 @@
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+import pandas as pd
+
+# ============================================================================
+# PERSISTENT, RESUMABLE STORE FOR PRODUCT-ID SCRAPING
+# ============================================================================
+
+PENDING = "pending"
+FOUND = "found"
+NOT_FOUND = "not_found"
+ERROR = "error"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS titles (
+    game        TEXT PRIMARY KEY,
+    position    INTEGER NOT NULL,
+    state       TEXT NOT NULL DEFAULT 'pending',
+    store_link  TEXT,
+    product_id  TEXT,
+    retries     INTEGER NOT NULL DEFAULT 0,
+    updated_at  TEXT
+);
+CREATE INDEX IF NOT EXISTS titles_state ON titles (state, position);
+"""
+
+
+def classify_result(row):
+    """Map a scraper row (Game/MS_Store_Link/ProductID) to a resolution state."""
+    if row["MS_Store_Link"] == "Error":
+        return ERROR
+    if row["ProductID"] in ("N/A", "ID Not Found") or row["MS_Store_Link"] == "Not Found":
+        return NOT_FOUND
+    return FOUND
+
+
+class ScrapeStore:
+    """SQLite (WAL mode) record of every title's resolution state.
+
+    Titles are seeded once in sheet order. Each run asks for `pending()` and
+    gets only unresolved titles plus errors under the retry limit, so a
+    crashed or interrupted run resumes exactly where it stopped. Results are
+    buffered and written `batch_size` rows per transaction instead of one CSV
+    append per title.
+    """
+
+    def __init__(self, path="xbox_scrape.db", batch_size=25):
+        self.path = path
+        self.batch_size = batch_size
+        self._buffer = []
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+    def add_titles(self, titles):
+        """Seed titles as pending; ones already in the store keep their state."""
+        start = self._conn.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM titles").fetchone()[0]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO titles (game, position) VALUES (?, ?)",
+                ((t, start + i) for i, t in enumerate(dict.fromkeys(titles))),
+            )
+
+    def pending(self, max_retries=3):
+        """Titles still to resolve, in sheet order: never tried, or errored fewer than `max_retries` times."""
+        self.flush()
+        rows = self._conn.execute(
+            "SELECT game FROM titles WHERE state = ? OR (state = ? AND retries < ?) ORDER BY position",
+            (PENDING, ERROR, max_retries),
+        )
+        return [r[0] for r in rows]
+
+    def record(self, row):
+        """Buffer one scraper result; flushed every `batch_size` rows."""
+        state = classify_result(row)
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self._buffer.append((state, row["MS_Store_Link"], row["ProductID"], int(state == ERROR), now, row["Game"]))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE titles SET state = ?, store_link = ?, product_id = ?, "
+                "retries = retries + ?, updated_at = ? WHERE game = ?",
+                self._buffer,
+            )
+        self._buffer.clear()
+
+    def summary(self):
+        """Count of titles per state."""
+        self.flush()
+        return dict(self._conn.execute("SELECT state, COUNT(*) FROM titles GROUP BY state").fetchall())
+
+    def import_csv(self, csv_file):
+        """Load results from a legacy xbox_batch_results/xbox_progress CSV so they aren't re-scraped."""
+        if not os.path.exists(csv_file):
+            return 0
+        legacy = pd.read_csv(csv_file, dtype=str).fillna("N/A")
+        self.add_titles(legacy["Game"])
+        for row in legacy.to_dict("records"):
+            self.record(row)
+        self.flush()
+        return len(legacy)
+
+    def export_csv(self, csv_file):
+        """Write resolved titles in the Game/MS_Store_Link/ProductID layout downstream cells read."""
+        self.flush()
+        df = pd.read_sql_query(
+            "SELECT game AS Game, store_link AS MS_Store_Link, product_id AS ProductID "
+            "FROM titles WHERE state != ? ORDER BY position",
+            self._conn,
+            params=(PENDING,),
+        )
+        df.to_csv(csv_file, index=False)
+        return df
@@ -0,0 +1,204 @@
+import argparse
+import os
+import re
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from comprehensive_game_analysis import add_rating_metrics
+from prepare_data import RATING_WINDOWS, load_dataset, merge_genre_from_csv, prepare_games_dataset
+
+# ============================================================================
+# APPEND-ONLY HISTORY OF USAGEDATA AGGREGATES, PARTITIONED BY SNAPSHOT DATE
+# ============================================================================
+
+HISTORY_DIR = "snapshot_history"
+
+# Game Pass master list; raw dumps take their Genre from it (title row is line 2)
+SHEET_FILE = "GamePass_Games.csv"
+
+# Per-window UsageData columns, named as in the prepared frame
+USAGE_COLUMNS = (
+    [f"rating_{s}_count" for s in RATING_WINDOWS.values()]
+    + [f"rating_{s}_avg" for s in RATING_WINDOWS.values()]
+    + [f"Rating_play_count_{s}" for s in RATING_WINDOWS.values()]
+)
+
+HISTORY_SCHEMA = pa.schema(
+    [
+        ("captured_at", pa.timestamp("s")),
+        ("product_id", pa.string()),
+        ("title", pa.string()),
+        ("publisher", pa.string()),
+        ("Genre", pa.string()),
+        ("has_gamepass_remediation", pa.bool_()),
+    ]
+    + [(col, pa.float64()) for col in USAGE_COLUMNS]
+)
+
+# Hive-style `snapshot_date=YYYY-MM-DD/` directories, read back as a date column
+PARTITIONING = ds.partitioning(pa.schema([("snapshot_date", pa.date32())]), flavor="hive")
+
+# xbox_data_20251224_1937.json -> 2025-12-24 19:37
+_STAMP = re.compile(r"(\d{8})_(\d{4})")
+
+
+def snapshot_time(path):
+    """When a dump was taken: the YYYYMMDD_HHMM stamp in its name, else its mtime."""
+    m = _STAMP.search(os.path.basename(path))
+    if m:
+        return datetime.strptime("".join(m.groups()), "%Y%m%d%H%M")
+    return datetime.fromtimestamp(os.path.getmtime(path)).replace(microsecond=0)
+
+
+def load_snapshot(path, sheet=SHEET_FILE):
+    """Prepared frame for a raw catalog dump (.json) or a prepared/merged dataset.
+
+    Raw dumps carry no Genre, so it is joined on from `sheet` by title, the
+    same way the merged dataset got it.
+    """
+    if path.endswith(".json"):
+        df = prepare_games_dataset(path, stream=True)
+        return merge_genre_from_csv(df, sheet, columns=["Genre"], header=1)
+    return load_dataset(path)
+
+
+def history_table(df, captured_at):
+    """One row per product: identity, grouping keys and its UsageData aggregates."""
+    # Sheet rows can repeat a product; its usage numbers are the same on each
+    df = df.drop_duplicates("product_id")
+    df = df[df["product_id"].notna()]
+    columns = {"captured_at": pd.Series(captured_at, index=df.index)}
+    for field in HISTORY_SCHEMA.names[1:]:
+        if field not in df.columns:
+            columns[field] = pd.Series(pd.NA, index=df.index, dtype="string")
+        elif field == "has_gamepass_remediation":
+            columns[field] = df[field].fillna(False).astype(bool)
+        elif field in USAGE_COLUMNS:
+            columns[field] = pd.to_numeric(df[field], errors="coerce")
+        else:
+            columns[field] = df[field].astype("string")
+    frame = pd.DataFrame(columns).sort_values(["Genre", "publisher", "product_id"], na_position="last")
+    return pa.Table.from_pandas(frame, schema=HISTORY_SCHEMA, preserve_index=False)
+
+
+class SnapshotStore:
+    """Columnar history of every product's rating windows across refreshes.
+
+    Each `append()` writes one new Parquet file under
+    `root/snapshot_date=YYYY-MM-DD/`; existing files are never rewritten, so a
+    second refresh on the same day just adds a later capture. Rows are sorted
+    by Genre, publisher and product_id before writing, so the Parquet
+    row-group statistics let product / Genre / publisher filters skip most of
+    a file, and date ranges skip whole partitions without opening them.
+    """
+
+    def __init__(self, root=HISTORY_DIR):
+        self.root = root
+
+    def append(self, df, captured_at=None, row_group_size=64 * 1024):
+        """Add snapshot `df` (prepared or merged frame) taken at `captured_at` (default now)."""
+        captured_at = pd.Timestamp(captured_at or datetime.now()).floor("s")
+        table = history_table(df, captured_at)
+        if table.num_rows and table.column("Genre").null_count == table.num_rows:
+            print(f"Warning: capture {captured_at} has no Genre; genre filters won't match its rows")
+
+        partition = os.path.join(self.root, f"snapshot_date={captured_at.date().isoformat()}")
+        os.makedirs(partition, exist_ok=True)
+        path = os.path.join(partition, f"part-{captured_at:%H%M%S}-{os.getpid()}.parquet")
+        if os.path.exists(path):
+            raise FileExistsError(f"{path} already holds a capture from {captured_at}")
+        pq.write_table(table, path, row_group_size=row_group_size)
+        return path
+
+    def _dataset(self):
+        return ds.dataset(self.root, format="parquet", schema=self._schema(), partitioning=PARTITIONING)
+
+    @staticmethod
+    def _schema():
+        return HISTORY_SCHEMA.append(pa.field("snapshot_date", pa.date32()))
+
+    def dates(self):
+        """Snapshot dates held in the store, oldest first."""
+        if not os.path.isdir(self.root):
+            return []
+        found = [name.split("=", 1)[1] for name in os.listdir(self.root) if name.startswith("snapshot_date=")]
+        return sorted(pd.Timestamp(d).date() for d in found)
+
+    def history(self, product_ids=None, genres=None, publishers=None, start=None, end=None,
+                columns=None, latest=True):
+        """Rows for the matching products between `start` and `end` (inclusive dates).
+
+        Filters are pushed down to the Parquet scan. With `latest`, only the
+        last capture of each product per snapshot date is kept.
+        """
+        if not self.dates():
+            return pd.DataFrame(columns=self._schema().names)
+
+        expr = None
+
+        def both(a, b):
+            return b if a is None else a & b
+
+        date = ds.field("snapshot_date")
+        if start is not None:
+            expr = both(expr, date >= pa.scalar(pd.Timestamp(start).date(), pa.date32()))
+        if end is not None:
+            expr = both(expr, date <= pa.scalar(pd.Timestamp(end).date(), pa.date32()))
+        for field, values in (("product_id", product_ids), ("Genre", genres), ("publisher", publishers)):
+            if values is not None:
+                values = [values] if isinstance(values, str) else list(values)
+                expr = both(expr, ds.field(field).isin(values))
+
+        if columns is not None:
+            columns = list(dict.fromkeys(["snapshot_date", "captured_at", "product_id"] + list(columns)))
+        df = self._dataset().to_table(columns=columns, filter=expr).to_pandas()
+
+        df = df.sort_values(["product_id", "snapshot_date", "captured_at"], kind="stable")
+        if latest:
+            df = df.drop_duplicates(["product_id", "snapshot_date"], keep="last")
+        return df.reset_index(drop=True)
+
+    def trend(self, metric="momentum", **filters):
+        """`metric` per snapshot date (rows) and product title (columns), from the stored windows."""
+        df = add_rating_metrics(self.history(**filters))
+        label = df["title"].fillna(df["product_id"])
+        return df.assign(label=label).pivot_table(index="snapshot_date", columns="label", values=metric)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Append snapshots to, or query, the rating-window history.")
+    parser.add_argument("--root", default=HISTORY_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    add = sub.add_parser("append", help="Append a raw dump or prepared/merged dataset")
+    add.add_argument("inputs", nargs="+")
+    add.add_argument("--at", default=None, help="Capture time (default: stamp in the file name, else its mtime)")
+    add.add_argument("--sheet", default=SHEET_FILE, help="Master list raw dumps take their Genre from")
+
+    query = sub.add_parser("query", help="Print a metric trend from the stored history")
+    query.add_argument("--product", nargs="*", default=None)
+    query.add_argument("--genre", nargs="*", default=None)
+    query.add_argument("--publisher", nargs="*", default=None)
+    query.add_argument("--start", default=None)
+    query.add_argument("--end", default=None)
+    query.add_argument("--metric", default="momentum")
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.root)
+    if args.command == "append":
+        for path in args.inputs:
+            at = args.at or snapshot_time(path)
+            written = store.append(load_snapshot(path, args.sheet), captured_at=at)
+            print(f"✓ {path} -> {written}")
+    else:
+        trend = store.trend(args.metric, product_ids=args.product, genres=args.genre,
+                            publishers=args.publisher, start=args.start, end=args.end)
+        print(trend.to_string())
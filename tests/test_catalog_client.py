@@ -0,0 +1,86 @@
+import time
+
+import pytest
+
+from catalog_client import CatalogClient, batched, build_raw_dump
+from fixture_servers import CatalogStubServer, make_catalog_product
+from prepare_data import prepare_games_dataset
+
+
+def _products(n, **kwargs):
+    return {f"9FIXTURE{i:04d}": make_catalog_product(f"9FIXTURE{i:04d}", f"Fixture Game {i}", **kwargs)
+            for i in range(n)}
+
+
+def test_batched():
+    assert batched("abcde", 2) == [["a", "b"], ["c", "d"], ["e"]]
+    assert batched([], 3) == []
+
+
+def test_fetches_in_batches_in_input_order():
+    products = _products(53)
+    ids = list(products)[::-1]
+
+    with CatalogStubServer(products) as server:
+        got = CatalogClient(server.products_url, batch_size=20, workers=4, backoff=0).fetch_products(ids + ids[:5])
+
+    assert [p["ProductId"] for p in got] == ids
+    assert sorted(len(b) for b in server.requests) == [13, 20, 20]
+    assert sorted(i for b in server.requests for i in b) == sorted(ids)
+
+
+def test_unknown_ids_are_dropped():
+    products = _products(3)
+
+    with CatalogStubServer(products) as server:
+        got = CatalogClient(server.products_url, backoff=0).fetch_products(["9UNKNOWN0000", *products])
+
+    assert [p["ProductId"] for p in got] == list(products)
+
+
+def test_429_is_retried_after_retry_after():
+    products = _products(10)
+
+    with CatalogStubServer(products, throttle_first=2) as server:
+        got = CatalogClient(server.products_url, batch_size=5, workers=1, backoff=0).fetch_products(products)
+
+    assert len(got) == 10
+    assert len(server.requests) == 2 + 2  # two throttled attempts, then both batches
+
+
+@pytest.mark.parametrize("status", [500, 502, 503])
+def test_5xx_is_retried_with_backoff(status):
+    products = _products(4)
+
+    with CatalogStubServer(products, throttle_first=3, throttle_status=status) as server:
+        start = time.perf_counter()
+        got = CatalogClient(server.products_url, workers=1, backoff=0.05).fetch_products(products)
+        elapsed = time.perf_counter() - start
+
+    assert len(got) == 4 and len(server.requests) == 4
+    assert elapsed >= 0.1  # 0 + 0.05*2 + 0.05*4 seconds of urllib3 backoff
+
+
+def test_batch_that_keeps_failing_is_skipped():
+    products = _products(6)
+
+    with CatalogStubServer(products, throttle_first=3, throttle_status=500) as server:
+        got = CatalogClient(server.products_url, batch_size=3, workers=1, retries=2, backoff=0).fetch_products(products)
+
+    # The first batch exhausts its retries; the second still comes back
+    assert [p["ProductId"] for p in got] == list(products)[3:]
+
+
+def test_dump_round_trips_through_prepare_games_dataset(tmp_path):
+    products = _products(25, r7=0, r30=0, r_all=0)
+    products.update(_products(12))  # the first 12 have ratings; the rest get filtered as inactive
+
+    with CatalogStubServer(products, throttle_first=1) as server:
+        client = CatalogClient(server.products_url, batch_size=10, workers=3, backoff=0)
+        out = build_raw_dump(list(products), str(tmp_path / "raw.json"), client)
+
+    for stream in (False, True):
+        df = prepare_games_dataset(out, stream=stream)
+        assert sorted(df["product_id"]) == sorted(list(products)[:12])
+        assert df["has_gamepass_remediation"].all()
+        assert (df["current_price"] == 29.99).all()
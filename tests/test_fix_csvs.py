@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from comprehensive_game_analysis import (
+    Genre_gamepass_comparison, Genre_performance_analysis, publisher_gamepass_efficiency,
+    publisher_performance_analysis,
+)
+from fix_csvs import migrate_csv
+
+METRICS = ['momentum', 'discovery_capture', 'quality_retention', 'rating_trend_7d_vs_alltime',
+           'rating_7_days_avg', 'rating_30_days_avg', 'rating_alltime_avg',
+           'rating_7_days_count', 'rating_30_days_count', 'rating_alltime_count']
+
+
+@pytest.fixture
+def games():
+    rng = np.random.default_rng(0)
+    n = 80
+    df = pd.DataFrame({m: rng.uniform(0, 100, n) for m in METRICS})
+    df['Genre'] = rng.choice(['Action', 'RPG', 'Puzzle'], n)
+    df['publisher'] = rng.choice(['A', 'B', 'C'], n)
+    df['has_gamepass_remediation'] = rng.random(n) < 0.5
+    df['title'] = [f'Game {i}' for i in range(n)]
+    return df
+
+
+WRITERS = {
+    'Genre_performance': lambda df: Genre_performance_analysis(df),
+    'Genre_gamepass_comparison': lambda df: Genre_gamepass_comparison(df),
+    'publisher_performance': lambda df: publisher_performance_analysis(df)[0],
+    'publisher_gamepass_efficiency': lambda df: publisher_gamepass_efficiency(df),
+}
+
+# The aggregations as the old writers wrote them: MultiIndex columns straight
+# to CSV, some under named keys
+LEGACY = {
+    'Genre_performance': ('Genre', {'momentum': ['median', 'mean'], 'game_count': 'count'}),
+    'Genre_gamepass_comparison': (['Genre', 'has_gamepass_remediation'],
+                                  {'momentum': ['mean', 'std'], 'has_gamepass_remediation': 'sum', 'title': 'count'}),
+    'publisher_performance': ('publisher', {'momentum': ['mean', 'std'], 'discovery_capture': 'mean',
+                                            'gamepass_count': 'sum', 'total_games': 'count'}),
+    'publisher_gamepass_efficiency': (['publisher', 'has_gamepass_remediation'],
+                                      {'momentum': 'mean', 'rating_7_days_avg': ['mean', 'median'],
+                                       'has_gamepass_remediation': 'sum', 'title': 'count'}),
+}
+
+
+@pytest.mark.parametrize('report', list(WRITERS))
+def test_migrated_headers_match_the_writers(games, tmp_path, report):
+    by, spec = LEGACY[report]
+    legacy = games.assign(game_count=games['title'], gamepass_count=games['has_gamepass_remediation'],
+                          total_games=games['title'])
+    path = tmp_path / f'{report}.csv'
+    legacy.groupby(by).agg(spec).to_csv(path)
+
+    migrated = migrate_csv(str(path))
+    written = list(WRITERS[report](games).reset_index().columns)
+
+    assert set(migrated.columns) <= set(written)
+    # Idempotent: a second run leaves the file alone
+    assert migrate_csv(str(path)) is None
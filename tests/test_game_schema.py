@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+
+from game_schema import apply_schema
+
+
+def test_missing_values_stay_missing():
+    df = pd.DataFrame({
+        "Game": pd.Series(["Halo", np.nan], dtype=object),
+        "ProductID": pd.Series([np.nan, "9N7271QN4SGB"], dtype=object),
+        "Genre": ["Shooter", None],
+        "Metacritic": ["87", "tbd"],
+        "has_gamepass_remediation": [True, None],
+    })
+
+    apply_schema(df)
+
+    assert df["Game"].isna().tolist() == [False, True]
+    assert df["ProductID"].dropna().tolist() == ["9N7271QN4SGB"]
+    assert df["Genre"].dtype == "category" and df["Genre"].isna().sum() == 1
+    assert df["Metacritic"].isna().tolist() == [False, True]
+    assert df["has_gamepass_remediation"].tolist() == [True, False]
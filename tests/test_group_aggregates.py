@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from group_aggregates import GroupAggregator
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 500
+    df = pd.DataFrame({
+        "Genre": rng.choice(["Action", "RPG", "Puzzle", None], n),
+        "publisher": rng.choice([f"P{i}" for i in range(12)], n),
+        "has_gamepass_remediation": rng.random(n) < 0.4,
+        "momentum": rng.normal(0.2, 0.1, n),
+        "rating_alltime_count": rng.integers(0, 10_000, n),
+        "tiny": rng.normal(0, 1e-300, n),
+    })
+    df.loc[rng.random(n) < 0.1, "momentum"] = np.nan
+    return df
+
+
+@pytest.mark.parametrize("by", [["Genre"], ["publisher"], ["Genre", "has_gamepass_remediation"], ["has_gamepass_remediation"]])
+def test_agg_matches_groupby(frame, by):
+    spec = {c: ["count", "sum", "mean", "std", "median"] for c in ("momentum", "rating_alltime_count", "tiny")}
+    engine = GroupAggregator(frame, ["Genre", "publisher", "has_gamepass_remediation"])
+
+    got = engine.agg(by, spec)
+    expected = frame.groupby(by).agg(spec)
+
+    pd.testing.assert_index_equal(got.index, expected.index)
+    for column in expected.columns:
+        np.testing.assert_allclose(got[column].to_numpy(float), expected[column].to_numpy(float), rtol=1e-12)
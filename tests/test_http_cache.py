@@ -0,0 +1,124 @@
+import sqlite3
+
+from catalog_client import CatalogClient
+from fixture_servers import CatalogStubServer, make_catalog_product
+from http_cache import CatalogCache, content_hash
+
+
+def _products(n):
+    return {f"9FIXTURE{i:04d}": make_catalog_product(f"9FIXTURE{i:04d}", f"Fixture Game {i}") for i in range(n)}
+
+
+def test_refresh_never_sends_more_requests_than_uncached(tmp_path):
+    products = _products(40)
+    ids = list(products)
+
+    with CatalogStubServer(products) as server, CatalogCache(str(tmp_path / "cache.db"), ttl=3600) as cache:
+        client = CatalogClient(server.products_url, batch_size=10, backoff=0, cache=cache)
+
+        # Cold: every id downloaded in batches
+        assert client.fetch_products(ids) == [products[i] for i in ids]
+        assert len(server.requests) == 4
+
+        # Warm within TTL: no requests at all
+        assert client.fetch_products(ids) == [products[i] for i in ids]
+        assert len(server.requests) == 4
+
+        # Expired: the same 4 batches again as conditional GETs; only the changed one has a body
+        cache.ttl = 0
+        server.products[ids[0]] = make_catalog_product(ids[0], "Renamed Game")
+        got = client.fetch_products(ids)
+        assert len(server.requests) == 8
+        assert all(len(batch) == 10 for batch in server.requests)
+        assert server.not_modified == 3
+        assert got[0]["LocalizedProperties"][0]["ProductTitle"] == "Renamed Game"
+
+        # Stale and unseen ids share batches
+        server.products.update(_products(45))
+        client.fetch_products(list(server.products))
+        assert len(server.requests) == 8 + 5
+
+
+def test_unchanged_expired_batch_is_a_bodiless_304(tmp_path):
+    products = _products(12)
+    ids = list(products)
+
+    with CatalogStubServer(products) as server, CatalogCache(str(tmp_path / "cache.db"), ttl=0) as cache:
+        client = CatalogClient(server.products_url, batch_size=6, workers=1, backoff=0, cache=cache)
+        client.fetch_products(ids)
+        assert [status for status, _ in server.responses] == [200, 200]
+
+        # Same batches, every entry expired, nothing changed on the server
+        assert client.fetch_products(ids) == [products[i] for i in ids]
+        assert server.responses[2:] == [(304, 0), (304, 0)]
+
+        # The 304s reset the TTL of every id in both batches
+        cache.ttl = 3600
+        assert all(e.fresh for e in cache.lookup(ids, "US", "en-US").values())
+
+        # A batch made up differently has no validators yet and gets a full body
+        cache.ttl = 0
+        client.batch_size = 4
+        client.fetch_products(ids)
+        assert [status for status, _ in server.responses[4:]] == [200, 200, 200]
+
+
+def test_store_only_rewrites_changed_products(tmp_path):
+    products = _products(3)
+    a, b, c = products
+
+    with CatalogCache(str(tmp_path / "cache.db"), ttl=0) as cache:
+        cache.store(products.values(), "US", "en-US")
+        cached = cache.lookup(products, "US", "en-US")
+        assert not any(e.fresh for e in cached.values())
+        assert cached[a].content_hash == content_hash(products[a])
+
+        changed = make_catalog_product(b, "Renamed Game")
+        known = {i: e.content_hash for i, e in cached.items()}
+        assert cache.store([products[a], changed, products[c]], "US", "en-US", known) == 2
+
+        assert cache.lookup([b], "US", "en-US")[b].product == changed
+
+
+def test_failed_batch_serves_stale_copies(tmp_path):
+    products = _products(6)
+
+    with CatalogStubServer(products) as server, CatalogCache(str(tmp_path / "cache.db"), ttl=0) as cache:
+        client = CatalogClient(server.products_url, batch_size=3, workers=1, retries=0, backoff=0, cache=cache)
+        client.fetch_products(list(products)[:3])
+
+        server.throttle_first, server.throttle_status = 1, 500
+        got = client.fetch_products(products)
+
+    # The first batch failed and came from the cache; the second was never cached and still arrived
+    assert [p["ProductId"] for p in got] == list(products)
+
+
+def test_lru_eviction(tmp_path):
+    products = _products(20)
+
+    with CatalogCache(str(tmp_path / "cache.db")) as cache:
+        cache.store(products.values(), "US", "en-US")
+        cache.lookup(list(products)[:5], "US", "en-US")  # touch the first five
+
+        cache.max_bytes = cache.stats()["bytes"] // 2
+        evicted = cache.evict()
+        assert 0 < evicted < len(products) and cache.stats()["bytes"] <= cache.max_bytes
+        assert set(cache.lookup(list(products)[:5], "US", "en-US")) == set(list(products)[:5])
+
+
+def test_opens_caches_written_before_content_hashes(tmp_path):
+    path = str(tmp_path / "cache.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE responses (big_id TEXT NOT NULL, market TEXT NOT NULL, language TEXT NOT NULL, "
+        "etag TEXT, last_modified TEXT, body BLOB NOT NULL, size INTEGER NOT NULL, fetched_at REAL NOT NULL, "
+        "accessed_at REAL NOT NULL, PRIMARY KEY (big_id, market, language))"
+    )
+    conn.commit()
+    conn.close()
+
+    products = _products(2)
+    with CatalogCache(path) as cache:
+        cache.store(products.values(), "US", "en-US")
+        assert {i: e.product for i, e in cache.lookup(products, "US", "en-US").items()} == products
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from comprehensive_game_analysis import BASELINE_SPEC, FINAL_SPEC, build_report_engine
+from incremental_metrics import SUMMARY_COLUMNS, CellAggregator, IncrementalMetrics
+
+
+def _snapshot(n=60, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "product_id": [f"9FIXTURE{i:04d}" for i in range(n)],
+        "Genre": pd.Series(rng.choice(["Action", "RPG", "Puzzle", None], n), dtype="category"),
+        "publisher": pd.Series(rng.choice(["A", "B", None], n), dtype="category"),
+        "has_gamepass_remediation": rng.random(n) < 0.5,
+        "rating_7_days_count": pd.array(rng.integers(0, 50, n), dtype="Int32"),
+        "rating_30_days_count": pd.array(rng.integers(1, 200, n), dtype="Int32"),
+        "rating_alltime_count": pd.array(rng.integers(1, 5000, n), dtype="Int32"),
+        "rating_7_days_avg": rng.uniform(1, 5, n),
+        "rating_30_days_avg": rng.uniform(1, 5, n),
+        "rating_alltime_avg": rng.uniform(1, 5, n),
+        "Release": ["Jan 1, 2024"] * n,
+        "Added": ["Feb 1, 2024"] * n,
+    })
+
+
+def _expected(df, by):
+    return df.groupby(by, observed=True)[SUMMARY_COLUMNS].agg(["count", "mean", "std"])
+
+
+def _assert_matches(metrics, df):
+    for by in ("Genre", "publisher"):
+        got, expected = metrics.group_stats(by), _expected(df, by)
+        # Missing keys don't form a group, like groupby's dropna
+        assert list(got.index) == list(expected.index)
+        for column in expected.columns:
+            np.testing.assert_allclose(got[column].to_numpy(float), expected[column].to_numpy(float),
+                                       rtol=1e-9, atol=1e-9)
+
+
+def test_group_stats_match_a_full_groupby_across_updates(tmp_path):
+    now = pd.Timestamp("2025-01-01")
+    first = _snapshot()
+    metrics = IncrementalMetrics(str(tmp_path))
+    _assert_matches(metrics, metrics.update(first.copy(), now))
+
+    # Next day: some ratings move, one game changes genre, two leave the catalog
+    second = first.copy()
+    second.loc[:9, "rating_7_days_count"] += 5
+    second.loc[10, "Genre"] = "RPG"
+    second = second.drop(index=[20, 21]).reset_index(drop=True)
+
+    metrics = IncrementalMetrics(str(tmp_path))
+    updated = metrics.update(second.copy(), now)
+    assert metrics.last_diff["recomputed"] == 11 and metrics.last_diff["dropped"] == 2
+    _assert_matches(metrics, updated)
+
+
+def test_cell_aggregator_matches_the_engine(tmp_path):
+    now = pd.Timestamp("2025-01-01")
+    metrics = IncrementalMetrics(str(tmp_path))
+    metrics.update(_snapshot(seed=1).assign(title="x"), now)
+
+    # A second day, so the cells were patched rather than built from scratch
+    second = _snapshot(seed=1).assign(title="x")
+    second.loc[:14, "rating_30_days_count"] += 7
+    df = metrics.update(second, now)
+
+    engine = build_report_engine(df)
+    cells = CellAggregator(metrics, engine)
+    for by in ("Genre", ["Genre", "has_gamepass_remediation"], ["publisher", "has_gamepass_remediation"]):
+        for spec in (FINAL_SPEC, BASELINE_SPEC):
+            pd.testing.assert_frame_equal(cells.agg(by, spec), engine.agg(by, spec), rtol=1e-9)
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+from lift_significance import cached_significance, lift_significance
+
+
+def _fixture(shift=0.0, groups=40, n=60, seed=0):
+    """`groups` genres of `n` games; Game Pass games get `shift` added to every metric."""
+    rng = np.random.default_rng(seed)
+    rows = groups * n
+    gp = rng.random(rows) < 0.5
+    df = pd.DataFrame({
+        "Genre": np.repeat([f"Genre {i:02d}" for i in range(groups)], n),
+        "publisher": rng.choice(["A", "B", "C"], rows),
+        "has_gamepass_remediation": gp,
+    })
+    for metric in ("momentum", "discovery_capture", "quality_retention"):
+        df[metric] = rng.normal(1.0, 0.5, rows) + shift * gp
+    return df
+
+
+def test_fixed_seed_is_deterministic():
+    df = _fixture(groups=5)
+    a = lift_significance(df, "Genre", resamples=300, seed=7)
+    b = lift_significance(df, "Genre", resamples=300, seed=7)
+    pd.testing.assert_frame_equal(a, b)
+    assert not a[["ci_low", "ci_high"]].equals(lift_significance(df, "Genre", resamples=300, seed=8)[["ci_low", "ci_high"]])
+
+
+def test_p_values_under_the_null_and_under_a_shift():
+    null = lift_significance(_fixture(), "Genre", metrics=["momentum"], resamples=400)
+    # Roughly uniform across the 40 null genres: mean near 1/2, few "significant" by chance
+    assert 0.35 < null["p_value"].mean() < 0.65
+    assert (null["p_value"] < 0.05).mean() <= 0.15
+
+    shifted = lift_significance(_fixture(shift=1.0), "Genre", metrics=["momentum"], resamples=400)
+    assert (shifted["p_value"] < 0.01).all()
+
+
+def test_means_match_groupby_and_sit_inside_the_ci():
+    df = _fixture(shift=0.2, groups=6)
+    report = lift_significance(df, "Genre", metrics=["momentum"], resamples=500).set_index("group")
+
+    means = df.groupby(["Genre", "has_gamepass_remediation"])["momentum"].mean().unstack()
+    np.testing.assert_allclose(report["gp_mean"], means[True].reindex(report.index))
+    np.testing.assert_allclose(report["paid_mean"], means[False].reindex(report.index))
+
+    lift = (means[True] - means[False]).reindex(report.index)
+    assert ((report["ci_low"] <= lift) & (lift <= report["ci_high"])).all()
+
+
+def test_cached_report_is_recomputed_when_the_input_csv_changes(tmp_path):
+    csv_file = tmp_path / "merged.csv"
+    cache_file = str(tmp_path / "lift_significance.csv")
+    df = _fixture(groups=3, n=20)
+    df.to_csv(csv_file, index=False)
+
+    first, reused = cached_significance(pd.read_csv(csv_file), cache_file, resamples=50)
+    assert not reused
+    again, reused = cached_significance(pd.read_csv(csv_file), cache_file, resamples=50)
+    assert reused
+    pd.testing.assert_frame_equal(again, first, check_dtype=False)
+
+    df.loc[0, "momentum"] += 1
+    df.to_csv(csv_file, index=False)
+    _, reused = cached_significance(pd.read_csv(csv_file), cache_file, resamples=50)
+    assert not reused
+
+    # Different resampling settings don't reuse it either
+    assert not cached_significance(pd.read_csv(csv_file), cache_file, resamples=60)[1]
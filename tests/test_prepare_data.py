@@ -0,0 +1,57 @@
+import json
+
+from fixture_servers import make_catalog_product
+from prepare_data import iter_raw_games, prepare_games_dataset
+
+
+PRODUCTS = [make_catalog_product(f"9FIXTURE{i:04d}", f"Fixture Game {i}", r7=i % 3) for i in range(30)]
+MALFORMED = {"ProductId": "9MALFORMED00", "LocalizedProperties": [], "MarketProperties": []}
+
+
+def _write(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    return path
+
+
+def test_iter_raw_games_reads_arrays_and_products_responses(tmp_path):
+    array = _write(tmp_path / "array.json", PRODUCTS)
+    response = _write(tmp_path / "response.json", {"BigIds": ["x"], "Products": PRODUCTS, "HasMorePages": False})
+    expected = [p["ProductId"] for p in PRODUCTS]
+
+    # Small buffers force values to straddle reads
+    for buffer_size in (7, 64, 1 << 16):
+        assert [g["ProductId"] for g in iter_raw_games(array, buffer_size)] == expected
+        assert [g["ProductId"] for g in iter_raw_games(response, buffer_size)] == expected
+
+
+def test_stream_matches_in_memory_and_skips_malformed_products(tmp_path):
+    path = _write(tmp_path / "response.json", {"Products": PRODUCTS[:10] + [MALFORMED] + PRODUCTS[10:]})
+
+    streamed = prepare_games_dataset(path, stream=True, chunk_size=8)
+    loaded = prepare_games_dataset(path)
+
+    assert sorted(streamed["product_id"]) == sorted(loaded["product_id"]) == sorted(p["ProductId"] for p in PRODUCTS)
+
+
+def test_merged_csv_is_read_from_its_typed_artifact(tmp_path):
+    import pandas as pd
+
+    from prepare_data import convert_dataset, dataset_path, load_dataset
+
+    csv_file = str(tmp_path / "merged.csv")
+    pd.DataFrame({
+        "title": ["A", "B", None],
+        "publisher": ["P", "P", "Q"],
+        "rating_7_days_count": [1, None, 3],
+        "has_gamepass_remediation": [True, False, None],
+    }).to_csv(csv_file, index=False)
+    artifact = csv_file.replace(".csv", ".feather")
+
+    # No artifact yet: both names read the CSV
+    assert dataset_path(csv_file) == csv_file and dataset_path(artifact) == csv_file
+    from_csv = load_dataset(artifact)
+
+    convert_dataset(csv_file)
+    assert dataset_path(csv_file) == artifact
+    pd.testing.assert_frame_equal(load_dataset(csv_file), from_csv)
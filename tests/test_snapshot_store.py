@@ -0,0 +1,61 @@
+import json
+
+import pandas as pd
+
+from fixture_servers import make_catalog_product
+from snapshot_store import SnapshotStore, load_snapshot
+
+GENRES = {"Fixture Game 0": "Shooter", "Fixture Game 1": "Racing", "Fixture Game 2": "Shooter"}
+
+
+def _raw_dump(path, r7):
+    products = [make_catalog_product(f"9FIXTURE{i:04d}", f"Fixture Game {i}", r7=r7) for i in range(3)]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"Products": products}, f)
+    return str(path)
+
+
+def _sheet(path):
+    # Like the master list: a title line above the real header
+    rows = "".join(f"{game},{genre}\n" for game, genre in GENRES.items())
+    path.write_text("Complete Game Pass Master List,\nGame,Genre\n" + rows, encoding="utf-8")
+    return str(path)
+
+
+def test_raw_and_merged_snapshots_share_one_queryable_history(tmp_path):
+    sheet = _sheet(tmp_path / "sheet.csv")
+    raw = load_snapshot(_raw_dump(tmp_path / "xbox_data_20250101_0900.json", r7=10), sheet)
+    assert dict(zip(raw["title"], raw["Genre"])) == GENRES
+
+    # The merged table already has Genre (and a publisher the dump doesn't know)
+    merged_csv = tmp_path / "merged.csv"
+    load_snapshot(_raw_dump(tmp_path / "xbox_data_20250102_0900.json", r7=20), sheet).assign(
+        publisher=["Fixture Publisher", "Other Publisher", "Fixture Publisher"]
+    ).to_csv(merged_csv, index=False)
+    merged = load_snapshot(str(merged_csv))
+
+    store = SnapshotStore(str(tmp_path / "history"))
+    store.append(raw, captured_at="2025-01-01 09:00")
+    store.append(merged, captured_at="2025-01-02 09:00")
+    assert [str(d) for d in store.dates()] == ["2025-01-01", "2025-01-02"]
+
+    by_product = store.history(product_ids="9FIXTURE0001")
+    assert list(by_product["rating_7_days_count"]) == [10, 20]
+
+    # Both captures answer a Genre filter, the raw dump's included
+    shooters = store.history(genres="Shooter")
+    assert sorted(shooters["product_id"].unique()) == ["9FIXTURE0000", "9FIXTURE0002"]
+    assert sorted(str(d) for d in shooters["snapshot_date"].unique()) == ["2025-01-01", "2025-01-02"]
+
+    other = store.history(publishers="Other Publisher")
+    assert list(other["product_id"]) == ["9FIXTURE0001"] and str(other["snapshot_date"][0]) == "2025-01-02"
+
+    first_day = store.history(start="2025-01-01", end="2025-01-01")
+    assert len(first_day) == 3 and (first_day["rating_7_days_count"] == 10).all()
+    assert store.history(start="2025-01-03").empty
+
+
+def test_raw_dump_without_a_sheet_warns_on_append(tmp_path, capsys):
+    raw = load_snapshot(_raw_dump(tmp_path / "xbox_data_20250101_0900.json", r7=10), str(tmp_path / "missing.csv"))
+    SnapshotStore(str(tmp_path / "history")).append(raw, captured_at=pd.Timestamp("2025-01-01"))
+    assert "has no Genre" in capsys.readouterr().out
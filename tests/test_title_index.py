@@ -0,0 +1,43 @@
+import pandas as pd
+
+import title_index
+from title_index import TitleIndex
+
+
+def _old_merge(df, other, right_key):
+    """The plain pd.merge merge_genre_from_csv did before it had an index."""
+    df = df.assign(_merge_key=df["title"].astype(str).str.strip().str.lower())
+    other = other.assign(_merge_key=other[right_key].astype(str).str.strip().str.lower())
+    return df.merge(other, on="_merge_key", how="left", suffixes=(None, "_src")).drop(columns=["_merge_key"])
+
+
+def test_duplicate_sheet_titles_expand_like_the_old_merge(tmp_path):
+    df = pd.DataFrame({
+        "title": ["Halo Infinite", "Forza Horizon 5", "Unknown Game", "halo infinite ", "Dome Keeper"],
+        "publisher": ["Xbox", "Xbox", "Nobody", "Xbox", "Raw Fury"],
+    }, index=[10, 11, 12, 13, 14])
+    sheet = pd.DataFrame({
+        "Game": ["Halo Infinite", "Dome Keeper", "HALO INFINITE", "Forza Horizon 5", "Halo Infinite"],
+        "Genre": ["Shooter", "Strategy", "Action", "Racing", "Shooter"],
+        "publisher": ["343", "Raw Fury", "343", "Playground", "343"],
+    })
+    csv_file = tmp_path / "sheet.csv"
+    sheet.to_csv(csv_file, index=False)
+
+    index = TitleIndex.from_csv(str(csv_file), cache_dir=str(tmp_path / "cache"))
+    got = index.enrich(df)
+
+    expected = _old_merge(df, pd.read_csv(csv_file), "Game")
+    pd.testing.assert_frame_equal(got, expected)
+    assert len(got) == 9  # both Halo rows fan out to three sheet rows each
+
+    # A fresh process reads the pickled index back with the same result
+    title_index._LOADED.clear()
+    again = TitleIndex.from_csv(str(csv_file), cache_dir=str(tmp_path / "cache"))
+    pd.testing.assert_frame_equal(again.enrich(df, columns=["Genre"]), expected.drop(columns=["Game", "publisher_src"]))
+
+
+def test_empty_sheet_leaves_every_row_unmatched():
+    index = TitleIndex.build(pd.DataFrame({"Game": [], "Genre": []}), "Game")
+    got = index.enrich(pd.DataFrame({"title": ["A", "B"]}))
+    assert list(got["title"]) == ["A", "B"] and got["Genre"].isna().all()
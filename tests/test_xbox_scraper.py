@@ -0,0 +1,177 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("patchright")
+from patchright.async_api import async_playwright
+from patchright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from fixture_servers import SearchFixtureServer
+from scrape_store import ERROR, FOUND, NOT_FOUND, ScrapeStore
+from xbox_scraper import HostRateLimiter, _resolve_one, extract_store_link, resolve_product_ids
+
+
+SEARCH_FIXTURE = {
+    "Mortal Kombat 1": ["https://www.xbox.com/en-us/games/store/mortal-kombat-1/9N7271QN4SGB?utm=ddg"],
+    "Bratz Rhythm and Style": [
+        "https://example.com/bratz-review",
+        "https://www.xbox.com/en-us/games/store/bratz-rhythm-style/9P76MMJG50DS",
+    ],
+    "Dome Keeper": ["https://www.xbox.com/en-us/games/store/dome-keeper/9P8XKV2D5DZ5/"],
+    "Unreleased Thing": [],
+    "Slow Page": None,
+}
+
+
+class FakePage:
+    """Stands in for a Playwright page: renders `links`, or times out when they are None."""
+
+    def __init__(self, links):
+        self.links = links
+        self.visited = []
+
+    async def goto(self, url, wait_until=None):
+        self.visited.append(url)
+
+    async def wait_for_selector(self, selector, timeout=None):
+        if self.links is None:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded.")
+
+    async def eval_on_selector_all(self, selector, script):
+        return self.links
+
+
+def _resolve(links, title="Some Game"):
+    limiter = HostRateLimiter(min_interval=0, jitter=0)
+    return asyncio.run(_resolve_one(FakePage(links), title, "http://search.test/?q={query}", limiter, "x", 10))
+
+
+# ----------------------------------------------------------------------------
+# Without a browser
+# ----------------------------------------------------------------------------
+
+def test_extract_store_link_strips_tracking_and_skips_other_links():
+    links = SEARCH_FIXTURE["Bratz Rhythm and Style"]
+    assert extract_store_link(links) == (links[1], "9P76MMJG50DS")
+    assert extract_store_link(SEARCH_FIXTURE["Mortal Kombat 1"])[1] == "9N7271QN4SGB"
+    assert extract_store_link([]) == ("Not Found", "N/A")
+
+
+def test_found_and_not_found_rows():
+    found = _resolve(SEARCH_FIXTURE["Dome Keeper"], "Dome Keeper")
+    missing = _resolve([], "Unreleased Thing")
+
+    assert found["ProductID"] == "9P8XKV2D5DZ5"
+    assert missing == {"Game": "Unreleased Thing", "MS_Store_Link": "Not Found", "ProductID": "N/A"}
+
+
+def test_timeout_is_recorded_as_a_retryable_error(tmp_path):
+    row = _resolve(None, "Slow Page")
+    assert row["MS_Store_Link"] == "Error"
+
+    with ScrapeStore(str(tmp_path / "scrape.db")) as store:
+        store.add_titles(["Slow Page", "Unreleased Thing"])
+        store.record(row)
+        store.record(_resolve([], "Unreleased Thing"))
+
+        assert store.summary() == {ERROR: 1, NOT_FOUND: 1}
+        # The timed-out title comes back until it runs out of retries
+        assert store.pending(max_retries=3) == ["Slow Page"]
+        assert store.pending(max_retries=1) == []
+
+
+def test_rate_limiter_spaces_requests_per_host():
+    async def run():
+        limiter = HostRateLimiter(min_interval=0.05, jitter=0)
+        loop = asyncio.get_running_loop()
+        times = {}
+
+        async def hit(url):
+            await limiter.wait(url)
+            times.setdefault(url, []).append(loop.time())
+
+        await asyncio.gather(*(hit(f"http://{host}/?q={i}") for i in range(4) for host in ("a.test", "b.test")))
+        return times
+
+    times = asyncio.run(run())
+    for host in ("a.test", "b.test"):
+        hits = sorted(t for url, ts in times.items() if host in url for t in ts)
+        assert len(hits) == 4
+        assert all(b - a >= 0.045 for a, b in zip(hits, hits[1:]))
+    # Hosts don't wait on each other
+    first = {host: min(t for url, ts in times.items() if host in url for t in ts) for host in ("a.test", "b.test")}
+    assert abs(first["a.test"] - first["b.test"]) < 0.04
+
+
+# ----------------------------------------------------------------------------
+# Against the fixture server with a real browser
+# ----------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def browser_available():
+    async def probe():
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            await browser.close()
+
+    try:
+        asyncio.run(probe())
+    except Exception as e:
+        pytest.skip(f"Chromium is not available: {e}")
+
+
+def _run(server, titles, concurrency=2, min_interval=0.0, timeout_ms=3_000, on_result=None):
+    return asyncio.run(resolve_product_ids(
+        titles,
+        concurrency=concurrency,
+        search_url=server.search_url,
+        limiter=HostRateLimiter(min_interval=min_interval, jitter=0),
+        timeout_ms=timeout_ms,
+        on_result=on_result,
+    ))
+
+
+def test_resolves_rows_in_input_order(browser_available):
+    titles = ["Mortal Kombat 1", "Bratz: Rhythm & Style", "Dome Keeper", "Unreleased Thing"]
+
+    with SearchFixtureServer(SEARCH_FIXTURE) as server:
+        rows = _run(server, titles)
+
+    assert [r["Game"] for r in rows] == titles
+    assert [r["ProductID"] for r in rows] == ["9N7271QN4SGB", "9P76MMJG50DS", "9P8XKV2D5DZ5", "N/A"]
+    assert rows[3]["MS_Store_Link"] == "Not Found"
+
+
+def test_concurrency_limits_requests_in_flight(browser_available):
+    titles = list(SEARCH_FIXTURE)[:4] * 2
+
+    with SearchFixtureServer(SEARCH_FIXTURE, render_delay=0, response_delay=0.3) as server:
+        _run(server, titles, concurrency=2)
+
+    assert len(server.requests) == len(titles)
+    assert server.max_in_flight == 2
+
+
+def test_per_host_rate_limit(browser_available):
+    with SearchFixtureServer(SEARCH_FIXTURE, render_delay=0) as server:
+        _run(server, list(SEARCH_FIXTURE)[:4], concurrency=4, min_interval=0.25)
+
+    arrivals = sorted(server.arrivals)
+    assert len(arrivals) == 4
+    assert all(b - a >= 0.2 for a, b in zip(arrivals, arrivals[1:]))
+
+
+def test_timed_out_page_is_retried_from_the_store(browser_available, tmp_path):
+    titles = ["Dome Keeper", "Slow Page"]
+
+    with SearchFixtureServer(SEARCH_FIXTURE) as server, ScrapeStore(str(tmp_path / "scrape.db")) as store:
+        store.add_titles(titles)
+        rows = _run(server, store.pending(), timeout_ms=1_000, on_result=store.record)
+        assert rows[1]["MS_Store_Link"] == "Error"
+        assert store.summary() == {FOUND: 1, ERROR: 1}
+
+        # The next run only asks for the timed-out title again
+        server.results["Slow Page xbox store links"] = SEARCH_FIXTURE["Dome Keeper"]
+        assert store.pending() == ["Slow Page"]
+        _run(server, store.pending(), on_result=store.record)
+        assert store.summary() == {FOUND: 2}
@@ -0,0 +1,154 @@
+import hashlib
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# NORMALIZED TITLE INDEX FOR METADATA ENRICHMENT
+# ============================================================================
+
+CACHE_DIR = os.path.join(".cache", "title_index")
+
+# Bumped whenever the pickled index layout changes, so old cache files are ignored
+INDEX_VERSION = 2
+
+# In-process memo so repeated enrichments in one run skip even the unpickle
+_LOADED = {}
+
+
+def normalize_titles(values):
+    """Strip and lowercase titles the same way the exact-match merge always has."""
+    return pd.Index(values).astype(str).str.strip().str.lower()
+
+
+def _file_sha1(path, block_size=1 << 20):
+    """Content hash used to confirm a cache entry when only the mtime moved."""
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+class TitleIndex:
+    """Hash index from normalized title to the rows of a metadata CSV.
+
+    Built once per source file and cached on disk, keyed by the file's mtime,
+    size and content hash. Lookups categorize the incoming titles first, so
+    each distinct title is normalized and probed once no matter how many rows
+    carry it. A title listed more than once in the sheet maps to all its rows,
+    like the plain merge it replaces.
+    """
+
+    def __init__(self, keys, frame, right_key, order, starts, sizes):
+        self.keys = keys
+        self.frame = frame
+        self.right_key = right_key
+        # Rows of `frame` grouped by key: key i owns order[starts[i]:starts[i] + sizes[i]]
+        self.order = order
+        self.starts = starts
+        self.sizes = sizes
+
+    @classmethod
+    def build(cls, other, right_key):
+        """Index `other` on its normalized `right_key`, keeping every row of duplicate titles in sheet order."""
+        codes, keys = pd.factorize(normalize_titles(other[right_key]))
+        order = np.argsort(codes, kind='stable')
+        sizes = np.bincount(codes, minlength=len(keys))
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        return cls(keys, other.reset_index(drop=True), right_key, order, starts, sizes)
+
+    @classmethod
+    def from_csv(cls, csv_file, right_key_candidates=('Game', 'title', 'Title'), cache_dir=CACHE_DIR, **read_csv_kwargs):
+        """Load the index for `csv_file`, rebuilding it only when the file changed.
+
+        Returns None if the CSV has none of `right_key_candidates`.
+        """
+        path = os.path.abspath(csv_file)
+        stat = os.stat(path)
+        options = repr((tuple(right_key_candidates), sorted(read_csv_kwargs.items())))
+        memo_key = (path, options)
+
+        cached = _LOADED.get(memo_key)
+        if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+            return cached['index']
+
+        tag = hashlib.sha1(f"{path}|{options}|{INDEX_VERSION}".encode()).hexdigest()[:12]
+        cache_file = os.path.join(cache_dir, f"{os.path.basename(path)}.{tag}.pkl")
+
+        entry = None
+        if os.path.exists(cache_file):
+            with open(cache_file, 'rb') as f:
+                entry = pickle.load(f)
+            if entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+                # Touched but maybe not edited: trust the content hash
+                if entry['sha1'] == _file_sha1(path):
+                    entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                    cls._write_cache(cache_file, entry)
+                else:
+                    entry = None
+
+        if entry is None:
+            other = pd.read_csv(path, **read_csv_kwargs)
+            right_key = next((k for k in right_key_candidates if k in other.columns), None)
+            if right_key is None:
+                print(f"→ No suitable title column found in {csv_file}. Columns: {list(other.columns)[:10]}")
+                return None
+
+            entry = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha1': _file_sha1(path),
+                'index': cls.build(other, right_key),
+            }
+            cls._write_cache(cache_file, entry)
+
+        _LOADED[memo_key] = entry
+        return entry['index']
+
+    @staticmethod
+    def _write_cache(cache_file, entry):
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp = cache_file + '.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+
+    def lookup(self, titles):
+        """Key number in the index for each title, or -1 when it has no match."""
+        cat = pd.Categorical(titles)
+        hits = self.keys.get_indexer(normalize_titles(cat.categories))
+        codes = cat.codes
+        return np.where(codes >= 0, hits[codes], -1)
+
+    def enrich(self, df, left_key='title', columns=None):
+        """Left-join the indexed columns onto `df` by normalized title.
+
+        `columns` projects the sheet down to just the fields needed (e.g.
+        Genre/Added/Release/ESRB); None brings every column across. Names that
+        already exist in `df` get a `_src` suffix, and a title with several
+        sheet rows comes back once per row, like the old merge did.
+        """
+        if columns is None:
+            columns = list(self.frame.columns)
+        else:
+            columns = [c for c in columns if c in self.frame.columns]
+
+        hits = self.lookup(df[left_key])
+        repeats = np.ones(len(df), dtype=np.int64)
+        repeats[hits >= 0] = self.sizes[hits[hits >= 0]]
+        left = np.repeat(np.arange(len(df)), repeats)
+
+        # Offset of each output row within its title's group, then the sheet row it points at
+        within = np.arange(len(left)) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+        hit = hits[left]
+        positions = np.full(len(left), -1, dtype=np.int64)
+        matched = hit >= 0
+        positions[matched] = self.order[self.starts[hit[matched]] + within[matched]]
+
+        projected = self.frame[columns].reindex(positions).reset_index(drop=True)
+        projected.columns = [f"{c}_src" if c in df.columns else c for c in columns]
+
+        return pd.concat([df.iloc[left].reset_index(drop=True), projected], axis=1)
@@ -0,0 +1,130 @@
+import re
+
+import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz, process
+
+# ============================================================================
+# FUZZY TITLE MATCHING: API TITLES -> GOOGLE SHEET TITLES
+# ============================================================================
+
+def clean_for_match(text):
+    """Strips symbols like ® and ™ to allow exact matching."""
+    if not text or pd.isna(text):
+        return ""
+    text = str(text).lower()
+    # Remove symbols and punctuation
+    text = re.sub(r'[^a-z0-9\s]', '', text)
+    return " ".join(text.split()).strip()
+
+
+def _ngrams(text, n):
+    """Character n-grams of each space-padded token."""
+    grams = set()
+    for token in text.split():
+        padded = f" {token} "
+        grams.update(padded[i:i + n] for i in range(max(len(padded) - n + 1, 1)))
+    return grams
+
+
+class TitleMatcher:
+    """Inverted n-gram index over cleaned choice titles with a batched scorer.
+
+    Instead of scoring every unmatched title against the whole choice list,
+    each query only scores the choices it shares the most n-grams with, plus
+    any choice whose n-grams it fully contains (those are the ones
+    token_set_ratio treats as subsets and scores 100). Scores and tie-breaks
+    follow `process.extractOne(..., scorer=fuzz.token_set_ratio)`: highest
+    score wins, earliest choice on ties, rounded score compared to the
+    threshold.
+    """
+
+    def __init__(self, choices, ngram=3, max_candidates=64):
+        self.choices = list(choices)
+        self.ngram = ngram
+        self.max_candidates = max_candidates
+
+        self._exact = {}
+        postings = {}
+        gram_counts = np.zeros(len(self.choices), dtype=np.int64)
+        for i, choice in enumerate(self.choices):
+            self._exact.setdefault(choice, i)
+            grams = _ngrams(choice, ngram)
+            gram_counts[i] = len(grams)
+            for g in grams:
+                postings.setdefault(g, []).append(i)
+
+        self._postings = {g: np.array(ids, dtype=np.int64) for g, ids in postings.items()}
+        self._gram_counts = gram_counts
+
+    def candidates(self, query):
+        """Choice ids worth scoring for `query`, in original choice order."""
+        lists = [self._postings[g] for g in _ngrams(query, self.ngram) if g in self._postings]
+        if not lists:
+            # Nothing shared at all: fall back to the full list so recall matches brute force
+            return np.arange(len(self.choices))
+
+        shared = np.bincount(np.concatenate(lists), minlength=len(self.choices))
+        hit = np.flatnonzero(shared)
+        # Most shared grams first, earliest choice first among equals
+        top = hit[np.argsort(-shared[hit], kind='stable')[:self.max_candidates]]
+        contained = hit[shared[hit] == self._gram_counts[hit]]
+        return np.union1d(top, contained)
+
+    def score(self, queries, candidate_lists):
+        """Score every (query, candidate) pair in one batched call.
+
+        Returns the best choice id and its score for each query (-1 / 0.0 when
+        it had no candidates).
+        """
+        lengths = np.array([len(c) for c in candidate_lists], dtype=np.int64)
+        best_id = np.full(len(queries), -1, dtype=np.int64)
+        best_score = np.zeros(len(queries), dtype=np.float64)
+        if lengths.sum() == 0:
+            return best_id, best_score
+
+        owner = np.repeat(np.arange(len(queries)), lengths)
+        choice_ids = np.concatenate(candidate_lists).astype(np.int64)
+        left = [queries[i] for i in owner]
+        right = [self.choices[j] for j in choice_ids]
+        scores = process.cpdist(left, right, scorer=fuzz.token_set_ratio, workers=-1).astype(np.float64)
+
+        # Segment max per query, then the first pair hitting it (earliest choice)
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        nonempty = lengths > 0
+        seg_max = np.maximum.reduceat(scores, starts[nonempty])
+        per_pair_max = np.repeat(seg_max, lengths[nonempty])
+        at_max = np.flatnonzero(scores == per_pair_max)
+        owners_at_max, first = np.unique(owner[at_max], return_index=True)
+
+        best_id[owners_at_max] = choice_ids[at_max[first]]
+        best_score[owners_at_max] = scores[at_max[first]]
+        return best_id, best_score
+
+    def match(self, queries, threshold=85):
+        """Map each query to its best choice when the score clears `threshold`.
+
+        Exact matches short-circuit, and repeated queries are scored once.
+        """
+        results = {}
+        pending = []
+        for q in dict.fromkeys(queries):
+            if not q:
+                continue
+            if q in self._exact:
+                results[q] = q
+            else:
+                pending.append(q)
+
+        if pending:
+            best_id, best_score = self.score(pending, [self.candidates(q) for q in pending])
+            for q, i, s in zip(pending, best_id, best_score):
+                if i >= 0 and round(s) >= threshold:
+                    results[q] = self.choices[i]
+
+        return results
+
+
+def find_best_matches(unmatched_list, choices_list, threshold=85):
+    """Finds siblings for titles that failed exact matching."""
+    return TitleMatcher(choices_list).match(unmatched_list, threshold)
@@ -1,682 +1,25 @@
+import importlib
+
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from streamlit_option_menu import option_menu
-import plotly.express as px
-selected = option_menu(
-    menu_title=None,
-    options=["Overview", "Proof of Concept", "Genre Analysis", "Engagement Metrics", "Revenue Impact", "Watch the Series!"],
-    icons=["house", "bar-chart", "pie-chart", "graph-up", "currency-dollar"],
-    orientation="horizontal",
-)
-
-if selected == "Proof of Concept":
-    df = pd.read_csv('gamepass_impact_report.csv')
-    st.title('Xbox Game Pass  _Analysis_ is :blue[MK1 (Mortal Kombat 1)] vs :red[SF6 (Street Fighter 6)]')
-    st.write('This application analyzes the impact of Xbox Game Pass on game performance, focusing on Mortal Kombat 1 and Street Fighter 6. Both games were similar in terms of rating (at least by xbox players all time) when they were released, but MK1 was added to Game Pass a week ago, while SF6 was not. This analysis explores how Game Pass inclusion affects various performance metrics such as player count, engagement, and revenue.')
-    st.dataframe(df)
-    st.markdown("From the data pulled from the microsoft store API there is a clear difference in the games including that MK1 just overall is way more popular than SF6 overall. ")
-    st.write("In order to determine if Game Pass then had an actually statistical impact on the games performance we can look at the discovery momentum of both games. Discovery momentum is a metric that measures how much a game is being discovered and played by new players. A higher discovery momentum indicates that a game is gaining popularity and attracting new players over the past 7 days as a percenatge of the the last month" 
-    " The time frame of a week is important as MK1 was added to game pass a week ago, so we can see if there is a significant difference in discovery momentum between the two games.")
-    latext = r'''
-## Discovery Momentum (%)
-### Full equation 
-$$ 
-\text{Discovery Momentum (\%)}=  \frac{a}{b} \cdot 100
-$$ 
-### Where:
-- $a = \text{The number of votes in the last 7 days}$
-- $b = \text{The number of votes in the last 30 days}$
-'''
-    st.write(latext)
-    
-    sns.set_theme(
-        style="darkgrid",
-        rc={
-            "axes.facecolor": "#0e1117",
-            "figure.facecolor": "#0e1117",
-            "axes.edgecolor": "#9aa0a6",
-            "grid.color": "#2a2f3a",
-            "text.color": "#e8eaed",
-            "axes.labelcolor": "#e8eaed",
-            "xtick.color": "#e8eaed",
-            "ytick.color": "#e8eaed",
-        }
-    )
-    color_map = {
-        "Mortal Kombat™ 1": "#1f77b4",
-        "Street Fighter™ 6": "#d62728"
-    }
-
-    fig, ax = plt.subplots(figsize=(8, 4))
-    sns.barplot(
-        data=df,
-        x="Game Title",
-        y="Discovery Momentum (%)",
-        palette=color_map,
-        ax=ax
-    )
-
-    ax.set_title("Discovery Momentum by Game")
-    ax.set_xlabel("")
-    ax.set_ylabel("Discovery Momentum (%)")
-    plt.xticks(rotation=0)
-    sns.despine(left=True, bottom=True)
-    st.pyplot(fig)
-    st.markdown("Even with this one of the major questions publishers still have is: **Do the players on Game Pass actually stick around for a long time I.E are they players that are of lower quality and only be around this for a short amount of time or do they actually engage with the game over a long period of time?** To answer this we can look at the engagement metrics of both games below.")
-    SF6, MK1 = st.columns(2)
-    SF6.metric("Recent Ratings (7d) for SF6", "1.3", "-60.61%", border=True, help = "Over the past 7days SF6 has seen a significant drop in ratings compared to the current momentum of those in the 30 days.")
-    MK1.metric("Recent Ratings (7d) for Mk1", "2.6", "+4%", border=True, 
-               help="Over the past 7days Mk1 has seen a slight increase in ratings compared to the current momentum of those in the 30 days.")
-    st.markdown("From the engagement metrics above we can see that MK1 has a much higher recent rating compared to SF6. This indicates that players on Game Pass are more engaged with the game and are more likely to leave positive reviews. Althought it is a slight increase it is still a positive trend compared to SF6 which is seeing a significant drop in recent ratings.")
-    st.markdown("Overall they should instead of getting someone to buy into thge game with game pass insetead seek for them to get them into the ecosystem")
-    st.header("Reccomended Actions", divider= True )
-    st.markdown('Since we can see that overall MK1 had a very high amount of current discovery momentum with quality players Nether Realm Studios should focus on trying to make the most of that')
-    st.header('What :blue[MK1] Should Do :sunglasses:')
-    st.markdown('- Provide Discounts on DLCs/other digital related products in order to increase revnue through the new influx of customers ')
-    st.markdown('- Run promotional invasions to new game pass players or an exclusive skin or smth that will unlock after 10+ hours of gameplay to retain players')
-    st.header('What :red[SF6] Should Do 💼')
-    st.markdown('- Right now I think on xbox at least they are losing out to people who view MK1 as Free Alternative SF6 use to do a free weekend of play where anyone could download and try SF6 so maybe it might not be a bad idea to reintroduce that ')
-    st.markdown('- Aditionally it looks like overall the ratings have been trending negativley in product ratings in the Xbox community so consider trying to incentive community events in the new Battle Hub to get others on the game ')
-
-
-elif selected == "Watch the Series!":
-    st.title('Check out the full series in Short Video Format!')
-    st.video("https://www.youtube.com/shorts/oNFDN8k1bpc", format="video/mp4", start_time=0)
-
-elif selected == "Genre Analysis":
-    st.markdown("For the genre analsysis I wanted to see what games worked well in game pass and which genres are not performing the best right now To start off I looked at the ***Momentum score*** I came up with for the POC to quantify the impact of GP would have especially during the Holiday Season")
-    st.write("As a reminder here is the formula for the momentum metric")
-    latext = r'''
-## Discovery Momentum (%)
-
-### Full equation 
-
-$$ 
-\text{Discovery Momentum (\%)} = \frac{a}{b} \cdot 100
-$$ 
-
-### Where:
-- $a$ = The number of votes in the last 7 days
-- $b$ = The number of votes in the last 30 days
-'''
-    st.write(latext)
-    st.markdown("Since the genres are an aggregation of games I used the agg function ijn python to compute summary statistics for each genre here is the code down below")
-    st.code("""
-    Genre_stats = df.groupby('Genre').agg({
-        'momentum': ['median', 'mean', 'std'],
-        'discovery_capture': ['median', 'mean', 'std'],
-        'quality_retention': ['median', 'mean', 'std'],
-        'rating_7_days_count': ['mean', 'std', 'median'],
-        'rating_30_days_count': ['mean', 'std', 'median'],
-        'rating_alltime_count': ['mean', 'std', 'median'],
-        'rating_alltime_avg': ['mean', 'std', 'median'],
-        'rating_30_days_avg': ['mean', 'std', 'median'],
-        'rating_7_days_avg': ['mean', 'std', 'median'],
-        'rating_trend_7d_vs_alltime': ['mean', 'std', 'median'],
-        'title': 'count'  
-    }).round(2)
-    """, language="python")
-    st.markdown("This was used to compute an *aggregate baseline* for the genre level of all of the games inside of the data set The reasoning behind this was to see whether the discovery metrics for each genre were something that was trending upwards in the genre as whole or just on gamepass ")
-    st.markdown("There are several statisitcs that I created in this that I would like to share the definitons of ")
-    latext = r'''
-## Discovery Momentum (%)
-
-### Full equation 
-
-$$ 
-\text{Discovery Momentum (\%)} = \frac{a}{b} \cdot 100
-$$ 
-
-### Where:
-- $a$ = The number of votes in the last 7 days
-- $b$ = The number of votes in the last 30 days
-'''
-    st.write(latext)
-    latext = r'''
-## Discovery Capture(%)
-
-### Full equation 
-
-$$ 
-\text{Discovery Capture(\%)} = \frac{a}{b} \cdot 100
-$$ 
-
-### Where:
-- $a$ = The number of votes in the last 7 days
-- $b$ = The total number of votes all time for the product
-'''
-    st.write(latext)
-    latext = r'''
-## Quality retention
-
-### Full equation 
-
-$$ 
-\text{Quality Retention} = {A} - {B} 
-$$ 
-
-### Where:
-- $A$ = Avg rating in the past 7 days 
-- $B$ = Avg Rating all Time 
-'''
-    st.write(latext)
-    genre_performance = pd.read_csv("Genre_performance.csv")
-    st.dataframe(genre_performance)
-    st.markdown("We are then able to get the following CSV once that happens.")
-    st.markdown('''**Note** Some of these will not have a standard deviation to calculate because they were uniquely only one game"
-    .''')
-    st.markdown("We are able to then use this csv as a basline for all the different Genres that we have data on ")
-    sns.set_theme(style="darkgrid",
-        rc={
-            "axes.facecolor": "#0e1117",
-            "figure.facecolor": "#0e1117",
-            "axes.edgecolor": "#9aa0a6",
-            "grid.color": "#2a2f3a",
-            "text.color": "#e8eaed",
-            "axes.labelcolor": "#e8eaed",
-            "xtick.color": "#e8eaed",
-            "ytick.color": "#e8eaed",
-        }
-    )
-    genre_performance_10 = genre_performance.sort_values(by='game_count', ascending=False).head(10)
-    fig, ax = plt.subplots(figsize=(10, 6))
-
-genre_performance_10 = genre_performance.sort_values(by='game_count', ascending=False).head(10)
 
-
-sns.barplot(data=genre_performance_10, x='Genre', y='game_count', ax=ax, palette="viridis")
-
-ax.set_xticklabels(ax.get_xticklabels(), rotation=45, ha='right')
-ax.set_title('Top 10 Genres by Game Count')
-ax.set_xlabel('Genre')
-ax.set_ylabel('Number of Games')
-
-plt.tight_layout()
-
-
-st.pyplot(fig)
-
-st.markdown("From this we are able to see that overall the games have a very different sample sizes which will become relevant for when we try statistical techniques on the data But by establishing this as a baseline we can now go and create a similar data frame that groups by the games both on Xbox Game Pass and those that are not")
-st.code("""
-    Genre_stats_comparsion = df.groupby('Genre, 'has_gamepass_remediation').agg({
-        'momentum': ['median', 'mean', 'std'],
-        'discovery_capture': ['median', 'mean', 'std'],
-        'quality_retention': ['median', 'mean', 'std'],
-        'rating_7_days_count': ['mean', 'std', 'median'],
-        'rating_30_days_count': ['mean', 'std', 'median'],
-        'rating_alltime_count': ['mean', 'std', 'median'],
-        'rating_alltime_avg': ['mean', 'std', 'median'],
-        'rating_30_days_avg': ['mean', 'std', 'median'],
-        'rating_7_days_avg': ['mean', 'std', 'median'],
-        'rating_trend_7d_vs_alltime': ['mean', 'std', 'median'],
-        'title': 'count'  
-    }).round(2)
-    """, language="python")
-st.write("From this we are able to come out with a similar data frame as the in the data frame above")
-genre_comaprsion = pd.read_csv("Genre_gamepass_comparison_fixed.csv")
-st.dataframe(genre_comaprsion)
-st.write("The major differnece between these data frames is chiefly that one is seperated into groups by whether they are included into game pass vs the other one only contains the Genre perfomance But from this we can then calculate a comaprsion of the ")
-st.code("""
-import numpy as np
-import pandas as pd
-
-genre_gp = pd.read_csv("Genre_gamepass_comparison.csv")   
-genre_all = pd.read_csv("Genre_performance.csv")               
-
-# rename base column and merge
-genre_all_baseline = genre_all[['Genre','momentum_mean', 'discovery_capture_median', 'quality_retention_median']].rename(columns={'momentum_mean':'momentum_genre_baseline', 'discovery_capture_median': 'discovery_capture_baseline', 'quality_retention_median' : 'quality_retention_baseline'})
-merged = genre_gp.merge(genre_all_baseline, on='Genre', how='left')
-
-# differences (row-level: GP True/False rows will get baseline)
-merged['momentum_diff_vs_baseline'] = merged['momentum_mean'] - merged['momentum_genre_baseline']
-merged['momentum_pct_vs_baseline'] = merged['momentum_diff_vs_baseline'] / merged['momentum_genre_baseline'].replace(0,np.nan) * 100
-merged['discovery_capture_diff_vs_baseline'] = merged['discovery_capture_median'] - merged['discovery_capture_baseline']
-merged['quality_retention_vs_baseline'] = merged['quality_retention_median'] - merged['quality_retention_baseline']
-merged['quality_pct_vs_baseline'] = merged['quality_retention_vs_baseline'] / merged['quality_retention_baseline'].replace(0,np.nan) * 100
-
-
-
-        """, language="python")
-st.write("We then create this new data set that has both the Basliens comapred to all of the data on Game Pass")
-Momentum, Quality,Discovery  = st.columns(3)
-Momentum.metric("Percenatge of Game Pass Games that have a positive momentum_mean", value = "89%", border = True)
-Quality.metric("Percentage of Game pass Games that have a positive quality", value = "92%", border = True )
-Discovery.metric("Percentage of Game Pass Games that have a positive discovery capture", value = "87%", border = True)
-st.write("Now even though there was pretty overwelming evidence that the Gamepass Games performed much better overall than the baseline I wanted to confirm that it was statistically signifcant by running a One sided t test against the population (baseline) and Game Pass Games")
-st.markdown("""
-    <style>
-    .main { background-color: #0e1117; }
-    .stMetric { background-color: #1e2129; border-radius: 10px; padding: 15px; border-left: 5px solid #107C10; }
-    </style>
-    """, unsafe_allow_html=True)
-
-st.markdown("### Strategic Intelligence for Publishing Partners")
-st.divider()
-
-# 1. Your Actual Results from the Macro T-Test
-results = [
-    {
-        'Metric': 'Momentum', 
-        'gp': 25.0, 'paid': 0.0, 
-        'p_value': 0.001, 'd': 1.219, 
-        'note': "Essential for mid-sized games to gain trending traction."
-    },
-    {
-        'Metric': 'Discovery Capture', 
-        'gp': 0.1, 'paid': 0.0, 
-        'p_value': 0.0002, 'd': 0.734, 
-        'note': "Provides a guaranteed discovery floor for almost every genre."
-    },
-    {
-        'Metric': 'Quality Retention', 
-        'gp': 0.2, 'paid': 0.0, 
-        'p_value': 0.0002, 'd': 0.136, 
-        'note': "Consistent benefit, but magnitude is smaller for typical titles."
-    }
-]
-
-# 2. Key Executive Summary Metrics
-st.subheader("Key Performance Indicators (Medians)")
-cols = st.columns(len(results))
-
-for i, res in enumerate(results):
-    with cols[i]:
-        # Determine status based on P-Value and Cohen's d
-        is_sig = res['p_value'] < 0.05
-        
-        st.metric(
-            label=f"{res['Metric']}", 
-            value=f"{res['gp']} (GP)", 
-            delta=f"+{res['gp'] - res['paid']} Lift"
-        )
-        
-        # Reliability Badge
-        if is_sig:
-            st.success(f"Reliability: Statistically Significant (p={res['p_value']})")
-        else:
-            st.error(f"Reliability: Inconclusive (p={res['p_value']})")
-            
-        # Cohen's d Interpretation
-        if res['d'] > 0.8:
-            st.warning(f"Impact: Massive Effect (d={res['d']})")
-        elif res['d'] > 0.5:
-            st.info(f"Impact: Large Effect (d={res['d']})")
-        else:
-            st.write(f"Impact: Small Effect (d={res['d']})")
-        
-        st.caption(f"_{res['note']}_")
-
-st.divider()
-
-# 3. The "Pretty" Statistical Explanation for the Interviewer
-with st.expander("📖 Technical Definitions & Methodology (How to read this data)"):
-    st.write("""
-    This analysis uses a **Macro Two-Sample T-Test** comparing the distribution of genre medians between 
-    Game Pass titles and Paid titles.
-    """)
-    
-    col_a, col_b = st.columns(2)
-    with col_a:
-        st.markdown("#### 🔬 P-Value (Significance)")
-        st.write("""
-        The **P-Value** answers: *'Is this boost real or just luck?'* We use a threshold of **0.05**. Since all our median results are below 0.001, we are 
-        **99.9% confident** that Game Pass is the primary driver of this performance shift.
-        """)
-        
-    with col_b:
-        st.markdown("#### 📏 Cohen's d (Effect Size)")
-        st.write("""
-        The **Effect Size** answers: *'How much does it actually matter?'* While P-values prove reliability, Cohen's d measures the **magnitude**.
-        - **1.21 (Momentum)**: This is a transformative shift in player engagement.
-        - **0.13 (Retention)**: Though reliable, the actual retention gain for a typical game is subtle.
-        """)
-
-
-
-# 4. Strategic Recommendation Sidebar
-st.sidebar.image("https://upload.wikimedia.org/wikipedia/commons/f/f9/Xbox_one_logo.svg", width=100)
-st.sidebar.header("Publisher Advisory")
-st.sidebar.info("""
-**Top Recommendation:**
-Focus on the **Momentum** story. For typical publishers, Game Pass isn't just a bonus—it's the difference between 0 traction and a healthy trending state.
-""") 
 st.set_page_config(page_title="Xbox Publishing Strategy", layout="wide")
 
-# Styling for Xbox Branding
-st.markdown("""
-    <style>
-    .main { background-color: #0e1117; }
-    .stMetric { background-color: #1e2129; border-radius: 10px; padding: 20px; border-top: 4px solid #107C10; }
-    h1, h2, h3 { color: #107C10 !important; }
-    </style>
-    """, unsafe_allow_html=True)
-
-# --- HEADER ---
-st.title("🎮 Xbox Game Pass: Ecosystem Impact & Publisher Lift")
-st.markdown("#### Quantitative Analysis of Game Pass Performance vs. Market Baselines")
-
-# --- DATA LOADING (Assuming your 'merged' dataframe is ready) ---
-# Note: In a real app, you'd do: df = pd.read_csv("xbox_final_data.csv")
-# For this example, I'll use your calculated logic.
-merged = pd.read_csv("xbox_final_data.csv")
-gp_genres = merged[merged['has_gamepass_remediation'] == True]
-total_gp_genres = len(gp_genres)
+# Menu label -> page module. A page is only imported (and its tables and
+# figures only built) once it is selected; each module exposes render().
+PAGES = {
+    "Overview": "ui_pages.ecosystem_impact",
+    "Proof of Concept": "ui_pages.proof_of_concept",
+    "Genre Analysis": "ui_pages.genre_analysis",
+    "Publisher Intelligence": "ui_pages.publisher_intelligence",
+    "Watch the Series!": "ui_pages.series",
+}
 
-# Calculate the "Win Rate" for the Lift
-pct_pos_momentum = len(gp_genres[gp_genres['momentum_lift'] >= 0]) / total_gp_genres
-pct_pos_quality = len(gp_genres[gp_genres['quality_lift'] >= 0]) / total_gp_genres
-pct_pos_discovery = len(gp_genres[gp_genres['discovery_lift'] >= 0]) / total_gp_genres
-
-# --- SECTION 1: THE EXECUTIVE WIN RATE ---
-st.subheader("🚀 Genre Win Rate (Game Pass Lift)")
-st.write("Percentage of genres where including a game in Game Pass resulted in a positive performance 'Lift' compared to Paid-only counterparts.")
-
-m_col1, m_col2, m_col3 = st.columns(3)
-
-with m_col1:
-    st.metric(label="Momentum Win Rate", value=f"{pct_pos_momentum:.1%}", delta="Growth Lift")
-    st.caption("Genres where GP games trended faster than Paid.")
-
-with m_col2:
-    st.metric(label="Quality Retention Win Rate", value=f"{pct_pos_quality:.1%}", delta="Engagement Lift")
-    st.caption("Genres where GP players stayed active longer.")
-
-with m_col3:
-    st.metric(label="Discovery Win Rate", value=f"{pct_pos_discovery:.1%}", delta="Visibility Lift")
-    st.caption("Genres where the GP badge drove higher capture.")
-
-st.divider()
-
-# --- SECTION 2: VISUALIZING THE LIFT GAP ---
-st.subheader("📊 Performance Lift by Genre")
-st.write("Direct comparison: How much 'extra' performance does Game Pass provide over the paid baseline per genre?")
-
-# Create a bar chart for Lift
-lift_df = gp_genres[['Genre', 'momentum_lift', 'quality_lift', 'discovery_lift']].melt(id_vars='Genre')
-fig_lift = px.bar(lift_df, 
-             x='Genre', 
-             y='value', 
-             color='variable', 
-             barmode='group',
-             color_discrete_map={'momentum_lift': '#107C10', 'quality_lift': '#FFFFFF', 'discovery_lift': '#525252'},
-             title="Comparative Lift per Genre Category")
-
-fig_lift.update_layout(template="plotly_dark", plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
-st.plotly_chart(fig_lift, use_container_width=True)
-
-# --- SECTION 3: STATISTICAL RIGOR ---
-st.divider()
-col_left, col_right = st.columns(2)
-
-with col_left:
-    st.markdown("### 🧪 Statistical Significance")
-    st.write("""
-    We conducted a **One-Sided T-Test** comparing the Game Pass distribution against the genre population baseline.
-    
-    * **Momentum:** $p < 0.001$ (Highly Significant)
-    * **Quality:** $p < 0.0002$ (Highly Significant)
-    * **Discovery:** $p = 0.32$ (Varies by Genre)
-    """)
-    
-
-with col_right:
-    st.markdown("### 💡 Strategic Recommendation")
-    if pct_pos_momentum > 0.8:
-        st.success("Recommendation: ECOSYSTEM EXPANSION")
-        st.write("The 80%+ win rate across metrics indicates that Game Pass is a 'Rising Tide' ecosystem. Publishers not currently in the ecosystem are statistically likely to leave 20-30% discovery capture on the table.")
-    else:
-        st.info("Recommendation: SELECTIVE ONBOARDING")
-        st.write("Focus on genres with High Cohen's D values to ensure ROI.")
-
-# --- FOOTER ---
-st.sidebar.markdown("### Data Lineage")
-st.sidebar.write("Raw data pulled from Xbox Store API.")
-st.sidebar.write(f"Total Sample Size: {len(merged)} genres")
-st.sidebar.download_button("Download Final Analysis Data", data=merged.to_csv(), file_name="xbox_final_report.csv")
-st.header("🎯 Publisher Opportunity Map")
-st.write("This map identifies which genres receive the most 'Total Value' from Game Pass. The green quadrant represents genres with positive Discovery AND positive Retention lift.")
-
-# 1. Setup the Plot
-plot_df = gp_genres.copy() # Using your filtered Game Pass genres
-fig, ax = plt.subplots(figsize=(12, 8))
-
-# 2. Draw Plot Elements
-# Shading the High Performance Zone
-ax.axvspan(0, plot_df['discovery_lift'].max() * 1.1, 0, plot_df['quality_lift'].max() * 1.1, 
-           color='green', alpha=0.1, label='High Performance Zone')
-
-sns.scatterplot(data=plot_df, x='discovery_lift', y='quality_lift', s=100, color='#107C10', ax=ax)
-
-# Add Labels
-for i in range(plot_df.shape[0]):
-    ax.text(x=plot_df.discovery_lift.iloc[i] + 0.005, 
-            y=plot_df.quality_lift.iloc[i] + 0.005, 
-            s=plot_df.Genre.iloc[i], 
-            fontsize=8, alpha=0.7)
-
-# Baseline lines
-ax.axhline(0, color='white', linestyle='--', linewidth=1, alpha=0.5)
-ax.axvline(0, color='white', linestyle='--', linewidth=1, alpha=0.5)
-
-# Styling for Streamlit (Dark Theme)
-fig.patch.set_facecolor('#0e1117')
-ax.set_facecolor('#0e1117')
-ax.tick_params(colors='white')
-ax.xaxis.label.set_color('white')
-ax.yaxis.label.set_color('white')
-ax.title.set_color('white')
-ax.set_title('Discovery vs. Quality Lift by Genre')
-
-st.pyplot(fig)
-
-# --- SECTION: THE "TOP PERFORMER" LIST ---
-st.divider()
-st.subheader("🌟 Top Recommendations for New Entrants")
-
-# Logic to find the 'Ideal' genres
-top_genres = plot_df[
-    (plot_df['discovery_lift'] > 0) & 
-    (plot_df['quality_lift'] > 0) & 
-    (plot_df['momentum_lift'] > 0)
-].sort_values(by='momentum_lift', ascending=False)
-
-if not top_genres.empty:
-    st.write(f"Based on the analysis, these **{len(top_genres)} genres** meet all criteria for a successful Game Pass launch:")
-    
-    # Display as a clean table or cards
-    for idx, row in top_genres.iterrows():
-        with st.expander(f"⭐ {row['Genre']}"):
-            c1, c2, c3 = st.columns(3)
-            c1.metric("Momentum Boost", f"+{row['momentum_lift']:.1f}")
-            c2.metric("Discovery Lift", f"+{row['discovery_lift']:.2f}")
-            c3.metric("Retention Lift", f"+{row['quality_lift']:.2f}")
-            st.write(f"**Publisher Strategy:** This genre shows high ecosystem synergy. Game Pass acts as a reliable funnel for {row['Genre']} titles.")
-else:
-    st.info("No single genre meets all positive criteria—this suggests a more nuanced, publisher-specific approach is required.")
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import seaborn as sns
-import matplotlib.pyplot as plt
-
-st.set_page_config(page_title="Publisher Ecosystem Intelligence", layout="wide")
-
-st.markdown("""
-    <style>
-    .main { background-color: #0e1117; }
-    .stMetric { 
-        background-color: #1e2129; 
-        border-radius: 10px; 
-        padding: 15px; 
-        border-top: 4px solid #107C10; 
-    }
-    h1, h2, h3 { color: #107C10 !important; }
-    .stTabs [data-baseweb="tab-list"] { gap: 24px; }
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        white-space: pre-wrap;
-        background-color: #1e2129;
-        border-radius: 4px 4px 0px 0px;
-        color: white;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
-
-df = pd.read_csv("publisher_final.csv")
-st.dataframe(df)
-
-
-st.title(" Publisher Strategic Intelligence")
-st.markdown("### Analyzing the 'Game Pass Lift' across the Publishing Ecosystem")
-
-st.sidebar.image("https://upload.wikimedia.org/wikipedia/commons/f/f9/Xbox_one_logo.svg", width=80)
-st.sidebar.header("Filter Intelligence")
-selected_publishers = st.sidebar.multiselect(
-    "Select Specific Publishers", 
-    options=df['publisher'].unique(),
-    default=["Activision", "Electronic Arts", "Bethesda Softworks", "Ubisoft", "Xbox Game Studios"]
+selected = option_menu(
+    menu_title=None,
+    options=list(PAGES),
+    icons=["house", "bar-chart", "pie-chart", "building", "play-btn"],
+    orientation="horizontal",
 )
 
-filtered_df = df[df['publisher'].isin(selected_publishers)]
-gp_only = filtered_df[filtered_df['has_gamepass_remediation'] == True]
-
-col1, col2, col3, col4 = st.columns(4)
-with col1:
-    avg_mom = gp_only['momentum_lift'].mean()
-    st.metric("Avg. Momentum Lift", f"{avg_mom:.1f}%", "Discovery Speed")
-with col2:
-    avg_qual = gp_only['quality_lift'].mean()
-    st.metric("Avg. Quality Retention", f"{avg_qual:.2f}", "Player Satisfaction")
-with col3:
-    avg_disc = gp_only['discovery_lift'].mean()
-    st.metric("Avg. Discovery Capture", f"{avg_disc:.2f}%", "New User Funnel")
-with col4:
-    total_titles = gp_only['title_count'].sum()
-    st.metric("GP Titles Analyzed", int(total_titles))
-
-st.divider()
-
-tab1, tab2, tab3 = st.tabs([" Lift Analysis", " Quality vs. Discovery", " Portfolio Strategy"])
-
-with tab1:
-    st.subheader("Which Publishers Gain the Most from Game Pass?")
-    st.write("This chart compares the 'Lift'—the delta between Game Pass performance and paid baselines—across publishers.")
-    
-    lift_melted = gp_only.melt(
-        id_vars='publisher', 
-        value_vars=['momentum_lift', 'discovery_lift', 'quality_lift'],
-        var_name='Metric Type', 
-        value_name='Lift Value'
-    )
-    
-    fig_lift = px.bar(
-        lift_melted,
-        x='publisher',
-        y='Lift Value',
-        color='Metric Type',
-        barmode='group',
-        color_discrete_map={
-            'momentum_lift': '#107C10',
-            'discovery_lift': '#00A4EF',
-            'quality_lift': '#FFB900'
-        },
-        template="plotly_dark"
-    )
-    st.plotly_chart(fig_lift, use_container_width=True)
-
-with tab2:
-    st.subheader("The 'Free Player' Paradox")
-    st.write("Does more Discovery lead to lower Quality? Stakeholders fear that 'free' players leave bad reviews because they aren't 'invested'.")
-    
-    # FIX: Remove rows where size or axis data is missing
-    plot_data = gp_only.dropna(subset=['discovery_lift', 'quality_lift', 'title_count'])
-    
-    # Alternative FIX: If you prefer to keep the data and just set a default size
-    # plot_data = gp_only.copy()
-    # plot_data['title_count'] = plot_data['title_count'].fillna(1)
-
-    if not plot_data.empty:
-        fig_scatter = px.scatter(
-            plot_data,
-            x='discovery_lift',
-            y='quality_lift',
-            size='title_count',
-            color='publisher',
-            hover_name='publisher',
-            text='publisher',
-            labels={'discovery_lift': 'Discovery Capture Lift', 'quality_lift': 'Quality Retention Lift'},
-            template="plotly_dark",
-            size_max=40
-        )
-        fig_scatter.add_hline(y=0, line_dash="dash", line_color="white", annotation_text="Baseline Quality")
-        
-        st.plotly_chart(fig_scatter, use_container_width=True)
-        st.info("💡 **Insight:** Publishers in the **Top-Right quadrant** are the most successful. They are gaining massive new audiences WITHOUT sacrificing game ratings.")
-    else:
-        st.warning("No data available to display the scatter plot after removing missing values.")
-
-with tab3:
-    st.subheader("Portfolio Volume vs. Performance")
-    col_a, col_b = st.columns([1, 2])
-    
-    with col_a:
-        st.write("""
-        **Stakeholder Question:** *Should we put our whole catalog on Game Pass or just a few key titles?*
-        
-        This analysis looks at the correlation between the number of titles a publisher provides and the average momentum boost they receive.
-        """)
-        
-        corr = gp_only['title_count'].corr(gp_only['momentum_lift'])
-        st.write(f"**Correlation Coefficient:** `{corr:.2f}`")
-        
-    with col_b:
-        fig_vol = px.scatter(
-            gp_only,
-            x='title_count',
-            y='momentum_mean',
-            color='publisher',
-            trendline="ols",
-            template="plotly_dark",
-            title="Does Title Volume Drive Momentum?"
-        )
-        st.plotly_chart(fig_vol, use_container_width=True)
-
-st.divider()
-st.header("🔍 Publisher Scorecard")
-target_pub = st.selectbox("Select a Publisher for a detailed audit:", df['publisher'].unique())
-
-pub_data = df[df['publisher'] == target_pub]
-
-latest_mom = pub_data['momentum_mean'].iloc[0]
-fig_gauge = go.Figure(go.Indicator(
-    mode = "gauge+number",
-    value = latest_mom,
-    domain = {'x': [0, 1], 'y': [0, 1]},
-    title = {'text': "Current Momentum Score"},
-    gauge = {
-        'axis': {'range': [None, 100], 'tickcolor': "white"},
-        'bar': {'color': "#107C10"},
-        'steps': [
-            {'range': [0, 20], 'color': "#333"},
-            {'range': [20, 50], 'color': "#555"}
-        ],
-        'threshold': {
-            'line': {'color': "red", 'width': 4},
-            'thickness': 0.75,
-            'value': pub_data['momentum_mean_baseline'].iloc[0] if 'momentum_mean_baseline' in pub_data else 50
-        }
-    }
-))
-fig_gauge.update_layout(paper_bgcolor='rgba(0,0,0,0)', font={'color': "white"})
-st.plotly_chart(fig_gauge)
-
-st.write(f"Showing raw data for **{target_pub}**:")
-st.dataframe(pub_data.style.highlight_max(axis=0, color='#107C10'))
-
-st.sidebar.divider()
-st.sidebar.caption("Data Source: MS Store API Internal Aggregate")
-st.sidebar.button("Generate Executive PDF Report")
\ No newline at end of file
+importlib.import_module(PAGES[selected]).render()
@@ -0,0 +1,229 @@
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+import dashboard_data as dashboard
+from plot_sampling import MAX_POINTS, thin_figure
+
+
+# Figures are built once per (file version, selection) and reused on reruns,
+# so switching tabs or going back to an earlier selection skips Plotly
+# (and the OLS trendline fit) entirely. Scatters are thinned server-side
+# (plot_sampling) before they are sent, within the zoom window if one is set.
+
+@st.cache_resource(show_spinner=False)
+def _lift_figure(version, publishers):
+    fig_lift = px.bar(
+        dashboard.publisher_view(publishers)['lift_melted'],
+        x='publisher',
+        y='Lift Value',
+        color='Metric Type',
+        barmode='group',
+        color_discrete_map={
+            'momentum_lift': '#107C10',
+            'discovery_lift': '#00A4EF',
+            'quality_lift': '#FFB900'
+        },
+        template="plotly_dark"
+    )
+    return fig_lift
+
+
+@st.cache_resource(show_spinner=False)
+def _quality_figure(version, publishers, x_range=None, y_range=None):
+    fig_scatter = px.scatter(
+        dashboard.publisher_view(publishers)['scatter'],
+        x='discovery_lift',
+        y='quality_lift',
+        size='title_count',
+        color='publisher',
+        hover_name='publisher',
+        text='publisher',
+        labels={'discovery_lift': 'Discovery Capture Lift', 'quality_lift': 'Quality Retention Lift'},
+        template="plotly_dark",
+        size_max=40
+    )
+    fig_scatter.add_hline(y=0, line_dash="dash", line_color="white", annotation_text="Baseline Quality")
+    return thin_figure(fig_scatter, x_range=x_range, y_range=y_range)
+
+
+@st.cache_resource(show_spinner=False)
+def _volume_figure(version, publishers, x_range=None, y_range=None):
+    fig_vol = px.scatter(
+        dashboard.publisher_view(publishers)['gp_only'],
+        x='title_count',
+        y='momentum_mean',
+        color='publisher',
+        trendline="ols",
+        template="plotly_dark",
+        title="Does Title Volume Drive Momentum?"
+    )
+    # The trendline is fit on every point; only the markers are thinned
+    return thin_figure(fig_vol, x_range=x_range, y_range=y_range)
+
+
+def _zoom_window(frame, x, y, key):
+    """x / y range sliders for a scatter too large to send whole; (None, None) otherwise."""
+    if len(frame) <= MAX_POINTS:
+        return None, None
+    ranges = []
+    for col in (x, y):
+        values = frame[col].dropna().astype(float)
+        if values.empty:
+            ranges.append(None)
+            continue
+        lo, hi = float(values.min()), float(values.max())
+        ranges.append(st.slider(f"Zoom: {col}", min_value=lo, max_value=hi, value=(lo, hi), key=f"{key}_{col}"))
+    return tuple(ranges)
+
+
+def _plot_thinned(figure):
+    fig, drawn, total = figure
+    st.plotly_chart(fig, use_container_width=True)
+    if drawn < total:
+        st.caption(f"Showing {drawn:,} of {total:,} points; shading shows where the rest are. Narrow the zoom range for full detail.")
+
+
+@st.cache_resource(show_spinner=False)
+def _gauge_figure(version, publisher):
+    pub_data = dashboard.publisher_scorecard(publisher)
+    latest_mom = pub_data['momentum_mean'].iloc[0]
+    fig_gauge = go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = latest_mom,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Current Momentum Score"},
+        gauge = {
+            'axis': {'range': [None, 100], 'tickcolor': "white"},
+            'bar': {'color': "#107C10"},
+            'steps': [
+                {'range': [0, 20], 'color': "#333"},
+                {'range': [20, 50], 'color': "#555"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': pub_data['momentum_mean_baseline'].iloc[0] if 'momentum_mean_baseline' in pub_data else 50
+            }
+        }
+    ))
+    fig_gauge.update_layout(paper_bgcolor='rgba(0,0,0,0)', font={'color': "white"})
+    return fig_gauge
+
+
+def render():
+    st.markdown("""
+    <style>
+    .main { background-color: #0e1117; }
+    .stMetric { 
+        background-color: #1e2129; 
+        border-radius: 10px; 
+        padding: 15px; 
+        border-top: 4px solid #107C10; 
+    }
+    h1, h2, h3 { color: #107C10 !important; }
+    .stTabs [data-baseweb="tab-list"] { gap: 24px; }
+    .stTabs [data-baseweb="tab"] {
+        height: 50px;
+        white-space: pre-wrap;
+        background-color: #1e2129;
+        border-radius: 4px 4px 0px 0px;
+        color: white;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+
+    df = dashboard.publisher_lift()
+    st.dataframe(df)
+
+
+    st.title(" Publisher Strategic Intelligence")
+    st.markdown("### Analyzing the 'Game Pass Lift' across the Publishing Ecosystem")
+
+    st.sidebar.image("https://upload.wikimedia.org/wikipedia/commons/f/f9/Xbox_one_logo.svg", width=80)
+    st.sidebar.header("Filter Intelligence")
+    selected_publishers = st.sidebar.multiselect(
+        "Select Specific Publishers", 
+        options=dashboard.publisher_options(),
+        default=["Activision", "Electronic Arts", "Bethesda Softworks", "Ubisoft", "Xbox Game Studios"]
+    )
+
+    version = dashboard.file_version(dashboard.PUBLISHER_LIFT)
+    publishers = tuple(selected_publishers)
+    view = dashboard.publisher_view(publishers)
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        avg_mom = view['avg_momentum_lift']
+        st.metric("Avg. Momentum Lift", f"{avg_mom:.1f}%", "Discovery Speed")
+    with col2:
+        avg_qual = view['avg_quality_lift']
+        st.metric("Avg. Quality Retention", f"{avg_qual:.2f}", "Player Satisfaction")
+    with col3:
+        avg_disc = view['avg_discovery_lift']
+        st.metric("Avg. Discovery Capture", f"{avg_disc:.2f}%", "New User Funnel")
+    with col4:
+        total_titles = view['total_titles']
+        st.metric("GP Titles Analyzed", int(total_titles))
+
+    st.divider()
+
+    tab1, tab2, tab3 = st.tabs([" Lift Analysis", " Quality vs. Discovery", " Portfolio Strategy"])
+
+    with tab1:
+        st.subheader("Which Publishers Gain the Most from Game Pass?")
+        st.write("This chart compares the 'Lift'—the delta between Game Pass performance and paid baselines—across publishers.")
+    
+        st.plotly_chart(_lift_figure(version, publishers), use_container_width=True)
+
+    with tab2:
+        st.subheader("The 'Free Player' Paradox")
+        st.write("Does more Discovery lead to lower Quality? Stakeholders fear that 'free' players leave bad reviews because they aren't 'invested'.")
+    
+        # FIX: Remove rows where size or axis data is missing
+        plot_data = view['scatter']
+    
+        # Alternative FIX: If you prefer to keep the data and just set a default size
+        # plot_data = gp_only.copy()
+        # plot_data['title_count'] = plot_data['title_count'].fillna(1)
+
+        if not plot_data.empty:
+            x_range, y_range = _zoom_window(plot_data, 'discovery_lift', 'quality_lift', key='quality')
+            _plot_thinned(_quality_figure(version, publishers, x_range, y_range))
+            st.info("💡 **Insight:** Publishers in the **Top-Right quadrant** are the most successful. They are gaining massive new audiences WITHOUT sacrificing game ratings.")
+        else:
+            st.warning("No data available to display the scatter plot after removing missing values.")
+
+    with tab3:
+        st.subheader("Portfolio Volume vs. Performance")
+        col_a, col_b = st.columns([1, 2])
+    
+        with col_a:
+            st.write("""
+        **Stakeholder Question:** *Should we put our whole catalog on Game Pass or just a few key titles?*
+        
+        This analysis looks at the correlation between the number of titles a publisher provides and the average momentum boost they receive.
+        """)
+        
+            corr = view['volume_corr']
+            st.write(f"**Correlation Coefficient:** `{corr:.2f}`")
+        
+        with col_b:
+            x_range, y_range = _zoom_window(view['gp_only'], 'title_count', 'momentum_mean', key='volume')
+            _plot_thinned(_volume_figure(version, publishers, x_range, y_range))
+
+    st.divider()
+    st.header("🔍 Publisher Scorecard")
+    target_pub = st.selectbox("Select a Publisher for a detailed audit:", dashboard.publisher_options())
+
+    pub_data = dashboard.publisher_scorecard(target_pub)
+
+    st.plotly_chart(_gauge_figure(version, target_pub))
+
+    st.write(f"Showing raw data for **{target_pub}**:")
+    st.dataframe(pub_data.style.highlight_max(axis=0, color='#107C10'))
+
+    st.sidebar.divider()
+    st.sidebar.caption("Data Source: MS Store API Internal Aggregate")
+    st.sidebar.button("Generate Executive PDF Report")
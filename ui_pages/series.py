@@ -0,0 +1,7 @@
+import streamlit as st
+
+
+def render():
+    st.title('Check out the full series in Short Video Format!')
+    st.video("https://www.youtube.com/shorts/oNFDN8k1bpc", format="video/mp4", start_time=0)
+
@@ -0,0 +1,178 @@
+import argparse
+import asyncio
+import random
+import re
+import time
+from urllib.parse import quote_plus, urlsplit
+
+import pandas as pd
+from patchright.async_api import async_playwright
+from patchright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from scrape_store import ScrapeStore
+
+# ============================================================================
+# CONCURRENT XBOX STORE PRODUCT-ID RESOLVER
+# ============================================================================
+
+SEARCH_URL = "https://duckduckgo.com/?q={query}+xbox+store+links"
+STORE_LINK_PATTERN = "xbox.com/en-us/games/store/"
+
+# Either a result card or DuckDuckGo's "no results" block means the page is ready
+RESULTS_SELECTOR = '[data-testid="result"], [data-testid="no-results-message"]'
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+
+def clean_game_name(name):
+    """Refines the game title for better search engine matching."""
+    clean = name.replace("&", "and")
+    clean = re.sub(r'[^a-zA-Z0-9\s]', ' ', clean)
+    return " ".join(clean.split())
+
+
+def extract_store_link(links):
+    """Return (store_link, product_id) for the first Xbox store link with a 12-char ID."""
+    for link in links:
+        if STORE_LINK_PATTERN in link:
+            # Clean tracking parameters before ID extraction
+            clean_link = link.split('?')[0].rstrip('/')
+            match = re.search(r"([a-zA-Z0-9]{12})$", clean_link)
+            if match:
+                return link, match.group(1)
+    return "Not Found", "N/A"
+
+
+class HostRateLimiter:
+    """Spaces out requests to each host by `min_interval` (+ random jitter) seconds.
+
+    Workers reserve their slot under a per-host lock and then sleep outside
+    it, so a pool of pages shares one request budget per search engine.
+    """
+
+    def __init__(self, min_interval=1.5, jitter=0.5):
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self._next_slot = {}
+        self._locks = {}
+
+    async def wait(self, url):
+        host = urlsplit(url).hostname
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        loop = asyncio.get_running_loop()
+
+        async with lock:
+            now = loop.time()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval + random.uniform(0, self.jitter)
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def _resolve_one(page, game_name, search_url, limiter, results_selector, timeout_ms):
+    """Search for one title on an already-open page and pull its store link."""
+    url = search_url.format(query=quote_plus(clean_game_name(game_name)))
+    await limiter.wait(url)
+    await page.goto(url, wait_until="domcontentloaded")
+
+    # Event-driven wait: returns as soon as results render instead of a fixed sleep.
+    # A page that never rendered is an error (retried), not a genuine "Not Found".
+    try:
+        await page.wait_for_selector(results_selector, timeout=timeout_ms)
+    except PlaywrightTimeoutError:
+        print(f"Timed out waiting for results on {game_name}")
+        return {"Game": game_name, "MS_Store_Link": "Error", "ProductID": "N/A"}
+
+    links = await page.eval_on_selector_all("a", "elements => elements.map(e => e.href)")
+    store_link, product_id = extract_store_link(links)
+    return {"Game": game_name, "MS_Store_Link": store_link, "ProductID": product_id}
+
+
+async def resolve_product_ids(titles, concurrency=4, search_url=SEARCH_URL, limiter=None,
+                              results_selector=RESULTS_SELECTOR, timeout_ms=10_000,
+                              headless=True, on_result=None):
+    """Resolve store links/ProductIDs for `titles` with a pool of browser contexts.
+
+    One browser is launched with `concurrency` isolated contexts, each working
+    through a shared queue. Requests to each host go through `limiter`
+    (a HostRateLimiter), and `on_result(row)` is called as each title
+    finishes. Returns rows in the same order as `titles`.
+    """
+    limiter = limiter or HostRateLimiter()
+    queue = asyncio.Queue()
+    for i, title in enumerate(titles):
+        queue.put_nowait((i, title))
+    results = [None] * len(titles)
+
+    async def worker(context):
+        page = await context.new_page()
+        while True:
+            try:
+                i, game_name = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                row = await _resolve_one(page, game_name, search_url, limiter, results_selector, timeout_ms)
+            except Exception as e:
+                print(f"Error on {game_name}: {e}")
+                row = {"Game": game_name, "MS_Store_Link": "Error", "ProductID": "N/A"}
+            results[i] = row
+            if on_result is not None:
+                on_result(row)
+            print(f"[{i + 1}/{len(titles)}] {game_name} -> {row['ProductID']}")
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        contexts = [await browser.new_context(user_agent=USER_AGENT) for _ in range(max(1, concurrency))]
+        try:
+            await asyncio.gather(*(worker(c) for c in contexts))
+        finally:
+            for c in contexts:
+                await c.close()
+            await browser.close()
+
+    return results
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resolve Xbox store ProductIDs for the Game Pass master list.")
+    parser.add_argument("--input", default="GamePass_Games.csv")
+    parser.add_argument("--output", default="xbox_batch_results.csv")
+    parser.add_argument("--db", default="xbox_scrape.db", help="Resumable SQLite result store")
+    parser.add_argument("--import-legacy", nargs="*", default=[], help="Seed the store from old progress CSVs")
+    parser.add_argument("--max-retries", type=int, default=3, help="Retry errored titles up to this many times")
+    parser.add_argument("--concurrency", type=int, default=4, help="Number of browser contexts")
+    parser.add_argument("--min-interval", type=float, default=1.5, help="Seconds between requests to one host")
+    parser.add_argument("--search-url", default=SEARCH_URL, help="Search URL template with a {query} placeholder")
+    parser.add_argument("--headed", action="store_true", help="Show the browser windows")
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.input, header=1)
+    df = df[df["Status"].isin(["Active", "Leaving Soon"])]
+
+    with ScrapeStore(args.db) as store:
+        for legacy in args.import_legacy:
+            print(f"→ Imported {store.import_csv(legacy)} rows from {legacy}")
+        store.add_titles(df["Game"].dropna())
+
+        todo = store.pending(args.max_retries)
+        print(f"→ {len(todo)} titles left to resolve ({store.summary()})")
+
+        start = time.perf_counter()
+        if todo:
+            asyncio.run(resolve_product_ids(
+                todo,
+                concurrency=args.concurrency,
+                search_url=args.search_url,
+                limiter=HostRateLimiter(args.min_interval),
+                headless=not args.headed,
+                on_result=store.record,
+            ))
+
+        store.export_csv(args.output)
+        print(f"\n✓ Done in {time.perf_counter() - start:.0f}s: {store.summary()} -> {args.output}")